@@ -0,0 +1,88 @@
+"""
+search.py
+
+Measures the throughput of the search CPU policy: rollouts per second, time per decision, how often
+the search tree is reused and how often its transposition table finds a node, playing seeded all-CPU
+games headless.
+
+Run from the game directory:
+    python -m benchmarks.search --decisions 200 --budget-ms 50 --workers 2
+"""
+
+import argparse
+import contextlib
+import os
+import time
+
+from classes.engine.GameEngine import GameEngine
+from classes.engine.SearchPolicy import SearchPolicy
+from classes.engine.simulation import simulation_config
+from config.config import Config
+
+
+def benchmark(decisions: int, budget_ms: int, workers: int, players: int, seed: int) -> dict[str, float]:
+    """
+    Plays games with the search policy in every seat until it has made a number of decisions
+
+    Args:
+        decisions (int): number of decisions to time
+        budget_ms (int): search time for each decision
+        workers (int): worker processes searching alongside this one
+        players (int): number of seats
+        seed (int): seed of the first game, later games use the following seeds
+    Returns:
+        dict[str, float]: the measured throughput
+    """
+    config = simulation_config(Config(), players)
+    policy = SearchPolicy(budget_ms, workers, config.search_exploration, config.search_rollout_turns,
+                          config.search_prior_visits, config.cpu_memory_decay)
+    reused = 0
+    hits = lookups = 0
+    decision_times = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        while len(decision_times) < decisions:
+            engine = GameEngine.from_seed(config, seed)
+            policy.watch(engine)
+            seed += 1
+            while not engine.player_has_won() and len(decision_times) < decisions:
+                start = time.perf_counter()
+                index = policy.choose_chit(engine, engine.rng)
+                decision_times.append(time.perf_counter() - start)
+                if index is None:
+                    engine.pass_turn()
+                else:
+                    engine.play_chit(index)
+            reused += policy.search.reused
+            table = policy.search.table
+            hits += table.hits
+            lookups += table.hits + table.misses
+    return {
+        "decisions": len(decision_times),
+        "rollouts": policy.rollouts,
+        "rollouts_per_second": policy.rollouts_per_second(),
+        "mean_decision_ms": sum(decision_times) / len(decision_times) * 1000,
+        "max_decision_ms": max(decision_times) * 1000,
+        "tree_reuse": reused / len(decision_times),
+        "table_hit_rate": hits / lookups if lookups else 0.0
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the throughput of the search CPU policy")
+    parser.add_argument("--decisions", type=int, default=200, help="number of decisions to time")
+    parser.add_argument("--budget-ms", type=int, default=50, help="search time for each decision")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes searching alongside this one")
+    parser.add_argument("--players", type=int, default=4, choices=[2, 3, 4], help="number of seats")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    args = parser.parse_args()
+
+    result = benchmark(args.decisions, args.budget_ms, args.workers, args.players, args.seed)
+    print(f"decisions: {result['decisions']}, rollouts: {result['rollouts']}")
+    print(f"rollouts per second: {result['rollouts_per_second']:.0f}")
+    print(f"decision time: {result['mean_decision_ms']:.1f}ms mean, {result['max_decision_ms']:.1f}ms max")
+    print(f"searches reusing the tree: {result['tree_reuse']:.1%}")
+    print(f"transposition table hit rate: {result['table_hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+soak.py
+
+Runs the board draw loop headless for many frames, playing turns as it goes, and checks that
+memory use, sprite counts and per-frame time stay flat over the session.
+
+Run from the game directory:
+    python -m benchmarks.soak --frames 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from classes.concrete.board.Board import Board
+from config.config import Config
+
+
+def new_board(config: Config) -> Board:
+    board = Board(config.window_width_px, config.window_height_px, config)
+    # Resolve flipped chits on the next frame instead of waiting in real time
+    board.card_flip_timer.duration = 0
+    return board
+
+
+def play_frame(board: Board, frame: int) -> None:
+    """Clicks an unflipped chit every few frames, so turns, moves and flips are exercised
+    """
+    if frame % 5 or board.card_flip_timer.active:
+        return
+    for card in board.chit_sprite_group:
+        if not card.get_flipped():
+            board.handle_click(card.rect.center)
+            return
+
+
+def soak(frames: int, window: int, memory_limit: int, time_ratio: float) -> bool:
+    """
+    Runs the soak and reports the first and last windows of frames
+
+    Args:
+        frames (int): number of frames to draw
+        window (int): number of frames averaged at the start and end of the run
+        memory_limit (int): allowed growth in traced memory, in bytes
+        time_ratio (float): allowed ratio between the final and initial mean frame time
+    Returns:
+        bool: whether memory and frame time stayed flat
+    """
+    pygame.init()
+    config = Config()
+    config.set_players(config.number_of_players)
+    # only the draw loop is being measured, so keep the disk out of it
+    config.autosave_every_turns = 0
+    config.record_replays = False
+    screen = pygame.display.set_mode((config.window_width_px, config.window_height_px))
+    board = new_board(config)
+    sprite_count = len(board.render_group)
+
+    frame_times = []
+    tracemalloc.start()
+    start_memory = None
+    for frame in range(frames):
+        if board.player_has_won():
+            board = new_board(config)
+        play_frame(board, frame)
+        start = time.perf_counter()
+        board.draw(screen)
+        frame_times.append(time.perf_counter() - start)
+        if frame == window:
+            start_memory = tracemalloc.get_traced_memory()[0]
+    end_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Skip the first frames, which decode images and do a full repaint
+    first = sum(frame_times[window:2 * window]) / window
+    last = sum(frame_times[-window:]) / window
+    memory_growth = end_memory - start_memory
+
+    print(f"frames: {frames}")
+    print(f"sprites: {sprite_count} -> {len(board.render_group)}")
+    print(f"mean frame time: {first * 1000:.3f}ms -> {last * 1000:.3f}ms")
+    print(f"traced memory growth: {memory_growth / 1024:.1f}KiB")
+
+    flat = True
+    if len(board.render_group) != sprite_count:
+        print("FAIL: sprite count changed")
+        flat = False
+    if memory_growth > memory_limit:
+        print("FAIL: memory grew")
+        flat = False
+    # Allow a small absolute slack, idle frames are too fast to compare by ratio alone
+    if last > first * time_ratio + 0.0005:
+        print("FAIL: frame time grew")
+        flat = False
+    return flat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless soak test of the board draw loop")
+    parser.add_argument("--frames", type=int, default=5000, help="number of frames to draw")
+    parser.add_argument("--window", type=int, default=500, help="frames averaged at the start and end")
+    parser.add_argument("--memory-limit", type=int, default=512 * 1024, help="allowed memory growth in bytes")
+    parser.add_argument("--time-ratio", type=float, default=1.5, help="allowed frame time growth ratio")
+    args = parser.parse_args()
+    sys.exit(0 if soak(args.frames, args.window, args.memory_limit, args.time_ratio) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""
+suite.py
+
+Times the board's main operations headless: loading images at startup, building the board, drawing frames,
+handling clicks, moving tokens, looking up the nearest cave, and saving and loading games. Results are printed as a table and can
+be written as JSON, to compare against later runs. Given the JSON of an earlier run as a baseline, the
+suite fails when any operation's median time has grown by more than a threshold.
+
+Run from the game directory:
+    python -m benchmarks.suite --json results.json
+    python -m benchmarks.suite --baseline results.json --threshold 0.25
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from itertools import cycle
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from classes.concrete.board.Board import Board
+from classes.utils import file_io
+from classes.utils.asset_cache import asset_cache
+from config.config import Config
+
+# Version of the JSON results, increased when its format changes
+RESULTS_VERSION = 1
+
+
+def measure(function: Callable[[], None], repeat: int, number: int = 1,
+            setup: Callable[[], None] | None = None) -> list[float]:
+    """
+    Times a function, with the garbage collector paused as timeit does
+
+    Args:
+        function (Callable[[], None]): the function to time
+        repeat (int): number of samples
+        number (int): calls timed together in each sample, for functions too fast to time one call at a time
+        setup (Callable[[], None] | None): called untimed before each sample
+    Returns:
+        list[float]: the time of one call in each sample, in seconds
+    """
+    # one untimed call, so caches and lazily built state are warm
+    if setup is not None:
+        setup()
+    function()
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """
+    Args:
+        samples (list[float]): times of one call, in seconds
+    Returns:
+        dict[str, float]: the number of samples and the median, mean, 95th percentile and minimum, in microseconds
+    """
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "median_us": statistics.median(ordered) * 1e6,
+        "mean_us": statistics.fmean(ordered) * 1e6,
+        "p95_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e6,
+        "min_us": ordered[0] * 1e6
+    }
+
+
+def benchmark_config(seed: int) -> Config:
+    """
+    Returns:
+        Config: a seeded game of human players, so clicks flip chits and no CPU turns are played,
+            that neither autosaves nor records replays
+    """
+    config = Config()
+    config.set_players(config.number_of_players)
+    config.seed = seed
+    config.autosave_every_turns = 0
+    config.record_replays = False
+    config.set_load_save(False)
+    return config
+
+
+def new_board(config: Config) -> Board:
+    return Board(config.window_width_px, config.window_height_px, config)
+
+
+def bench_board_init(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    return measure(lambda: new_board(config), repeat)
+
+
+def bench_draw(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Frames where nothing has changed, the usual frame while a player decides what to flip
+    """
+    board = new_board(config)
+    board.draw(screen)
+    return measure(lambda: board.draw(screen), repeat)
+
+
+def bench_draw_full(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Frames that repaint the whole window, as after a popup closes
+    """
+    board = new_board(config)
+
+    def setup() -> None:
+        board.full_redraw = True
+    return measure(lambda: board.draw(screen), repeat, setup=setup)
+
+
+def bench_handle_click(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Clicks that flip a chit, the card is turned back over before each click
+    """
+    board = new_board(config)
+    board.draw(screen)
+    position = board.chit_cards[0].card.rect.center
+
+    def setup() -> None:
+        if board.last_flipped_chit:
+            board.last_flipped_chit.reset_card()
+        board.card_flip_timer.deactivate()
+    return measure(lambda: board.handle_click(position), repeat, setup=setup)
+
+
+def bench_move_token(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Moves out of the starting cave, the game is put back before each move
+    """
+    board = new_board(config)
+    engine = board.engine
+    start = engine.snapshot()
+    token = engine.current_player.token
+
+    def setup() -> None:
+        engine.restore(start)
+    return measure(lambda: token.move_token(3), repeat, setup=setup)
+
+
+def bench_nearest_cave(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Lookups from every tile of the track in turn, as REVERSE chits do
+    """
+    board = new_board(config)
+    track = board.engine.track
+    tiles = cycle(track.nodes[:track.length])
+    return measure(lambda: next(tiles).nearest_cave(), repeat, number=1000)
+
+
+def bench_save(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Full saves from pressing the save button, until they are on disk
+    """
+    board = new_board(config)
+
+    def save() -> None:
+        board.save()
+        board.autosaver.pending.result()
+    return measure(save, repeat)
+
+
+def bench_load_save(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Loads of the latest save file into a board with the same layout, as when resuming a game
+    """
+    board = new_board(config)
+    board.save()
+    board.autosaver.pending.result()
+    board.config.set_load_save(True)
+    try:
+        return measure(board.load_save, repeat)
+    finally:
+        board.config.set_load_save(False)
+
+
+def bench_load_atlas(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Startup with the texture atlas, from an empty cache
+    """
+    try:
+        return measure(lambda: asset_cache.load_atlas(config.texture_atlas), repeat, setup=asset_cache.clear)
+    finally:
+        asset_cache.clear()
+
+
+def bench_warm_up(config: Config, screen: pygame.Surface, repeat: int) -> list[float]:
+    """Startup decoding every image, as without the texture atlas, from an empty cache
+    """
+    try:
+        return measure(asset_cache.warm_up, repeat, setup=asset_cache.clear)
+    finally:
+        asset_cache.clear()
+
+
+# name -> (benchmark, default number of samples)
+BENCHMARKS: dict[str, tuple[Callable[[Config, pygame.Surface, int], list[float]], int]] = {
+    "Board.__init__": (bench_board_init, 20),
+    "Board.draw": (bench_draw, 500),
+    "Board.draw (full)": (bench_draw_full, 100),
+    "Board.handle_click": (bench_handle_click, 500),
+    "Token.move_token": (bench_move_token, 2000),
+    "Position.nearest_cave": (bench_nearest_cave, 200),
+    "Board.save": (bench_save, 30),
+    "Board.load_save": (bench_load_save, 100),
+    "AssetCache.load_atlas": (bench_load_atlas, 20),
+    "AssetCache.warm_up": (bench_warm_up, 5)
+}
+
+
+def run_suite(names: list[str], seed: int, repeat_scale: float) -> dict:
+    """
+    Runs benchmarks in a temporary directory, so saves do not touch the player's save files
+
+    Args:
+        names (list[str]): names of the benchmarks to run, from BENCHMARKS
+        seed (int): seed of the game every benchmark plays
+        repeat_scale (float): multiplies the number of samples of every benchmark
+    Returns:
+        dict: the results document, with the summary of each benchmark by name
+    """
+    pygame.init()
+    config = benchmark_config(seed)
+    screen = pygame.display.set_mode((config.window_width_px, config.window_height_px))
+    results = {}
+    saved_cwd = file_io.CWD
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        file_io.CWD = directory
+        try:
+            for name in names:
+                benchmark, repeat = BENCHMARKS[name]
+                # the board prints its seed and moves, which would get in the way of the table
+                with contextlib.redirect_stdout(devnull):
+                    samples = benchmark(config, screen, max(1, round(repeat * repeat_scale)))
+                results[name] = summarize(samples)
+        finally:
+            file_io.CWD = saved_cwd
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results
+    }
+
+
+def format_time(microseconds: float) -> str:
+    if microseconds >= 1000:
+        return f"{microseconds / 1000:.2f}ms"
+    if microseconds < 1:
+        return f"{microseconds:.3f}us"
+    return f"{microseconds:.2f}us"
+
+
+def format_table(document: dict, baseline: dict | None = None) -> str:
+    """
+    Args:
+        document (dict): results from run_suite
+        baseline (dict | None): earlier results, adds the change in each median from them
+    Returns:
+        str: the results as a text table
+    """
+    header = ["benchmark", "median", "mean", "p95", "min", "runs"]
+    if baseline:
+        header += ["baseline", "change"]
+    rows = [header]
+    for name, result in document["results"].items():
+        row = [name] + [format_time(result[key]) for key in ("median_us", "mean_us", "p95_us", "min_us")]
+        row.append(str(result["runs"]))
+        if baseline:
+            previous = baseline["results"].get(name)
+            if previous:
+                row += [format_time(previous["median_us"]),
+                        f"{result['median_us'] / previous['median_us'] - 1:+.1%}"]
+            else:
+                row += ["-", "-"]
+        rows.append(row)
+    widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+    lines = []
+    for i, row in enumerate(rows):
+        lines.append("  ".join(cell.ljust(width) if column == 0 else cell.rjust(width)
+                               for column, (cell, width) in enumerate(zip(row, widths))))
+        if i == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def regressions(document: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compares results to a baseline. Benchmarks missing from either are not compared.
+
+    Args:
+        document (dict): results from run_suite
+        baseline (dict): earlier results
+        threshold (float): allowed growth of a median, 0.25 allows 25% slower
+    Returns:
+        list[str]: a description of each benchmark whose median grew by more than the threshold
+    """
+    found = []
+    for name, result in document["results"].items():
+        previous = baseline["results"].get(name)
+        if previous and result["median_us"] > previous["median_us"] * (1 + threshold):
+            found.append(f"{name}: {format_time(previous['median_us'])} -> {format_time(result['median_us'])}")
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the board's main operations headless")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), metavar="NAME",
+                        help="benchmarks to run, all of them by default")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the game every benchmark plays")
+    parser.add_argument("--repeat-scale", type=float, default=1.0, help="multiplies the number of samples")
+    parser.add_argument("--json", help="file to write the results to")
+    parser.add_argument("--baseline", help="results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed growth of a median over the baseline, 0.25 allows 25%% slower")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    document = run_suite(args.only or list(BENCHMARKS), args.seed, args.repeat_scale)
+    print(format_table(document, baseline))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+    if baseline:
+        found = regressions(document, baseline, args.threshold)
+        if found:
+            print(f"FAIL: slower than the baseline by more than {args.threshold:.0%}")
+            print("\n".join(found))
+            sys.exit(1)
+        print(f"OK: no benchmark slower than the baseline by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
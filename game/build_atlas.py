@@ -0,0 +1,85 @@
+"""
+build_atlas.py
+
+Builds the texture atlas loaded at startup, see classes.utils.atlas. A board is built headless to find
+the images it draws and the sizes it draws them at, and those images are packed into one sheet.
+Run it again whenever an image under imgs/ or the size of a sprite changes.
+
+Run from the game directory:
+    python build_atlas.py
+    python build_atlas.py --check
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from classes.concrete.board.Board import Board
+from classes.utils.asset_cache import asset_cache
+from classes.utils.atlas import build_atlas, read_index, stale_images, with_siblings
+from classes.utils.image_packager import resource_path
+from config.config import Config
+
+
+def board_images(config: Config) -> list[tuple]:
+    """
+    Builds a board and collects the images it scaled
+
+    Args:
+        config (Config): the game configuration, which sets the window and sprite sizes
+    Returns:
+        list[tuple]: the (path, size, alpha) of every scaled image the board asked for
+    """
+    asset_cache.clear()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        Board(config.window_width_px, config.window_height_px, config)
+    return [key for key in asset_cache.entries() if key[1] is not None]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the texture atlas loaded at startup")
+    parser.add_argument("--output", default=Config.texture_atlas, help="path of the atlas sheet")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that the atlas exists and its images have not changed")
+    args = parser.parse_args()
+    sheet_path = resource_path(args.output)
+
+    if args.check:
+        index = read_index(sheet_path)
+        if index is None:
+            print(f"FAIL: no atlas at {args.output}")
+            sys.exit(1)
+        stale = stale_images(index)
+        if stale:
+            print("FAIL: images changed since the atlas was built, run build_atlas.py")
+            print("\n".join(stale))
+            sys.exit(1)
+        print(f"OK: {len(index['images'])} images are up to date")
+        return
+
+    pygame.init()
+    config = Config()
+    config.set_players(config.number_of_players)
+    config.autosave_every_turns = 0
+    config.record_replays = False
+    config.set_load_save(False)
+    pygame.display.set_mode((config.window_width_px, config.window_height_px))
+
+    keys = with_siblings(board_images(config))
+    # the atlas is built from the images as the game scales them, so sprites look the same with or without it
+    surfaces = {key: asset_cache.get_image(*key) for key in keys}
+    index = build_atlas(surfaces, sheet_path)
+    width, height = index["sheet_size"]
+    print(f"packed {len(index['images'])} images from "
+          f"{len({image['path'] for image in index['images']})} files into a {width}x{height} sheet")
+    print(f"wrote {args.output} ({os.path.getsize(sheet_path) / 1024:.0f}KiB)")
+
+
+if __name__ == "__main__":
+    main()
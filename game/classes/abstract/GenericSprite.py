@@ -1,7 +1,8 @@
 """
 Class GenericSprite
 
-GenericSprite is an abstract class that represents a sprite on the board. It is a subclass of pygame.sprite.Sprite.
+GenericSprite is an abstract class that represents a sprite on the board. It is a subclass of pygame.sprite.DirtySprite,
+so it is only redrawn by the board's LayeredDirty group when its dirty flag is set.
 """
 
 from abc import ABC, abstractmethod
@@ -9,7 +10,7 @@ from abc import ABC, abstractmethod
 import pygame
 
 
-class GenericSprite(pygame.sprite.Sprite):
+class GenericSprite(pygame.sprite.DirtySprite):
 
     def __init__(self, coords: tuple[int, int], groups: list[pygame.sprite.Group]):
         super().__init__(groups)
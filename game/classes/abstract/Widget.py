@@ -0,0 +1,39 @@
+"""
+Class Widget
+
+A persistent UI element drawn by the board or display manager. Widgets are created once and keep
+their rendered image until their content changes, rather than being rebuilt every frame.
+"""
+
+import pygame
+
+from classes.abstract.GenericSprite import GenericSprite
+
+
+class Widget(GenericSprite):
+    def __init__(self, coords: tuple[int, int], groups: list[pygame.sprite.Group], anchor: str = "topleft"):
+        super().__init__(coords, groups)
+        # Which point of the widget's rect is placed at coords, e.g. "topleft" or "center"
+        self.anchor = anchor
+        self.image = pygame.Surface((0, 0))
+        self.rect = self.image.get_rect(**{self.anchor: self.coords})
+
+    def set_image(self, image: pygame.Surface) -> None:
+        """Replaces the image of the widget and marks it to be redrawn
+
+        Args:
+            image (pygame.Surface): the new image
+        """
+        self.image = image
+        self.rect = image.get_rect(**{self.anchor: self.coords})
+        self.dirty = 1
+
+    def contains(self, mouse_pos: tuple[int, int]) -> bool:
+        """Checks if a point lies inside the widget
+
+        Args:
+            mouse_pos (tuple[int, int]): the position of the mouse click
+        Returns:
+            bool: whether the point is inside the widget
+        """
+        return bool(self.visible) and self.rect.collidepoint(mouse_pos)
@@ -12,6 +12,8 @@ from classes.actions.ChitCards.CPUClickedCard import CPUClickedCard
 
 class ChitCardInvoker:
     def __init__(self, card):
+        # The card the commands are invoked on
+        self.card = card
         # Initially set to None, to ensure proper configuration before use
         self._draw_action = DrawCard(card)
         self._reset_action = ResetCard(card)
@@ -49,9 +51,12 @@ class ChitCardInvoker:
         Invokes the card_clicked() method on ChitCard.py by invoking it through the CardClicked.py command object
         :return: bool
         """
-        if mouse_pos and not cpu:
+        if cpu:
+            # CPU players pick cards directly, there is no mouse position to check
+            return self._cpu_card_clicked.execute()
+        elif mouse_pos:
             self._card_clicked.set_mouse_coords(mouse_pos)
-        elif not mouse_pos and not cpu:
+        else:
             raise ValueError("Mouse position required for human player")
         
         return self._card_clicked.execute()
@@ -70,10 +75,11 @@ class ChitCardInvoker:
         """
         return self._get_card_animal.execute()
 
-    def save(self):
-        self._save_action.execute()
+    def save(self) -> dict:
+        return self._save_action.execute()
 
     def load(self, card):
+        self.card = card
         self._draw_action = DrawCard(card)
         self._reset_action = ResetCard(card)
         self._get_destination = CalculateCard(card)
@@ -7,6 +7,6 @@ class SaveCard(ActionCapable):
         # Inject ChitCard.py dependency through constructor
         self.card = card
 
-    def execute(self) -> int:
-        # Calculate the intended destination of the flipped card
+    def execute(self) -> dict:
+        # Get the state of the card for a save file
         return self.card.save()
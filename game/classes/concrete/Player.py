@@ -2,12 +2,11 @@
 Class Player
 """
 
-from classes.concrete.board.Token import Token
-from classes.utils.file_io import write
+from classes.engine.TokenState import TokenState
 
 
 class Player:
-    def __init__(self, player_number: int, colour: str, token: Token, human: bool):
+    def __init__(self, player_number: int, colour: str, token: TokenState, human: bool):
         self.player_number = player_number
         self.token = token
         self.colour = colour
@@ -22,24 +21,30 @@ class Player:
         self.is_player_turn = False
         self.token.token_finish()
 
-    def save(self) -> None:
+    def save(self) -> dict:
         """
-        saves the current state of the player to a save file
+        gets the current state of the player for a save file
         """
         player = {
             "player_num": self.player_number,
             "total_moves": self.token.total_moves,
-            "current_player": self.is_player_turn
+            "current_player": self.is_player_turn,
+            "position": self.token.position.ordinal
         }
 
-        write("Players", player)
+        return player
 
     def load(self, save: dict) -> None:
         """
         loads the saved state of player
         """
         distance_moved = save["total_moves"]
-        position_at = self.token.position.find_position(distance_moved)
+        if save.get("position") is not None:
+            # the token is placed where it was saved, which also covers moves made by REVERSE chits
+            position_at = self.token.position.track.node(save["position"])
+        else:
+            # older saves only have the distance moved from the starting cave
+            position_at = self.token.position.find_position(distance_moved)
         self.token.place_token(distance_moved, position_at)
 
         if save["current_player"]:
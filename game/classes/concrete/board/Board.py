@@ -2,21 +2,30 @@
 Class Board
 """
 import math
-import random
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pygame
-from random import randrange, choice
 
-from classes.abstract.GenericSprite import GenericSprite
+from classes.abstract.Widget import Widget
 from classes.concrete.board.Cave import Cave
 from classes.concrete.board.Tile import Tile
 from classes.concrete.board.VolcanoCard import VolcanoCard
 from classes.concrete.Player import Player
 from classes.concrete.board.Token import Token
+from classes.concrete.rendering.Button import Button
+from classes.concrete.rendering.Label import Label
+from classes.engine.GameEngine import GameEngine
+from classes.engine.policies import create_policy
+from classes.engine.layout import generate_layout
 from classes.enum.Animal import Animal
 from classes.enum.Colour import Colour
-from classes.utils.file_io import load_file, delete_save, write
-from classes.utils.image_packager import resource_path
+from classes.utils.asset_cache import asset_cache
+from classes.utils.autosave import Autosaver
+from classes.utils.file_io import load_latest_save, prune_replays, replay_path
+from classes.utils.hit_index import HitIndex
+from classes.utils.profiler import frame_profiler
+from classes.utils.replay import ReplayRecorder
+from classes.utils.rng import check_seed, game_rng, new_seed
 from classes.utils.timer import Timer
 from config.config import Config
 
@@ -25,6 +34,9 @@ from classes.abstract.ChitCard import ChitCard
 from classes.concrete.board.StandardCard import StandardCard
 from classes.concrete.board.ReverseCard import ReverseCard
 
+# CPU players choose their chits on this thread, so the game loop keeps handling events while they think
+cpu_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cpu-turn")
+
 
 class Board:
     def __init__(self, width: int, height: int, config: Config) -> None:
@@ -41,6 +53,9 @@ class Board:
         # parameters for chit pool
         self.grid = 5
         self.offset = 4.1
+        # finds what was clicked, the cells line up with the chit pool so each chit fills one cell
+        card_size = self.config.load_config('card_size')
+        self.hit_index = HitIndex(card_size, ((self.offset - 0.5) * card_size, (self.offset - 0.5) * card_size))
 
         # sprite groups
         self.tile_sprite_group = pygame.sprite.Group()
@@ -48,19 +63,32 @@ class Board:
         self.token_sprite_group = pygame.sprite.Group()
         self.chit_sprite_group = pygame.sprite.Group()
         self.ui_sprite_group = pygame.sprite.Group()
-
-        # tracked board components
-        self.volcano_cards = self.generate_volcano_cards()
-        self.caves = self.generate_caves()
-        self.chit_cards = self.generate_chit_cards()
-        self.connect_board()
-        self.players = self.generate_players()
-        self.current_player = self.players[1]
-        self.current_player.player_turn()
+        # layered group that only redraws sprites whose dirty flag is set
+        self.render_group = pygame.sprite.LayeredDirty()
+
+        # tracked board components, the sprites are handed to the engine which plays the game
+        # when resuming, the board is built straight from the saved layout instead of a random one
+        save = load_latest_save(self.config.save_format) if self.config.get_load_save() else {}
+        seed = check_seed(self.config.seed) if self.config.seed is not None else new_seed()
+        rng = game_rng(seed)
+        layout = save if save else generate_layout(self.config, rng)
+        self.volcano_cards = self.generate_volcano_cards(layout["VolcanoCards"])
+        self.caves = self.generate_caves(layout["VolcanoCards"])
+        self.chit_cards = self.generate_chit_cards(layout["ChitCards"])
+        self.engine = GameEngine(self.volcano_cards, self.caves, [chit.card for chit in self.chit_cards],
+                                 self.generate_players(), self.config.number_of_players, seed, rng)
         self.last_flipped_chit = None
+        # decides which chits CPU players flip
+        self.cpu_policy = create_policy(self.config.cpu_policy, self.config)
 
         # timers
-        self.card_flip_timer = Timer(1500, self.card_flipped)
+        self.card_flip_timer = Timer(self.config.card_flip_delay_ms, self.card_flipped)
+        self.cpu_turn_timer = Timer(self.config.cpu_think_delay_ms, self.start_non_human_turn)
+        self.save_message_timer = Timer(self.config.save_message_ms, self.hide_save_message)
+        # chit being chosen by a CPU player on the worker thread
+        self.cpu_decision: Future | None = None
+        # save being written on the autosave thread, its message is shown once it is on disk or has failed
+        self.save_result: Future | None = None
 
         # font
         self.font = pygame.font.Font(None, 36)
@@ -74,21 +102,73 @@ class Board:
         button_text = self.font.render('Memory Score', True, 'white')
         self.button_surface.blit(button_text, button_text.get_rect(bottomleft=(0, 25)))
 
-        self.previous_turn = self.current_player
-        self.max_score = [0, self.current_player]  # init for player
-        self.num_flips = 0
+        # UI widgets, created once and only re-rendered when their contents change
+        self.memory_button = Button((self.button_x, self.button_y), [self.ui_sprite_group], self.button_surface)
+        self.save_button = Button((780, 780), [self.ui_sprite_group],
+                                  asset_cache.get_image("imgs/save.png", (80, 80)), anchor="bottomright")
+        # display current player
+        self.turn_label = Label((0, 0), [self.ui_sprite_group], self.font, background='black',
+                                min_size=(300, 80), padding=(25, 25))
+        # display animal of current position
+        self.animal_label = Label((550, 30), [self.ui_sprite_group], self.font, 'token is on')
+        self.animal_icon = Widget((730, 40), [self.ui_sprite_group], anchor="center")
+        self.animal_icon_key = None
+        # shown for a moment after saving
+        self.save_label = Label((630, 670), [self.ui_sprite_group], self.font, "Game saved!")
+        self.save_label.visible = 0
+
+        # static parts of the board, used to clear areas behind moved sprites
+        self.background = self.render_background()
+        # the whole surface is drawn on the first frame and after anything draws over the board
+        self.full_redraw = True
 
         # load saved game
-        self.load_save()
+        self.load_save(save)
+        print(f"Game seed: {self.engine.seed}")
+        self.build_render_group()
+        self.build_hit_index()
+
+        # saves are written in the background, after every few turns and when the save button is pressed
+        self.autosaver = Autosaver(self.config.autosave_every_turns, self.config.journal_compact_every,
+                                   self.config.save_format, self.config.compress_saves)
+        self.engine.turn_listeners.append(self.autosaver.turn_ended)
+        self.cpu_policy.watch(self.engine)
+        # every chit played and turn passed is streamed to a replay of the game
+        if self.config.record_replays:
+            self.engine.recorder = ReplayRecorder(replay_path(f"{self.engine.seed}-{self.engine.turn}.jsonl"),
+                                                  self.engine, self.config.replay_snapshot_every)
+            prune_replays(self.config.replays_kept)
 
         # debugging setup
         # self.current_player.token.move_token(6)
         # self.players[2].token.move_token(1)
         # self.players[3].token.move_token(10)
 
-    def generate_volcano_cards(self) -> list[VolcanoCard]:
+    @property
+    def players(self) -> dict[int: Player]:
+        return self.engine.players
+
+    @property
+    def current_player(self) -> Player:
+        return self.engine.current_player
+
+    @current_player.setter
+    def current_player(self, player: Player) -> None:
+        self.engine.current_player = player
+
+    @property
+    def max_score(self) -> list:
+        return self.engine.max_score
+
+    @property
+    def num_flips(self) -> int:
+        return self.engine.num_flips
+
+    def generate_volcano_cards(self, layout: list[dict]) -> list[VolcanoCard]:
         """generate volcano cards for the board
 
+        Args:
+            layout (list[dict]): the tiles and caves of each volcano card, in board order
         Returns:
             list[VolcanoCard]: a list of volcano cards
         """
@@ -97,53 +177,30 @@ class Board:
         # move the last coordinate to index 0, so that volcano cards are arranged correctly
         tile_coordinates.insert(0, tile_coordinates.pop(-1))
 
-        cards_with_caves = self.config.volcano_cards_with_caves.copy()
-        cards_without_caves = self.config.volcano_cards_without_caves.copy()
-
         volcano_cards = []
-
-        for i in range(0, len(self.config.volcano_cards_with_caves)):
-            # alternate volcano cards with caves and without caves to build board in correct order
-            random_card_with_cave = cards_with_caves.pop(randrange(len(cards_with_caves)))
-            card1_tiles = []
-            for animal in random_card_with_cave:
-                card1_tiles.append(Tile(tile_coordinates.pop(0), [self.tile_sprite_group], Animal[animal]))
-            volcano_cards.append(VolcanoCard(card1_tiles))
-
-            random_card_without_cave = cards_without_caves.pop(randrange(len(cards_without_caves)))
-            card2_tiles = []
-            for animal in random_card_without_cave:
-                card2_tiles.append(Tile(tile_coordinates.pop(0), [self.tile_sprite_group], Animal[animal]))
-            volcano_cards.append(VolcanoCard(card2_tiles))
+        for volcano_card in layout:
+            tiles = []
+            for animal in volcano_card["tiles"]:
+                tiles.append(Tile(tile_coordinates.pop(0), [self.tile_sprite_group], Animal[animal]))
+            volcano_cards.append(VolcanoCard(tiles))
 
         return volcano_cards
 
-    # Generates list of caves from self.config
-    def generate_caves(self) -> dict[Colour: Cave]:
+    # Generates caves from the layout and attaches them to their volcano cards
+    def generate_caves(self, layout: list[dict]) -> dict[Colour: Cave]:
         # place caves across 4 corners attached to volcano cards with cave indents
         # assumes volcano_cards all have the same number of tiles
         cave_coords = self.find_points_on_circle(self.config.number_of_players,
                                                  self.radius + self.track_width / 2 - 10, self.center)
 
-        # to find the correct volcano cards to add caves to
-        volcano_card_indexes = []
-        match self.config.number_of_players:
-            case 2:
-                volcano_card_indexes = [0, 4]
-            case 3:
-                volcano_card_indexes = [0, 2, 4]
-            case 4:
-                volcano_card_indexes = [0, 2, 4, 6]
-
-        # create cave and add to volcano card
-        caves = self.config.caves.copy()
-
         cave_dict = {}
-        for i in range(0, len(volcano_card_indexes)):
-            cave_colour = caves[i][0]
-            cave_animal = caves[i][1]
-            cave = Cave(cave_coords[i], [self.cave_sprite_group], Animal[cave_animal], Colour[cave_colour])
-            self.volcano_cards[volcano_card_indexes[i]].cave = cave
+        for i, volcano_card in enumerate(layout):
+            if "cave" not in volcano_card:
+                continue
+            cave_colour = volcano_card["cave"]["colour"]
+            cave_animal = volcano_card["cave"]["animal"]
+            cave = Cave(cave_coords[len(cave_dict)], [self.cave_sprite_group], Animal[cave_animal], Colour[cave_colour])
+            self.volcano_cards[i].cave = cave
             cave_dict.update({cave_colour: cave})
         return cave_dict
 
@@ -174,35 +231,18 @@ class Board:
                 print(f'Error: {type} does not match known chit card types, returning None')
         return chit
 
-    def generate_chit_cards(self) -> list[ChitCardInvoker] | None:
+    def generate_chit_cards(self, layout: list[dict]) -> list[ChitCardInvoker] | None:
         # moves grid of chit cards to centre of board
         chits = []
-        standard_chit_cards = self.config.load_config('cards')
-        special_chit_cards = self.config.load_config('special_cards')
-        # Define a max width for the grid
         # Track the current placement of the chit card on the grid
         current_position = 0
         # Track the current grid row
         current_row = 0
-        while len(standard_chit_cards) > 0 or len(special_chit_cards) > 0:
+        for chit_data in layout:
             # Calculate chit coordinates
             if current_position == self.grid:
                 current_position = 0
                 current_row += 1
-            if len(standard_chit_cards) > 0 and len(special_chit_cards) > 0:
-                # Extract the chit card's data
-                card_type = random.choice(
-                    [
-                        standard_chit_cards,
-                        special_chit_cards
-                    ])
-                chit_data = card_type.pop(randrange(len(card_type)))
-            elif len(standard_chit_cards) > 0:
-                # Extract the chit card's data
-                chit_data = standard_chit_cards.pop(randrange(len(standard_chit_cards)))
-            else:
-                # Extract the chit card's data
-                chit_data = special_chit_cards.pop(randrange(len(special_chit_cards)))
 
             # Generate a card based on the extracted data
             chit = self.generate_single_card(current_position, current_row, self.offset, chit_data)
@@ -218,6 +258,48 @@ class Board:
                 return None
         return chits
 
+    def arrange_chit_cards(self, layout: list[dict]) -> list[ChitCardInvoker]:
+        """
+        Puts the chit cards into the order of a saved chit pool. The saved pool is normally the same deck
+        in a different order, so the existing cards are moved rather than built again.
+
+        Args:
+            layout (list[dict]): the saved chit cards, in grid order
+        Returns:
+            list[ChitCardInvoker]: the chit cards in the saved order
+        """
+        unused = {}
+        for chit in self.chit_cards:
+            unused.setdefault(self.chit_key(chit.save()), []).append(chit)
+
+        chits = []
+        current_position = 0
+        current_row = 0
+        for chit_data in layout:
+            if current_position == self.grid:
+                current_position = 0
+                current_row += 1
+            matches = unused.get(self.chit_key(chit_data))
+            if matches:
+                chit = matches.pop()
+                chit.card.move_to(self.config.load_config('card_size'),
+                                  (current_position + self.offset, current_row + self.offset))
+            else:
+                # the saved deck has a card this board does not
+                chit = ChitCardInvoker(self.generate_single_card(current_position, current_row, self.offset, chit_data))
+            chits.append(chit)
+            current_position += 1
+
+        # cards of this board that are not in the saved deck are removed
+        for leftover_chits in unused.values():
+            for chit in leftover_chits:
+                chit.card.kill()
+        return chits
+
+    @staticmethod
+    def chit_key(data: dict[str, any]) -> tuple:
+        return data["type"], data["animal"], data.get("distance")
+
     def generate_players(self) -> dict[int: Player]:
         """
         Generate players for the game
@@ -236,40 +318,6 @@ class Board:
             players.update({player[0]: Player(number, colour, token, human)})
         return players
 
-    def connect_board(self):
-        # set previous position for all positions on board
-        previous_position = None
-        for volcano_card in self.volcano_cards:
-            for position in volcano_card.get_positions():
-                position.previous_position = previous_position
-                previous_position = position
-        # set previous position for first position to be the final position to close the circle
-        self.volcano_cards[0].get_positions()[0].previous_position = previous_position
-
-        # set next position for all positions on the board
-        for volcano_card in self.volcano_cards:
-            for position in volcano_card.get_positions():
-                position.previous_position.next_position = position
-
-        # print statements useful for debugging
-        '''
-        for volcano_card in self.volcano_cards:
-            for position in volcano_card.get_positions():
-                previous_position = position.previous_position
-                print(previous_position.__class__.__name__ + ': ' + previous_position.animal.value)
-                print('^')
-
-        print('======================')
-        for volcano_card in self.volcano_cards:
-            if volcano_card.cave:
-                print(volcano_card.cave.next_position.animal)
-
-            for position in volcano_card.get_positions():
-                next_position = position.next_position
-                print('Next pos = ' + next_position.__class__.__name__ + ': ' + next_position.animal.value)
-                print('V')
-        '''
-
     # Calculate total num of tiles from self.config
     def calculate_num_tiles(self) -> int:
         num_tiles = 0
@@ -291,68 +339,116 @@ class Board:
             list_of_points.append((x, y))
         return list_of_points
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def build_render_group(self) -> None:
         """
-        Draws the current state of the board to the display
-        Args:
-            surface (pygame.Surface): The surface to draw the board to
+        Adds every board sprite to the layered render group, in the order they are drawn
+        """
+        self.render_group.empty()
+        for layer, group in enumerate([self.tile_sprite_group, self.cave_sprite_group, self.token_sprite_group,
+                                       self.chit_sprite_group, self.ui_sprite_group]):
+            self.render_group.add(group.sprites(), layer=layer)
+        # the memory score button sits underneath the board, as the caves overlap it
+        self.render_group.change_layer(self.memory_button, -1)
+        self.full_redraw = True
+
+    def build_hit_index(self) -> None:
+        """
+        Adds everything that can be clicked to the hit index, bottom first in the order they are drawn
+        """
+        self.hit_index.clear()
+        self.hit_index.add(self.memory_button.rect, self.memory_button)
+        for sprite in self.tile_sprite_group.sprites() + self.cave_sprite_group.sprites():
+            self.hit_index.add(sprite.rect, sprite)
+        for chit in self.chit_cards:
+            self.hit_index.add(chit.card.rect, chit)
+        self.hit_index.add(self.save_button.rect, self.save_button)
+
+    def render_background(self) -> pygame.Surface:
+        """
+        Renders the parts of the board that never change
+
         Returns:
-            None
+            pygame.Surface: the board background
         """
+        background = pygame.Surface((self.width, self.height))
+        background.fill('black')
         pygame.draw.circle(
-            surface=surface,
+            surface=background,
             color='white',
             center=self.center,
             radius=self.radius,
             width=self.track_width)
+        return background
 
-        # display current player
-        text_surface = pygame.Surface((300, 80))
-        text_surface.fill('black')
-        surface.blit(text_surface, text_surface.get_rect(topleft=(0, 0)))
+    def repaint(self) -> None:
+        """
+        Marks the whole board to be redrawn on the next frame, used after drawing over the board
+        """
+        self.full_redraw = True
+
+    def time_until_update(self) -> int | None:
+        """
+        Gets how long the board can go without being redrawn if there is no input
+
+        Returns:
+            int | None: milliseconds until the board next changes by itself, 0 if it needs drawing now,
+                or None if it only changes on input
+        """
+        if self.full_redraw or self.cpu_decision is not None or self.save_result is not None:
+            return 0
+        if self.config.cpu_turns_enabled and not self.current_player.human and not self.card_flip_timer.active \
+                and not self.cpu_turn_timer.active:
+            # a CPU turn is about to be scheduled
+            return 0
+        remaining = [time for time in (self.card_flip_timer.time_remaining(), self.cpu_turn_timer.time_remaining(),
+                                       self.save_message_timer.time_remaining())
+                     if time is not None]
+        return min(remaining) if remaining else None
+
+    def update_hud(self) -> None:
+        """
+        Re-renders the current player and current animal displays if the turn or token position has changed
+        """
+        token = self.current_player.token
         if self.current_player.human:
-            message = self.font.render(f"{self.current_player.token.colour.value} player's turn", True,
-                                    (255, 255, 255))
+            self.turn_label.set_text(f"{token.colour.value} player's turn")
         else:
-            message = self.font.render(f"{self.current_player.token.colour.value} (CPU) player's turn", True,
-                                    (255, 255, 255))
-        message_rect = message.get_rect(topleft=(25, 25))
-        surface.blit(message, message_rect)
+            self.turn_label.set_text(f"{token.colour.value} (CPU) player's turn")
 
-        # display animal of current position
-        current_animal = pygame.Surface((250, 80))
-        current_animal.fill('black')
-        text = self.font.render('token is on', True, 'white')
-        current_animal.blit(text, text.get_rect(topleft=(0, 30)))
-        animal = pygame.image.load(self.current_player.token.position.animal_img_path()).convert_alpha()
-        animal = pygame.transform.scale(animal, (80, 80))
-        current_animal.blit(animal, animal.get_rect(center=(180, 40)))
-        surface.blit(current_animal, current_animal.get_rect(topright=(800, 0)))
-
-        # Draw the button
-        surface.blit(self.button_surface, (self.button_x, self.button_y))
-
-        # display save game button
-        self.save_button = GenericSprite((780, 780), [self.ui_sprite_group])
-        self.save_button.image = pygame.image.load(resource_path("imgs/save.png")).convert_alpha()
-        self.save_button.image = pygame.transform.scale(self.save_button.image, (80, 80))
-        self.save_button.rect = self.save_button.image.get_rect(bottomright=self.save_button.coords)
-
-        # # display load game button
-        # self.load_button = GenericSprite((20, 780), [self.ui_sprite_group])
-        # self.load_button.image = pygame.image.load("imgs/save.png").convert_alpha()
-        # self.load_button.image = pygame.transform.scale(self.load_button.image, (80, 80))
-        # self.load_button.rect = self.load_button.image.get_rect(bottomleft=self.load_button.coords)
-
-
-        # draw all sprites to surface
-        self.tile_sprite_group.draw(surface)
-        self.cave_sprite_group.draw(surface)
-        self.token_sprite_group.draw(surface)
-        self.chit_sprite_group.draw(surface)
-        self.ui_sprite_group.draw(surface)
-        self.card_flip_timer.update()
-        self.cave_sprite_group.update()
+        if token.position.animal != self.animal_icon_key:
+            self.animal_icon.set_image(asset_cache.get_image(token.position.animal_img_path(), (80, 80)))
+            self.animal_icon_key = token.position.animal
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Draws the current state of the board to the display. Only sprites that have changed are redrawn,
+        unless the whole board has been marked for repainting.
+        Args:
+            surface (pygame.Surface): The surface to draw the board to
+        Returns:
+            list[pygame.Rect]: the areas of the surface that were drawn to
+        """
+        # apply anything that is due before drawing, so changes show on this frame rather than the next
+        with frame_profiler.phase("timers"):
+            self.card_flip_timer.update()
+            self.cpu_turn_timer.update()
+            self.save_message_timer.update()
+            self.update_non_human_turn()
+            self.update_save_message()
+        with frame_profiler.phase("sprite update"):
+            self.cave_sprite_group.update()
+        with frame_profiler.phase("hud"):
+            self.update_hud()
+
+        if self.full_redraw or not self.config.dirty_rendering:
+            with frame_profiler.phase("repaint"):
+                surface.blit(self.background, (0, 0))
+                self.render_group.repaint_rect(surface.get_rect())
+                self.full_redraw = False
+
+        # draw all changed sprites to surface
+        with frame_profiler.phase("sprite draw"):
+            return self.render_group.draw(surface, self.background)
 
     # Function to display the popup window
     def show_popup(self, surface: pygame.Surface):
@@ -378,6 +474,7 @@ class Board:
         surface.blit(popup_surface, (popup_x, popup_y))
         pygame.display.update()
         pygame.time.wait(2000)  # Display the popup for 2 seconds
+        self.repaint()
 
     def handle_click(self, mouse_pos):
         """
@@ -388,32 +485,83 @@ class Board:
         Returns:
             None
         """
-        if self.save_button.rect.collidepoint(mouse_pos):
+        # only the few sprites in the grid cell under the mouse are checked
+        hits = self.hit_index.hits(mouse_pos)
+
+        if self.save_button in hits and self.save_button.clicked(mouse_pos):
             self.save()
 
         # if self.load_button.rect.collidepoint(mouse_pos):
         #     self.load_save()
 
-        if self.button_x <= mouse_pos[0] <= self.button_x + self.button_width and \
-                self.button_y <= mouse_pos[1] <= self.button_y + self.button_height:
+        if self.memory_button in hits and self.memory_button.clicked(mouse_pos):
             self.show_popup(pygame.display.get_surface())
 
-        if not self.card_flip_timer.active:
-            for chit in self.chit_cards:
-                if chit.card_clicked(mouse_pos) and not chit.card_flipped():
+        # chits can only be flipped by a human on their own turn
+        if self.current_player.human and not self.card_flip_timer.active:
+            for chit in hits:
+                if isinstance(chit, ChitCardInvoker) and not chit.card_flipped():
                     chit.draw_card()
                     self.last_flipped_chit = chit
                     self.card_flip_timer.activate()
 
-    def handle_non_human_turn(self):
-        current_player = self.current_player
-        chits = [chit for chit in self.chit_cards if not chit.card_flipped()]
-        chit = randrange(len(chits))
-        chits[chit].card_clicked(cpu=True)
-        chits[chit].draw_card()
-        self.last_flipped_chit = chits[chit]
+    def choose_non_human_chit(self) -> ChitCardInvoker | None:
+        """
+        Picks the chit the CPU player flips next. This only reads the board, so it can run on the worker thread.
+
+        Returns:
+            ChitCardInvoker | None: the chosen chit, or None if every chit is already face up
+        """
+        index = self.cpu_policy.choose_chit(self.engine, self.engine.rng)
+        if index is None:
+            return None
+        return self.chit_cards[index]
+
+    def play_non_human_chit(self, chit: ChitCardInvoker | None) -> None:
+        """
+        Flips the chit chosen by the CPU player and starts the flip timer
+
+        Args:
+            chit (ChitCardInvoker | None): the chosen chit, or None to end the turn
+        """
+        if chit is None:
+            # there is nothing left to flip, so the turn passes on
+            self.next_player()
+            return
+        chit.card_clicked(cpu=True)
+        chit.draw_card()
+        self.last_flipped_chit = chit
         self.card_flip_timer.activate()
-        
+
+    def handle_non_human_turn(self):
+        """
+        Chooses and flips a chit for the CPU player on the calling thread
+        """
+        self.play_non_human_chit(self.choose_non_human_chit())
+
+    def start_non_human_turn(self) -> None:
+        """
+        Starts choosing the CPU player's chit once its think delay has passed, on the worker thread if enabled
+        """
+        if self.config.cpu_worker_thread:
+            self.cpu_decision = cpu_executor.submit(self.choose_non_human_chit)
+        else:
+            self.handle_non_human_turn()
+
+    def update_non_human_turn(self) -> None:
+        """
+        Schedules the CPU player's next flip, and plays it once the worker thread has chosen a chit
+        """
+        if not self.config.cpu_turns_enabled:
+            return
+        if self.cpu_decision is not None:
+            if self.cpu_decision.done():
+                chit = self.cpu_decision.result()
+                self.cpu_decision = None
+                self.play_non_human_chit(chit)
+        elif not self.current_player.human and not self.card_flip_timer.active and \
+                not self.cpu_turn_timer.active and not self.player_has_won():
+            self.cpu_turn_timer.activate()
 
     def card_flipped(self):
         """
@@ -423,26 +571,7 @@ class Board:
             None
         """
         if self.last_flipped_chit:
-            chit = self.last_flipped_chit
-            if chit.get_card_animal() in [self.current_player.token.position.animal, Animal["PIRATE"]]:
-                try:
-                    self.current_player.token.move_token(chit.get_destination())
-                    if self.current_player == self.previous_turn:
-                        self.num_flips += 1
-                    if self.num_flips > self.max_score[0]:
-                        self.max_score[0] = self.num_flips
-                        self.max_score[1] = self.current_player
-
-                except Exception as e:
-                    self.next_player()
-            elif chit.get_card_animal() == Animal["REVERSE"]:
-                distance, destination = chit.get_destination(self.current_player.token.position)
-                valid = self.current_player.token.verify_move(distance, destination)
-                if valid:
-                    self.current_player.token.place_token(distance, destination)
-                    # self.next_player()
-            else:
-                self.next_player()
+            self.engine.card_flipped(self.chit_cards.index(self.last_flipped_chit))
 
     def next_player(self) -> None:
         """
@@ -451,22 +580,7 @@ class Board:
         Returns:
             None
         """
-        for chit in self.chit_cards:
-            chit.reset_card()
-
-
-        self.num_flips = 0
-        self.current_player.player_finish()
-        current_player_number = self.current_player.player_number
-        # Set previous player's turn to false
-        if current_player_number == self.config.number_of_players:
-            next_player_number = 1
-        else:
-            next_player_number = current_player_number + 1
-        self.current_player = self.players[next_player_number]
-        # flag for player's turn start so that it trigger the cave
-        self.current_player.player_turn()
-        self.previous_turn = self.current_player
+        self.engine.pass_turn()
 
     def player_has_won(self) -> bool:
         """
@@ -475,9 +589,7 @@ class Board:
         Returns:
             bool
         """
-        for player in self.players.values():
-            if player.token.has_won:
-                return True
+        return self.engine.player_has_won()
 
     def get_winner(self) -> str:
         """
@@ -486,74 +598,51 @@ class Board:
         Returns:
             winning player number as a string
         """
-        for player in self.players.values():
-            if player.token.has_won:
-                return str(player.player_number)
+        return self.engine.get_winner()
 
     def save(self) -> None:
-        # delete current save to write new save file
-        delete_save()
-
-        for volcano_card in self.volcano_cards:
-            volcano_card.save()
-
-        for chit_card in self.chit_cards:
-            chit_card.save()
-
-        for player in self.players.values():
-            player.save()
-
-        # save memory score
-        memory_score = {
-            "score": self.max_score[0],
-            "player": self.max_score[1].player_number
-        }
-        write("MemoryScore", memory_score)
-
-        saved_text = self.font.render("Game saved!", True, (255, 255, 255))
-        pygame.display.get_surface().blit(saved_text, (630, 670))
-        pygame.display.update()
-        pygame.time.wait(2000)
-        saved_text.fill((0, 0, 0))
-        pygame.display.get_surface().blit(saved_text, (630, 670))
-        pygame.display.update()
+        """
+        Writes a full save in the background and shows a message while the game carries on
+        """
+        self.save_result = self.autosaver.save_game(self.engine)
 
-    def load_save(self) -> None:
+    def update_save_message(self) -> None:
+        """
+        Shows whether the save made with the save button was written, once it has finished
+        """
+        if self.save_result is None or not self.save_result.done():
+            return
+        failed = self.save_result.exception() is not None
+        self.save_result = None
+        self.save_label.set_text("Save failed!" if failed else "Game saved!")
+        self.save_label.visible = 1
+        self.save_label.dirty = 1
+        self.save_message_timer.activate()
+
+    def hide_save_message(self) -> None:
+        self.save_label.visible = 0
+        self.save_label.dirty = 1
+
+    def load_save(self, save: dict | None = None) -> None:
         """
         loads the saved state of the game into the board
+
+        Args:
+            save (dict | None): the save to load, or None to load the save file if loading is enabled
         """
-        if self.config.get_load_save():
-            save = load_file()
-            if save:
-                # load volcano cards
-                saved_volcano_cards = save["VolcanoCards"]
+        if save is None and self.config.get_load_save():
+            save = load_latest_save(self.config.save_format)
+        if save:
+            # a board built from the save already has its layout, so only boards with a different layout change
+            saved_volcano_cards = save["VolcanoCards"]
+            if [volcano_card.save() for volcano_card in self.volcano_cards] != saved_volcano_cards:
                 for i in range(0, len(self.volcano_cards)):
-                    volcano_card = self.volcano_cards[i]
-                    saved_volcano_card = saved_volcano_cards[i]
-                    volcano_card.load(saved_volcano_card)
-
-                # load players
-                saved_players = save["Players"]
-                for saved_player in saved_players:
-                    player_num = saved_player["player_num"]
-                    player = self.players[player_num]
-                    player.load(saved_player)
-                    if saved_player["current_player"]:
-                        self.current_player.player_finish()
-                        self.current_player = self.players[player_num]
-
-                # load chit cards
-                saved_chit_cards = save["ChitCards"]
-                current_position = 0
-                current_row = 0
-                for i in range(0, len(self.chit_cards)):
-                    if current_position == self.grid:
-                        current_position = 0
-                        current_row += 1
-                    self.chit_cards[i].load(self.generate_single_card(current_position, current_row, self.offset, saved_chit_cards[i]))
-                    current_position += 1
-
-                # load memory score
-                memory_score = save["MemoryScore"][0]
-                self.max_score[0] = memory_score["score"]
-                self.max_score[1] = self.players[memory_score["player"]]
+                    self.volcano_cards[i].load(saved_volcano_cards[i])
+
+            if [chit.save() for chit in self.chit_cards] != save["ChitCards"]:
+                self.chit_cards = self.arrange_chit_cards(save["ChitCards"])
+                self.engine.chits = [chit.card for chit in self.chit_cards]
+                self.build_hit_index()
+
+            # load players, memory score and turn
+            self.engine.load(save)
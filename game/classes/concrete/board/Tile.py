@@ -9,6 +9,7 @@ import pygame
 
 from classes.abstract.Position import Position
 from classes.enum.Animal import Animal
+from classes.utils.asset_cache import asset_cache
 
 
 class Tile(Position):
@@ -20,6 +21,6 @@ class Tile(Position):
         """Load the image of the tile
         
         """
-        self.image = pygame.image.load(self.animal_img_path()).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (80, 80))
+        self.image = asset_cache.get_image(self.animal_img_path(), (80, 80))
         self.rect = self.image.get_rect(center=self.coords)
+        self.dirty = 1
@@ -4,24 +4,22 @@ Class VolcanoCard
 import json
 from math import floor
 
-from classes.concrete.board.Tile import Tile
-from classes.concrete.board.Cave import Cave
-from classes.abstract.Position import Position
+from classes.engine.BoardNode import BoardNode
+from classes.engine.CaveNode import CaveNode
 from classes.enum.Animal import Animal
 from classes.enum.Colour import Colour
-from classes.utils.file_io import write
 
 
 class VolcanoCard:
-    def __init__(self, tiles: list[Tile], cave: Cave = None):
+    def __init__(self, tiles: list[BoardNode], cave: CaveNode = None):
         self.tiles = tiles
         self.cave = cave
 
-    def get_positions(self) -> list[Position]:
+    def get_positions(self) -> list[BoardNode]:
         """returns an ordered list of positions, including cave positions
 
         Returns:
-            list[Position]: list of positions
+            list[BoardNode]: list of positions
         """
         positions = []
         for tile in self.tiles:
@@ -38,9 +36,9 @@ class VolcanoCard:
 
         return positions
 
-    def save(self) -> None:
+    def save(self) -> dict:
         """
-        saves the current state of the volcano card to a save file
+        gets the current state of the volcano card for a save file
         """
         tiles_arr = []
         for tile in self.tiles:
@@ -58,7 +56,7 @@ class VolcanoCard:
             }
             volcano_card["cave"] = cave
 
-        write("VolcanoCards", volcano_card)
+        return volcano_card
 
     def load(self, save: dict) -> None:
         """
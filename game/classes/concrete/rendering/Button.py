@@ -0,0 +1,26 @@
+"""
+Class Button
+
+A clickable image widget, created once and reused for the lifetime of its screen.
+"""
+
+import pygame
+
+from classes.abstract.Widget import Widget
+
+
+class Button(Widget):
+    def __init__(self, coords: tuple[int, int], groups: list[pygame.sprite.Group], image: pygame.Surface,
+                 anchor: str = "topleft"):
+        super().__init__(coords, groups, anchor)
+        self.set_image(image)
+
+    def clicked(self, mouse_pos: tuple[int, int]) -> bool:
+        """Checks if the button was clicked
+
+        Args:
+            mouse_pos (tuple[int, int]): the position of the mouse click
+        Returns:
+            bool: whether the button was clicked
+        """
+        return self.contains(mouse_pos)
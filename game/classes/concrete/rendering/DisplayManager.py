@@ -5,6 +5,7 @@ import pygame
 import sys
 
 from classes.concrete.board.Board import Board
+from classes.concrete.rendering.Label import Label
 from classes.utils.image_packager import resource_path
 
 
@@ -21,6 +22,12 @@ class DisplayManager:
         pygame.font.init()
         self.font = pygame.font.Font(None, 36)
         self.config = config
+
+        # Widgets for the setup and win screens, created once and reused every time a screen is drawn
+        self.setup_widgets = pygame.sprite.Group()
+        self.win_widgets = pygame.sprite.Group()
+        self.win_label = Label((width // 2, 300), [self.win_widgets], self.font, anchor="center")
+        Label((width // 2, 525), [self.win_widgets], self.font, 'RESET', colour=(0, 0, 0), anchor="center")
         
     def get_screen(self) -> pygame.Surface:
         """Get the active screen
@@ -39,7 +46,7 @@ class DisplayManager:
         return pygame.display.get_surface()
 
     def draw_setup(self) -> str:
-        """Draws the setup screen for the game, where user can choose the number of players
+        """Draws the setup screen for the game, where user can choose the number of players and the CPU difficulty
 
         Returns:
             str: The number of players chosen by the user
@@ -57,12 +64,19 @@ class DisplayManager:
 
         # Define checkboxes
         checkboxes = {
-            '4 Players': {'rect': pygame.Rect(screen_width // 2 - 100, checkbox_y_start + 100, 20, 20), 'is_checked': False},
-            '3 Players': {'rect': pygame.Rect(screen_width // 2 - 100, checkbox_y_start + 125, 20, 20), 'is_checked': False},
-            '2 Players': {'rect': pygame.Rect(screen_width // 2 - 100, checkbox_y_start + 150, 20, 20), 'is_checked': False},
-            '1 Player': {'rect': pygame.Rect(screen_width // 2 - 100, checkbox_y_start + 175, 20, 20), 'is_checked': False}
+            '4 Players': {'rect': pygame.Rect(screen_width // 2 - 200, checkbox_y_start + 100, 20, 20), 'is_checked': False},
+            '3 Players': {'rect': pygame.Rect(screen_width // 2 - 200, checkbox_y_start + 125, 20, 20), 'is_checked': False},
+            '2 Players': {'rect': pygame.Rect(screen_width // 2 - 200, checkbox_y_start + 150, 20, 20), 'is_checked': False},
+            '1 Player': {'rect': pygame.Rect(screen_width // 2 - 200, checkbox_y_start + 175, 20, 20), 'is_checked': False}
         }
 
+        # Define CPU difficulty checkboxes, one for each level in the configuration
+        difficulties = {}
+        for i, level in enumerate(self.config.difficulty_levels):
+            difficulties[level] = {'rect': pygame.Rect(screen_width // 2 + 60, checkbox_y_start + 100 + 25 * i, 20, 20),
+                                   'is_checked': level == self.config.cpu_difficulty}
+        difficulty = self.config.cpu_difficulty
+
         # Automatically check the box based on current configuration
         checkboxes['4 Players']['is_checked'] = True
         checkboxes['3 Players']['is_checked'] = False
@@ -77,20 +91,35 @@ class DisplayManager:
         # Define load game button
         load_button = pygame.Rect(button_x, load_button_y, button_width, button_height)
 
+        # Text is rendered once, when the widgets are created
+        if not self.setup_widgets:
+            Label((screen_width // 2, 200), [self.setup_widgets], heading_font, "Setup Game", anchor="midtop")
+            Label((screen_width // 2 - 200, checkbox_y_start + 65), [self.setup_widgets], self.font, "Human players")
+            Label((screen_width // 2 + 60, checkbox_y_start + 65), [self.setup_widgets], self.font, "CPU difficulty")
+            for key, value in (checkboxes | difficulties).items():
+                Label((value['rect'].x + 35, value['rect'].y - 2), [self.setup_widgets], self.font, key)
+            Label(start_button.center, [self.setup_widgets], self.font, "Start New Game", colour=(0, 0, 0),
+                  anchor="center")
+            Label(load_button.center, [self.setup_widgets], self.font, "Load Save Game", colour=(0, 0, 0),
+                  anchor="center")
+
         # Main loop for the setup screen
         running = True
+        events = pygame.event.get()
         while running:
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if start_button.collidepoint(event.pos):
                         surface.fill((0, 0, 0))
                         self.config.set_load_save(False)
+                        self.config.set_difficulty(difficulty)
                         return num_players
                     if load_button.collidepoint(event.pos):
                         surface.fill((0, 0, 0))
                         self.config.set_load_save(True)
+                        self.config.set_difficulty(difficulty)
                         return num_players
                     for key, value in checkboxes.items():
                         if value['rect'].collidepoint(event.pos):
@@ -99,33 +128,31 @@ class DisplayManager:
                                 if key2 != key:
                                     value2['is_checked'] = False
                             num_players = int(key[0])
+                    for key, value in difficulties.items():
+                        if value['rect'].collidepoint(event.pos):
+                            for value2 in difficulties.values():
+                                value2['is_checked'] = False
+                            value['is_checked'] = True
+                            difficulty = key
 
             # Clear the screen and draw elements
             surface.fill((0, 0, 0))
-            heading_text = heading_font.render("Setup Game", True, (255, 255, 255))
-            surface.blit(heading_text, (screen_width // 2 - heading_text.get_width() // 2, 200))
 
-            # Draw checkboxes and their labels
-            for key, value in checkboxes.items():
+            # Draw checkboxes
+            for key, value in (checkboxes | difficulties).items():
                 pygame.draw.rect(surface, (100, 100, 100) if value['is_checked'] else (255, 255, 255), value['rect'])
                 pygame.draw.rect(surface, (255, 255, 255), value['rect'], 2)
-                text_surface = self.font.render(key, True, (255, 255, 255))
-                surface.blit(text_surface, (value['rect'].x + 35, value['rect'].y-2))
 
-            # Draw the start button
+            # Draw the start and load buttons
             pygame.draw.rect(surface, (255, 255, 255), start_button)
-            pygame.draw.rect(surface, (255, 255, 255), start_button, 2) 
-            button_text = self.font.render("Start New Game", True, (0, 0, 0))
-            surface.blit(button_text, (start_button.x + button_width // 2 - button_text.get_width() // 2, start_button.y + button_height // 2 - button_text.get_height() // 2))
-
-            # Draw the load button
             pygame.draw.rect(surface, (255, 255, 255), load_button)
-            pygame.draw.rect(surface, (255, 255, 255), load_button, 2)
-            button_load_text = self.font.render("Load Save Game", True, (0, 0, 0))
-            surface.blit(button_load_text, (load_button.x + button_width // 2 - button_load_text.get_width() // 2,
-                                       load_button.y + button_height // 2 - button_load_text.get_height() // 2))
+
+            # Draw the heading, checkbox labels and button text
+            self.setup_widgets.draw(surface)
 
             self.update()
+            # the setup screen only changes on input, so sleep until an event arrives
+            events = [pygame.event.wait()] + pygame.event.get()
 
         pygame.quit()
 
@@ -146,30 +173,21 @@ class DisplayManager:
         surface.blit(overlay, (0, 0))
 
         
-        message = self.font.render(f'{winner} wins!', True, (255, 255, 255))
-        message_rect = message.get_rect(center=(surface.get_width() // 2, 300))
-        surface.blit(message, message_rect)
-
-        self.update()
-
         button_width, button_height = 200, 50
         reset_button = pygame.Rect((surface.get_width() // 2 - button_width // 2), 500, button_width, button_height)
         button_color = (255, 255, 255)
-        text_color = (0, 0, 0)
         corner_radius = 10  
         pygame.draw.rect(surface, button_color, reset_button, border_radius=corner_radius)
 
-        text_surface = self.font.render('RESET', True, text_color)
-        text_rect = text_surface.get_rect(center=reset_button.center)
-
-        # Blit the text onto the button
-        surface.blit(text_surface, text_rect)
+        # Draw the winner message and the button text
+        self.win_label.set_text(f'{winner} wins!')
+        self.win_widgets.draw(surface)
 
         self.update()
 
         # Process events
         while True:
-            for event in pygame.event.get():
+            for event in [pygame.event.wait()] + pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -182,4 +200,16 @@ class DisplayManager:
     def update(self) -> None:
         """Update the display
         """
-        pygame.display.flip()
\ No newline at end of file
+        pygame.display.flip()
+
+    def update_rects(self, rects: list[pygame.Rect]) -> None:
+        """Update only the given areas of the display, or the whole display if dirty rendering is disabled
+
+        Args:
+            rects (list[pygame.Rect]): the areas of the display that have changed
+        """
+        if self.config.dirty_rendering:
+            if rects:
+                pygame.display.update(rects)
+        else:
+            pygame.display.update()
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+Class Label
+
+A text widget that only re-renders its text when the text changes.
+"""
+
+import pygame
+
+from classes.abstract.Widget import Widget
+
+
+class Label(Widget):
+    # Number of previously rendered texts kept per label, so labels cycling through a few values never re-render
+    MAX_CACHED_TEXTS = 8
+
+    def __init__(self, coords: tuple[int, int], groups: list[pygame.sprite.Group], font: pygame.font.Font,
+                 text: str = "", colour="white", background=None, min_size: tuple[int, int] = (0, 0),
+                 padding: tuple[int, int] = (0, 0), anchor: str = "topleft"):
+        super().__init__(coords, groups, anchor)
+        self.font = font
+        self.colour = colour
+        # None gives a transparent background
+        self.background = background
+        self.min_size = min_size
+        self.padding = padding
+        self.text = None
+        self._rendered: dict[str, pygame.Surface] = {}
+        self.set_text(text)
+
+    def set_text(self, text: str) -> bool:
+        """Sets the text of the label, rendering it only if it has not been rendered before
+
+        Args:
+            text (str): the text to display
+        Returns:
+            bool: whether the label changed
+        """
+        if text == self.text:
+            return False
+        self.text = text
+
+        surface = self._rendered.get(text)
+        if surface is None:
+            surface = self.render(text)
+            if len(self._rendered) >= self.MAX_CACHED_TEXTS:
+                # Forget the oldest rendered text
+                self._rendered.pop(next(iter(self._rendered)))
+            self._rendered[text] = surface
+        self.set_image(surface)
+        return True
+
+    def render(self, text: str) -> pygame.Surface:
+        """Renders the text onto the label's background
+
+        Args:
+            text (str): the text to render
+        Returns:
+            pygame.Surface: the rendered label
+        """
+        rendered_text = self.font.render(text, True, self.colour)
+        width = max(self.min_size[0], rendered_text.get_width() + self.padding[0])
+        height = max(self.min_size[1], rendered_text.get_height() + self.padding[1])
+        if self.background is None:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        else:
+            surface = pygame.Surface((width, height))
+            surface.fill(self.background)
+        surface.blit(rendered_text, self.padding)
+        return surface
@@ -0,0 +1,89 @@
+"""
+Class ProfilerOverlay
+
+A panel drawn over the board showing the p50, p95 and p99 time of each phase of recent frames, from the
+frame profiler. The text is only re-rendered a few times a second, so the overlay barely shows in the
+timings it displays.
+"""
+
+import pygame
+
+from classes.utils.profiler import FrameProfiler
+
+
+class ProfilerOverlay:
+    # Milliseconds between re-renders of the panel
+    REFRESH_MS = 250
+
+    def __init__(self, profiler: FrameProfiler, font: pygame.font.Font, anchor: tuple[int, int]) -> None:
+        """
+        Args:
+            profiler (FrameProfiler): the profiler whose timings are shown
+            font (pygame.font.Font): font of the panel's text
+            anchor (tuple[int, int]): position of the panel's top right corner
+        """
+        self.profiler = profiler
+        self.font = font
+        self.anchor = anchor
+        self.visible = False
+        # whether the profiler was recording before the overlay was shown, so hiding it restores that
+        self.was_enabled = False
+        self.image: pygame.Surface | None = None
+        self.rendered_at = None
+
+    def toggle(self) -> None:
+        """
+        Shows or hides the overlay. Showing it starts the profiler if it was not already recording.
+        """
+        self.visible = not self.visible
+        if self.visible:
+            self.was_enabled = self.profiler.enabled
+            if not self.was_enabled:
+                self.profiler.enable()
+            self.image = None
+        elif not self.was_enabled:
+            self.profiler.disable()
+
+    def render(self) -> pygame.Surface:
+        """
+        Returns:
+            pygame.Surface: the panel, with a row for each phase sorted by its p99 time
+        """
+        summary = self.profiler.summary()
+        rows = [("phase", "p50", "p95", "p99")]
+        for name, phase in sorted(summary.items(), key=lambda item: -item[1]["p99_ms"]):
+            rows.append((name, *(f"{phase[key]:.2f}" for key in ("p50_ms", "p95_ms", "p99_ms"))))
+        rows.append((f"{self.profiler.frames} frames, ms", "", "", ""))
+
+        line_height = self.font.get_linesize()
+        column_widths = [150, 55, 55, 55]
+        panel = pygame.Surface((sum(column_widths) + 10, line_height * len(rows) + 10))
+        # opaque, as the board is not cleared under the panel between frames
+        panel.fill((0, 0, 0))
+        for row_number, row in enumerate(rows):
+            x = 5
+            for column, (text, width) in enumerate(zip(row, column_widths)):
+                rendered = self.font.render(text, True, "white")
+                if column == 0:
+                    panel.blit(rendered, (x, 5 + row_number * line_height))
+                else:
+                    panel.blit(rendered, rendered.get_rect(topright=(x + width, 5 + row_number * line_height)))
+                x += width
+        return panel
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Draws the overlay if it is visible, re-rendering it if its timings are out of date
+
+        Args:
+            surface (pygame.Surface): the surface to draw to
+        Returns:
+            list[pygame.Rect]: the area drawn to, empty if the overlay is hidden
+        """
+        if not self.visible:
+            return []
+        now = pygame.time.get_ticks()
+        if self.image is None or now - self.rendered_at >= self.REFRESH_MS:
+            self.image = self.render()
+            self.rendered_at = now
+        return [surface.blit(self.image, self.image.get_rect(topright=self.anchor))]
@@ -0,0 +1,87 @@
+"""
+Class BoardNode
+
+A position on the board graph that has an animal. Holds the rules for walking the track,
+without any rendering, so games can be played without a display.
+"""
+
+from classes.enum.Animal import Animal
+
+
+class BoardNode:
+    def __init__(self, animal: Animal):
+        # set when the track is indexed, see TrackIndex
+        self.ordinal = None
+        self.track = None
+        self.animal = animal
+        self._occupied = False
+        self.previous_position = None
+        self.next_position = None
+        self.attached_cave = None
+
+    @property
+    def occupied(self) -> bool:
+        return self._occupied
+
+    @occupied.setter
+    def occupied(self, occupied: bool) -> None:
+        if occupied == self._occupied:
+            return
+        self._occupied = occupied
+        # keep the track's nearest cave table and the game's hash up to date
+        if self.track:
+            self.track.occupied_changed(self)
+
+    def is_occupied(self) -> bool:
+        """
+        Returns whether the position is occupied by a token.
+
+        Args:
+            None
+        Returns:
+            bool: True if the position is occupied, False otherwise
+        """
+        return self.occupied
+
+    def nearest_cave(self) -> tuple[int, "BoardNode | None"]:
+        """
+        Finds the nearest unoccupied cave behind this position, counting the step into the cave
+
+        Returns:
+            tuple[int, BoardNode | None]: the negative distance to the cave and the cave,
+                or (0, None) if there is no unoccupied cave to move back to
+        """
+        if self.track:
+            return self.track.nearest_cave(self)
+        # without an index, walk back around the track at most once
+        position = self
+        distance = 0
+        while position is not None:
+            if position.attached_cave and not position.attached_cave.occupied:
+                return distance - 1, position.attached_cave
+            position = position.previous_position
+            distance -= 1
+            if position is self:
+                break
+        return 0, None
+
+    def find_position(self, distance: int):
+        if self.track:
+            return self.track.offset(self, distance)
+        if distance > 0:
+            position = self.next_position
+            for i in range(1, distance):
+                position = position.next_position
+            return position
+        elif distance < 0:
+            position = self.previous_position
+            for i in range(1, abs(distance)):
+                position = position.previous_position
+            return position
+        else:
+            return self
+
+    def load_img(self) -> None:
+        """Reloads the image of the position after its animal changes. Engine nodes have no image.
+        """
+        pass
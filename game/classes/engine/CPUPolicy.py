@@ -0,0 +1,46 @@
+"""
+Class CPUPolicy
+
+Decides which chit a CPU player flips next. Policies only read the engine, so they can run on a worker
+thread or in another process, and take the random source to use so seeded games can be replayed.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class CPUPolicy(ABC):
+    name = ""
+
+    @classmethod
+    def from_config(cls, config) -> "CPUPolicy":
+        """
+        Creates the policy with the settings in the game configuration
+
+        Args:
+            config (Config): the game configuration
+        Returns:
+            CPUPolicy: the policy
+        """
+        return cls()
+
+    def watch(self, engine) -> None:
+        """
+        Called once with each game before the policy plays in it, so policies can follow the game
+
+        Args:
+            engine (GameEngine): the game
+        """
+        pass
+
+    @abstractmethod
+    def choose_chit(self, engine, rng) -> int | None:
+        """
+        Chooses the chit the current player flips next
+
+        Args:
+            engine (GameEngine): the game being played
+            rng: source of randomness, the random module or a random.Random instance
+        Returns:
+            int | None: index of the chit to flip, or None to end the turn
+        """
+        pass
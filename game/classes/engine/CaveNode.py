@@ -0,0 +1,26 @@
+"""
+Class CaveNode
+
+A cave on the board graph. Tokens start in the cave of their colour and win by returning to it.
+"""
+
+from classes.engine.BoardNode import BoardNode
+from classes.enum.Animal import Animal
+from classes.enum.Colour import Colour
+
+
+class CaveNode(BoardNode):
+    def __init__(self, animal: Animal, colour: Colour):
+        super().__init__(animal)
+        self.colour = colour
+        self.highlight = False
+
+    def highlight_cave(self) -> None:
+        """sets the cave to be highlighted
+        """
+        self.highlight = True
+
+    def non_highlight_cave(self) -> None:
+        """sets the cave to not be highlighted
+        """
+        self.highlight = False
@@ -0,0 +1,59 @@
+"""
+Class Chit
+
+A chit card in the chit pool, without any rendering. Chits are flipped to move the current player's token.
+"""
+
+from abc import ABC, abstractmethod
+
+from classes.enum.Animal import Animal
+
+
+class Chit(ABC):
+    def __init__(self, animal: Animal):
+        self.animal = animal
+        # place in the chit pool and hash of the game the chit is in, set by the engine
+        self.slot = None
+        self.zobrist = None
+        # Tracks the flipped status of the card, changed with set_flipped
+        self.flipped = False
+
+    def get_flipped(self) -> bool:
+        return self.flipped
+
+    def update_card(self) -> None:
+        """Called whenever the flipped state changes, so views can update. Does nothing in the engine.
+        """
+        pass
+
+    def set_flipped(self, flipped: bool) -> None:
+        """
+        Turns the card face up or face down, keeping the game's hash up to date
+
+        Args:
+            flipped (bool): whether the card is face up
+        """
+        if flipped != self.flipped and self.zobrist is not None:
+            self.zobrist.toggle_flipped(self.slot)
+        self.flipped = flipped
+        self.update_card()
+
+    def flip_card(self) -> None:
+        """
+        Inverts the current flipped state of the card
+        """
+        self.set_flipped(not self.flipped)
+
+    def reset_card(self) -> None:
+        """
+        Ensures that the card is face down when finished with interactions
+        """
+        self.set_flipped(False)
+
+    @abstractmethod
+    def get_destination(self, position=None) -> int:
+        pass
+
+    @abstractmethod
+    def save(self) -> dict:
+        pass
@@ -0,0 +1,328 @@
+"""
+Class ChitSearch
+
+Monte Carlo tree search over chit flips, played on a copy of the game without any sprites using the
+engine's own rules. The chits a player has not seen are hidden, so every iteration first deals the
+chits the player does not remember into a random layout, then walks the tree by upper confidence
+bounds, adds one node and plays a few turns as players who remember no chits, to score the position for
+each player. New nodes start with a few virtual visits valued by MemoryPolicy's expected values, so a
+short search falls back on the memory policy's choice instead of picking between noisy estimates.
+
+Nodes are kept in a transposition table by the Zobrist hash of their state rather than under the node
+they were reached from, so states reached by flipping chits in a different order, or by different turns
+that end in the same place, share one node and its statistics. The table is kept between searches, so a
+search that starts from a state the previous searches reached, later in the turn or after the other
+players' turns, carries on from what was already learnt.
+"""
+
+import math
+import random
+import time
+from operator import attrgetter
+from types import SimpleNamespace
+
+from classes.engine.GameEngine import GameEngine
+from classes.engine.GameState import GameState
+from classes.engine.MemoryPolicy import MemoryPolicy
+from classes.engine.SearchNode import SearchNode
+from classes.engine.TranspositionTable import DEFAULT_BITS, TranspositionTable
+
+
+class ChitSearch:
+    def __init__(self, engine: GameEngine, exploration: float = 0.2, rollout_turns: int = 1,
+                 prior_visits: int = 20, table_bits: int = DEFAULT_BITS) -> None:
+        """
+        Args:
+            engine (GameEngine): a game the search can play on, usually a copy of the game being played
+            exploration (float): weight of the exploration term of the upper confidence bound
+            rollout_turns (int): number of turns played after leaving the tree
+            prior_visits (int): virtual visits given to each action of a new node, 0 starts without a prior
+            table_bits (int): the transposition table keeps up to 2 ** table_bits nodes
+        """
+        self.engine = engine
+        for player in engine.players.values():
+            player.token.report = False
+        # every chit of the pool, by its index in the real layout
+        self.chits = list(engine.chits)
+        self.kinds = [(chit.animal, getattr(chit, "distance", None)) for chit in self.chits]
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.prior_visits = prior_visits
+        self.root: SearchNode | None = None
+        # nodes by the hash of their state, the most visited are kept when the table is full
+        self.table = TranspositionTable(table_bits, attrgetter("visits"))
+        # chance that the searching player knows each chit, see search
+        self.recall: list[float] = [0.0] * len(self.chits)
+        self.rollouts = 0
+        # searches that started from a node of an earlier search
+        self.reused = 0
+
+    def search(self, state: GameState, recall: list[float], budget: float,
+               rng: random.Random, rollout_limit: int = 0) -> tuple[dict[int | None, list], int]:
+        """
+        Searches from a state of the game until the time budget runs out, or for a number of rollouts
+
+        Args:
+            state (GameState): the state to search from
+            recall (list[float]): chance that the player to move knows each chit, 1 for face up chits
+            budget (float): time to search for, in seconds
+            rng (random.Random): source of randomness for dealing chits and rollouts
+            rollout_limit (int): number of rollouts to play instead of searching for the time budget, which
+                gives the same search on any machine, 0 uses the time budget
+        Returns:
+            tuple[dict[int | None, list], int]: the [visits, total reward] of each action at the root,
+                and the number of rollouts played
+        """
+        deadline = time.perf_counter() + budget
+        self.recall = recall
+        self.engine.chits = self.chits
+        self.engine.restore(state)
+        # nodes of earlier searches are replaced first once the table is full
+        self.table.new_generation()
+        key = self.engine.state_hash()
+        root = self.table.get(key)
+        # earlier searches can be carried on if they reached this state
+        if root is None:
+            root = self.new_node()
+            self.table.store(key, root)
+        else:
+            self.reused += 1
+            # chits revealed since the tree was built change which chits are worth telling apart
+            actions = self.actions()
+            if root.actions != actions:
+                self.update_actions(root, actions)
+        self.root = root
+
+        rollouts = 0
+        # always search at least once, so there is an action to choose
+        while rollouts == 0 or (rollouts < rollout_limit if rollout_limit else time.perf_counter() < deadline):
+            self.iterate(root, state, recall, rng)
+            rollouts += 1
+        self.rollouts += rollouts
+        return root.stats, rollouts
+
+    def actions(self) -> list[int | None]:
+        """
+        Returns:
+            list[int | None]: the actions of the player to move in the engine's state. Chits the player has
+                never seen could be any chit, so they are one action, flipping the first of them.
+        """
+        engine = self.engine
+        actions = []
+        unseen = False
+        for index in engine.unflipped_chits():
+            if self.recall[index] > 0:
+                actions.append(index)
+            elif not unseen:
+                actions.append(index)
+                unseen = True
+        # a turn can end once the player has moved, or when there is nothing left to flip
+        if engine.num_flips > 0 or not actions:
+            actions.append(None)
+        return actions
+
+    def new_node(self) -> SearchNode:
+        """
+        Returns:
+            SearchNode: a node for the engine's state, with the prior of each of its actions
+        """
+        node = SearchNode(self.engine.current_player.player_number, self.actions())
+        if self.prior_visits:
+            for action, value in self.prior(node).items():
+                node.stats[action] = [self.prior_visits, self.prior_visits * value]
+            node.visits = self.prior_visits * len(node.actions)
+        return node
+
+    def update_actions(self, node: SearchNode, actions: list[int | None]) -> None:
+        """
+        Changes the actions of a node in the engine's state, keeping the statistics of the actions it already had
+        """
+        node.actions = actions
+        node.stats = {action: stats for action, stats in node.stats.items() if action in actions}
+        if self.prior_visits:
+            for action, value in self.prior(node).items():
+                if action not in node.stats:
+                    node.stats[action] = [self.prior_visits, self.prior_visits * value]
+        node.visits = sum(stats[0] for stats in node.stats.values())
+
+    def prior(self, node: SearchNode) -> dict[int | None, float]:
+        """
+        Estimates the reward of each action of a node in the engine's state from the expected value of its move,
+        counting a move round the whole track as the difference between the lowest and highest reward
+
+        Returns:
+            dict[int | None, float]: the estimated reward of each action
+        """
+        engine = self.engine
+        current = self.rewards()[node.player]
+        recall = [1.0 if chit.flipped else known for chit, known in zip(engine.chits, self.recall)]
+        kinds = [(chit.animal, getattr(chit, "distance", None)) for chit in engine.chits]
+        chits = [action for action in node.actions if action is not None]
+        values = MemoryPolicy.expected_values(engine, kinds, recall, chits)
+        scale = 0.5 / (engine.track.length + 1)
+        return {action: min(1.0, max(0.0, current + scale * values.get(action, 0.0))) for action in node.actions}
+
+    def deal(self, recall: list[float], rng: random.Random) -> None:
+        """
+        Deals a layout of the hidden chits. Remembered chits stay where they are, and the chits the player
+        does not remember are shuffled among their places.
+        """
+        unknown = [index for index, known in enumerate(recall) if known < 1.0 and rng.random() >= known]
+        dealt = [self.chits[index] for index in unknown]
+        rng.shuffle(dealt)
+        chits = list(self.chits)
+        for index, chit in zip(unknown, dealt):
+            chits[index] = chit
+        self.engine.chits = chits
+
+    def iterate(self, root: SearchNode, state: GameState, recall: list[float], rng: random.Random) -> None:
+        engine = self.engine
+        # put the real layout back before restoring, so every chit is face down where the state says
+        engine.chits = self.chits
+        engine.restore(state)
+        self.deal(recall, rng)
+
+        table = self.table
+        node = root
+        path = []
+        # ending turns can lead back to a state already on the path, which is scored by a rollout instead
+        visited = {id(root)}
+        while not engine.player_has_won():
+            action = self.select(node, rng)
+            path.append((node, action))
+            self.play(action)
+            child_key = engine.state_hash()
+            child = table.get(child_key)
+            if child is None:
+                table.store(child_key, self.new_node())
+                break
+            if id(child) in visited:
+                break
+            visited.add(id(child))
+            node = child
+
+        rewards = self.rollout(rng)
+        for node, action in path:
+            node.visits += 1
+            stats = node.stats.setdefault(action, [0, 0.0])
+            stats[0] += 1
+            stats[1] += rewards[node.player]
+
+    def select(self, node: SearchNode, rng: random.Random) -> int | None:
+        """
+        Returns:
+            int | None: an action that has not been tried yet, or the action with the best upper confidence bound
+        """
+        untried = node.untried()
+        if untried:
+            return untried[rng.randrange(len(untried))]
+        log_visits = math.log(node.visits)
+        best, best_value = None, -1.0
+        for action, (visits, total) in node.stats.items():
+            value = total / visits + self.exploration * math.sqrt(log_visits / visits)
+            if value > best_value:
+                best, best_value = action, value
+        return best
+
+    def play(self, action: int | None) -> None:
+        if action is None:
+            self.engine.next_player()
+        else:
+            self.engine.play_chit(action)
+
+    def rollout(self, rng: random.Random) -> dict[int, float]:
+        """
+        Plays a few turns, or until a player wins. Players flip random chits, and end their turn once they
+        have moved if a face down chit is expected to lose ground, as a player who remembers nothing would.
+
+        Returns:
+            dict[int, float]: the reward of each player, by player number
+        """
+        engine = self.engine
+        last_turn = engine.turn + self.rollout_turns
+        while engine.turn < last_turn and not engine.player_has_won():
+            chits = engine.unflipped_chits()
+            if chits and engine.num_flips > 0 and self.expected_value(chits) < 0:
+                chits = None
+            if chits:
+                engine.play_chit(chits[rng.randrange(len(chits))])
+            else:
+                engine.next_player()
+        return self.rewards()
+
+    def expected_value(self, chits: list[int]) -> float:
+        """
+        Returns:
+            float: the mean value of flipping one of some face down chits for the current player, see MemoryPolicy.value
+        """
+        engine = self.engine
+        values = {}
+        total = 0.0
+        for index in chits:
+            # the chit dealt to this place, which is what the player would turn over
+            chit = engine.chits[index]
+            kind = (chit.animal, getattr(chit, "distance", None))
+            if kind not in values:
+                values[kind] = MemoryPolicy.value(engine, kind)
+            total += values[kind]
+        return total / len(chits)
+
+    def rewards(self) -> dict[int, float]:
+        """
+        Scores the game for each player, 1 for the winner, otherwise by how far round the track each
+        token is compared to the others
+
+        Returns:
+            dict[int, float]: the reward of each player from 0 to 1, by player number
+        """
+        engine = self.engine
+        winner = engine.get_winner()
+        if winner:
+            return {number: float(number == int(winner)) for number in engine.players}
+        track = engine.track
+        progress = {}
+        for number, player in engine.players.items():
+            token = player.token
+            position = token.position
+            start = track.entry(token.starting_cave)
+            if position is token.starting_cave:
+                steps = 0
+            elif track.is_cave(position):
+                steps = (track.entry(position) - start) % track.length
+            else:
+                steps = (position.ordinal - start) % track.length + 1
+            progress[number] = steps / (track.length + 1)
+        total = sum(progress.values())
+        others = len(progress) - 1
+        return {number: 0.5 + 0.5 * (steps - (total - steps) / others) for number, steps in progress.items()}
+
+
+# Searches kept by a worker process, so its tree is reused between turns of the same game
+worker_search: ChitSearch | None = None
+worker_layout = None
+
+
+def run_search(layout: dict, players: list[list], number_of_players: int, state: tuple,
+               recall: list[float], budget: float, exploration: float, rollout_turns: int, prior_visits: int,
+               seed: int, rollout_limit: int = 0) -> tuple[dict[int | None, list], int]:
+    """
+    Runs a search in a worker process, see ChitSearch.search
+
+    Args:
+        layout (dict): the board layout, from GameEngine.layout
+        players (list[list]): the players, from GameEngine.player_setup
+        number_of_players (int): number of players
+        state (tuple): key of the state to search from
+        seed (int): seed of the worker's random source for this search
+    Returns:
+        tuple[dict[int | None, list], int]: the root's action statistics and the number of rollouts
+    """
+    global worker_search, worker_layout
+    if worker_search is None or layout != worker_layout:
+        config = SimpleNamespace(number_of_players=number_of_players, get_players=lambda: players)
+        worker_search = ChitSearch(GameEngine.from_layout(layout, config), exploration, rollout_turns, prior_visits)
+        worker_layout = layout
+    stats, rollouts = worker_search.search(GameState.from_key(state), recall, budget, random.Random(seed),
+                                           rollout_limit)
+    # only plain statistics are sent back, not the tree
+    return {action: list(values) for action, values in stats.items()}, rollouts
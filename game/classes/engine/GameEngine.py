@@ -0,0 +1,497 @@
+"""
+Class GameEngine
+
+The rules and state of a game: the board graph, token positions, the chit pool, turn order and the
+memory score. It has no dependency on pygame, so games can be built and played without a display.
+The pygame Board builds its sprites, which extend the engine classes, and hands them to an engine.
+"""
+
+import random
+from types import SimpleNamespace
+from typing import Callable
+
+from classes.concrete.Player import Player
+from classes.concrete.board.VolcanoCard import VolcanoCard
+from classes.engine.BoardNode import BoardNode
+from classes.engine.CaveNode import CaveNode
+from classes.engine.Chit import Chit
+from classes.engine.GameState import GameState
+from classes.engine.ReverseChit import ReverseChit
+from classes.engine.StandardChit import StandardChit
+from classes.engine.TokenState import TokenState
+from classes.engine.TrackIndex import TrackIndex
+from classes.engine.ZobristHash import ZobristHash
+from classes.engine.layout import generate_layout
+from classes.enum.Animal import Animal
+from classes.enum.Colour import Colour
+from classes.utils.rng import game_rng
+
+
+class GameEngine:
+    def __init__(self, volcano_cards: list[VolcanoCard], caves: dict[str, CaveNode], chits: list[Chit],
+                 players: dict[int, Player], number_of_players: int, seed: int | None = None,
+                 rng: random.Random | None = None) -> None:
+        # the game's seed, and the generator CPU players draw from, continuing the one that built the layout
+        self.seed = seed
+        if rng is None:
+            rng = game_rng(seed) if seed is not None else random.Random()
+        self.rng = rng
+        self.volcano_cards = volcano_cards
+        self.caves = caves
+        self.players = players
+        self.number_of_players = number_of_players
+        self.connect_board()
+
+        # hash of the game's state, kept up to date by the nodes, tokens and chits as they change
+        self.zobrist = ZobristHash(len(self.track.nodes), len(chits), number_of_players)
+        self.track.zobrist = self.zobrist
+        for player in self.players.values():
+            player.token.zobrist = self.zobrist
+        self._chits = []
+        self.chits = chits
+
+        self._current_player = None
+        self.current_player = self.players[1]
+        self.current_player.player_turn()
+        self.previous_turn = self.current_player
+        self.max_score = [0, self.current_player]  # init for player
+        self._num_flips = 0
+        self.zobrist.value = self.zobrist.compute(self)
+        # index of the chit flipped most recently
+        self.last_flipped_chit = None
+        # states before each move played with play, for undo
+        self.history: list[GameState] = []
+        # number of turns that have ended, and functions called with the engine after each one
+        self.turn = 0
+        self.turn_listeners: list[Callable[["GameEngine"], None]] = []
+        # records every chit played and turn passed, see classes.utils.replay
+        self.recorder = None
+        # functions called with the engine and the chit's index after each chit is played
+        self.chit_listeners: list[Callable[["GameEngine", int], None]] = []
+
+    @property
+    def chits(self) -> list[Chit]:
+        return self._chits
+
+    @chits.setter
+    def chits(self, chits: list[Chit]) -> None:
+        # chits are hashed by their place in the pool, which changes when the pool is replaced or reordered
+        zobrist = self.zobrist
+        for slot, chit in enumerate(self._chits):
+            if chit.flipped:
+                zobrist.toggle_flipped(slot)
+            chit.zobrist = None
+        for slot, chit in enumerate(chits):
+            chit.slot = slot
+            chit.zobrist = zobrist
+            if chit.flipped:
+                zobrist.toggle_flipped(slot)
+        self._chits = chits
+
+    @property
+    def current_player(self) -> Player:
+        return self._current_player
+
+    @current_player.setter
+    def current_player(self, player: Player) -> None:
+        previous = self._current_player.player_number if self._current_player else 0
+        self._current_player = player
+        self.zobrist.player_changed(previous, player.player_number)
+
+    @property
+    def num_flips(self) -> int:
+        return self._num_flips
+
+    @num_flips.setter
+    def num_flips(self, num_flips: int) -> None:
+        if (num_flips > 0) != (self._num_flips > 0):
+            self.zobrist.toggle_moved()
+        self._num_flips = num_flips
+
+    @classmethod
+    def from_layout(cls, layout: dict[str, list[dict]], config, seed: int | None = None,
+                    rng: random.Random | None = None) -> "GameEngine":
+        """
+        Builds a game without any sprites from a layout or save file
+
+        Args:
+            layout (dict[str, list[dict]]): the "VolcanoCards" and "ChitCards" of the board
+            config (Config): the game configuration
+            seed (int | None): the game's seed
+            rng (random.Random | None): the game's random number generator
+        Returns:
+            GameEngine: the new game
+        """
+        volcano_cards = []
+        caves = {}
+        for saved_volcano_card in layout["VolcanoCards"]:
+            volcano_card = VolcanoCard([BoardNode(Animal[animal]) for animal in saved_volcano_card["tiles"]])
+            if "cave" in saved_volcano_card:
+                saved_cave = saved_volcano_card["cave"]
+                volcano_card.cave = CaveNode(Animal[saved_cave["animal"]], Colour[saved_cave["colour"]])
+                caves[saved_cave["colour"]] = volcano_card.cave
+            volcano_cards.append(volcano_card)
+
+        chits = [cls.generate_single_chit(data) for data in layout["ChitCards"]]
+
+        players = {}
+        for number, colour, human in config.get_players():
+            cave = caves[colour]
+            players[number] = Player(number, colour, TokenState(Colour[colour], cave, cave), bool(human))
+        return cls(volcano_cards, caves, chits, players, config.number_of_players, seed, rng)
+
+    def layout(self) -> dict[str, list[dict]]:
+        """
+        Returns:
+            dict[str, list[dict]]: the "VolcanoCards" and "ChitCards" of the board, as used by from_layout
+        """
+        return {
+            "VolcanoCards": [volcano_card.save() for volcano_card in self.volcano_cards],
+            "ChitCards": [chit.save() for chit in self.chits]
+        }
+
+    def player_setup(self) -> list[list]:
+        """
+        Returns:
+            list[list]: the number, colour and whether each player is human, in the format of Config.players
+        """
+        return [[number, player.colour, int(player.human)] for number, player in sorted(self.players.items())]
+
+    def copy(self) -> "GameEngine":
+        """
+        Builds a game without any sprites in the same state as this one, which can be played without changing it
+
+        Returns:
+            GameEngine: the copy
+        """
+        config = SimpleNamespace(number_of_players=self.number_of_players, get_players=self.player_setup)
+        engine = GameEngine.from_layout(self.layout(), config, self.seed)
+        engine.restore(self.snapshot())
+        return engine
+
+    @classmethod
+    def from_seed(cls, config, seed: int) -> "GameEngine":
+        """
+        Builds a game without any sprites from a seed. The same seed always gives the same game.
+
+        Args:
+            config (Config): the game configuration
+            seed (int): the game's seed
+        Returns:
+            GameEngine: the new game
+        """
+        rng = game_rng(seed)
+        return cls.from_layout(generate_layout(config, rng), config, seed, rng)
+
+    @classmethod
+    def generate(cls, config, rng=random) -> "GameEngine":
+        """
+        Builds a game without any sprites from a random layout
+
+        Args:
+            config (Config): the game configuration
+            rng: source of randomness, the random module or a random.Random instance
+        Returns:
+            GameEngine: the new game
+        """
+        return cls.from_layout(generate_layout(config, rng), config)
+
+    @staticmethod
+    def generate_single_chit(data: dict[str, any]) -> Chit:
+        match data["type"]:
+            case "standard":
+                return StandardChit(Animal[data["animal"]], data["distance"])
+            case "reverse":
+                return ReverseChit(Animal[data["animal"]])
+        raise ValueError(f'{data["type"]} does not match known chit card types')
+
+    def connect_board(self) -> None:
+        # set previous position for all positions on board
+        previous_position = None
+        for volcano_card in self.volcano_cards:
+            for position in volcano_card.get_positions():
+                position.previous_position = previous_position
+                previous_position = position
+        # set previous position for first position to be the final position to close the circle
+        self.volcano_cards[0].get_positions()[0].previous_position = previous_position
+
+        # set next position for all positions on the board
+        for volcano_card in self.volcano_cards:
+            for position in volcano_card.get_positions():
+                position.previous_position.next_position = position
+
+        # number every position, so moves can be looked up instead of walked
+        self.track = TrackIndex(self.volcano_cards)
+
+    def unflipped_chits(self) -> list[int]:
+        """
+        Returns:
+            list[int]: indexes of the chits that are face down
+        """
+        return [i for i, chit in enumerate(self.chits) if not chit.flipped]
+
+    def flip_chit(self, index: int) -> None:
+        """
+        Flips a chit face up for the current player
+
+        Args:
+            index (int): index of the chit in the chit pool
+        """
+        self.chits[index].flip_card()
+        self.last_flipped_chit = index
+
+    def play_chit(self, index: int) -> None:
+        """
+        Flips a chit and immediately applies it, as the board does once its flip timer runs out
+
+        Args:
+            index (int): index of the chit in the chit pool
+        """
+        self.flip_chit(index)
+        self.card_flipped(index)
+
+    def play(self, index: int) -> None:
+        """
+        Plays a chit like play_chit, keeping the state before the move so it can be undone
+
+        Args:
+            index (int): index of the chit in the chit pool
+        """
+        self.history.append(self.snapshot())
+        self.play_chit(index)
+
+    def end_turn(self) -> None:
+        """
+        Ends the current player's turn like next_player, keeping the state before it so it can be undone
+        """
+        self.history.append(self.snapshot())
+        self.next_player()
+
+    def undo(self) -> None:
+        """
+        Reverts the last move or turn played with play or end_turn
+        """
+        self.restore(self.history.pop())
+
+    def snapshot(self) -> GameState:
+        """
+        Captures the current state of the game
+
+        Returns:
+            GameState: the state
+        """
+        players = [self.players[number] for number in sorted(self.players)]
+        occupied = 0
+        for ordinal, node in enumerate(self.track.nodes):
+            if node.occupied:
+                occupied |= 1 << ordinal
+        flipped = 0
+        for index, chit in enumerate(self.chits):
+            if chit.flipped:
+                flipped |= 1 << index
+        winner = self.get_winner()
+        return GameState(
+            tuple(player.token.position.ordinal for player in players),
+            tuple(player.token.total_moves for player in players),
+            occupied,
+            flipped,
+            self.current_player.player_number,
+            self.previous_turn.player_number,
+            self.num_flips,
+            self.max_score[0],
+            self.max_score[1].player_number,
+            int(winner) if winner else 0,
+            self.turn
+        )
+
+    def state_hash(self) -> int:
+        """
+        Returns:
+            int: the Zobrist hash of the token positions, occupied positions, face up chits, current player and
+                whether they have moved this turn, equal for equal states however the game reached them
+        """
+        return self.zobrist.value
+
+    def restore(self, state: GameState) -> None:
+        """
+        Puts the game back into a captured state. Only the objects that differ are changed,
+        so views only redraw what moved.
+
+        Args:
+            state (GameState): the state to restore
+        """
+        for ordinal, node in enumerate(self.track.nodes):
+            occupied = bool(state.occupied >> ordinal & 1)
+            if node.occupied != occupied:
+                node.occupied = occupied
+        for index, chit in enumerate(self.chits):
+            flipped = bool(state.flipped >> index & 1)
+            if chit.flipped != flipped:
+                chit.set_flipped(flipped)
+
+        for number, player in self.players.items():
+            token = player.token
+            position = self.track.node(state.positions[number - 1])
+            if token.position is not position:
+                token.move_to_position(position)
+            token.total_moves = state.total_moves[number - 1]
+            token.has_won = state.winner == number
+            if number == state.current_player and not player.is_player_turn:
+                player.player_turn()
+            elif number != state.current_player and player.is_player_turn:
+                player.player_finish()
+
+        self.current_player = self.players[state.current_player]
+        self.previous_turn = self.players[state.previous_turn]
+        self.num_flips = state.num_flips
+        self.max_score[0] = state.max_score
+        self.max_score[1] = self.players[state.max_score_player]
+        self.turn = state.turn
+
+    def card_flipped(self, index: int = None) -> None:
+        """
+        Moves player token appropriate based on chit card and end's turn if wrong animal on chit card
+
+        Args:
+            index (int): index of the flipped chit, defaults to the last flipped chit
+        Returns:
+            None
+        """
+        if index is None:
+            index = self.last_flipped_chit
+        if index is None:
+            return
+        chit = self.chits[index]
+        token = self.current_player.token
+        turn, player_number, start = self.turn, self.current_player.player_number, token.position.ordinal
+        if chit.animal in [token.position.animal, Animal["PIRATE"]]:
+            try:
+                token.move_token(chit.get_destination())
+                if self.current_player == self.previous_turn:
+                    self.num_flips += 1
+                if self.num_flips > self.max_score[0]:
+                    self.max_score[0] = self.num_flips
+                    self.max_score[1] = self.current_player
+
+            except Exception as e:
+                self.next_player()
+        elif chit.animal == Animal["REVERSE"]:
+            distance, destination = chit.get_destination(token.position)
+            valid = token.verify_move(distance, destination)
+            if valid:
+                token.place_token(distance, destination)
+        else:
+            self.next_player()
+
+        if self.recorder is not None:
+            self.recorder.chit_played(self, turn, player_number, index, start)
+        for listener in self.chit_listeners:
+            listener(self, index)
+
+    def pass_turn(self) -> None:
+        """
+        Ends the current player's turn without playing a chit, when they choose to stop
+        """
+        turn, player_number = self.turn, self.current_player.player_number
+        self.next_player()
+        if self.recorder is not None:
+            self.recorder.turn_passed(self, turn, player_number)
+
+    def next_player(self) -> None:
+        """
+        Starts the next player's turn
+
+        Returns:
+            None
+        """
+        # only chits that were flipped change, so only they are redrawn
+        for chit in self.chits:
+            if chit.flipped:
+                chit.reset_card()
+
+        self.num_flips = 0
+        self.current_player.player_finish()
+        current_player_number = self.current_player.player_number
+        # Set previous player's turn to false
+        if current_player_number == self.number_of_players:
+            next_player_number = 1
+        else:
+            next_player_number = current_player_number + 1
+        self.current_player = self.players[next_player_number]
+        # flag for player's turn start so that it trigger the cave
+        self.current_player.player_turn()
+        self.previous_turn = self.current_player
+
+        self.turn += 1
+        for listener in self.turn_listeners:
+            listener(self)
+
+    def save(self) -> dict[str, list[dict]]:
+        """
+        Collects the state of every part of the game into one save document
+
+        Returns:
+            dict[str, list[dict]]: the save document, in the save file format
+        """
+        return {
+            **self.layout(),
+            "Players": [player.save() for player in self.players.values()],
+            "MemoryScore": [{
+                "score": self.max_score[0],
+                "player": self.max_score[1].player_number
+            }],
+            "Autosave": [{"turn": self.turn}],
+            "Seed": [{"seed": self.seed}]
+        }
+
+    def load(self, save: dict[str, list[dict]]) -> None:
+        """
+        Loads the players, memory score and turn of a save into a game built from the save's layout
+
+        Args:
+            save (dict[str, list[dict]]): the save document
+        """
+        self.current_player.player_finish()
+        for saved_player in save["Players"]:
+            player = self.players[saved_player["player_num"]]
+            player.load(saved_player)
+            if saved_player["current_player"]:
+                self.current_player = player
+        if not self.current_player.is_player_turn:
+            self.current_player.player_turn()
+        self.previous_turn = self.current_player
+
+        memory_score = save["MemoryScore"][0]
+        self.max_score[0] = memory_score["score"]
+        self.max_score[1] = self.players[memory_score["player"]]
+
+        # keep counting turns from the save, so later autosaves are newer than it
+        if "Autosave" in save:
+            self.turn = save["Autosave"][0]["turn"]
+        # carry on the saved game's seed, with a stream of its own for each turn the game is resumed from
+        if save.get("Seed") and save["Seed"][0]["seed"] is not None:
+            self.seed = save["Seed"][0]["seed"]
+            self.rng = game_rng(self.seed, "resume", self.turn)
+
+    def player_has_won(self) -> bool:
+        """
+        Check's if any player has won
+
+        Returns:
+            bool
+        """
+        for player in self.players.values():
+            if player.token.has_won:
+                return True
+        return False
+
+    def get_winner(self) -> str:
+        """
+        Gets the game winner
+
+        Returns:
+            winning player number as a string
+        """
+        for player in self.players.values():
+            if player.token.has_won:
+                return str(player.player_number)
@@ -0,0 +1,79 @@
+"""
+Class GameState
+
+A compact, immutable snapshot of everything that changes during a game: token positions as track
+ordinals, occupancy and flipped chits as bitmasks, whose turn it is, the turn count and the memory score.
+Snapshots are plain tuples and integers, so they are cheap to keep for undo, search and replays.
+The board layout itself never changes during a game, so it is not part of the state.
+"""
+
+
+class GameState:
+    __slots__ = ("positions", "total_moves", "occupied", "flipped", "current_player", "previous_turn",
+                 "num_flips", "max_score", "max_score_player", "winner", "turn")
+
+    def __init__(self, positions: tuple[int, ...], total_moves: tuple[int, ...], occupied: int, flipped: int,
+                 current_player: int, previous_turn: int, num_flips: int, max_score: int, max_score_player: int,
+                 winner: int, turn: int) -> None:
+        # node ordinal of each player's token, indexed by player number - 1
+        self.positions = positions
+        # total_moves of each player's token, indexed by player number - 1
+        self.total_moves = total_moves
+        # bit i is set if the node with ordinal i is occupied
+        self.occupied = occupied
+        # bit i is set if chit i is face up
+        self.flipped = flipped
+        self.current_player = current_player
+        self.previous_turn = previous_turn
+        self.num_flips = num_flips
+        self.max_score = max_score
+        self.max_score_player = max_score_player
+        # number of the winning player, 0 while nobody has won
+        self.winner = winner
+        # number of turns played since the start of the game
+        self.turn = turn
+
+    def copy(self) -> "GameState":
+        """
+        Returns:
+            GameState: a new state with the same values
+        """
+        return GameState(self.positions, self.total_moves, self.occupied, self.flipped, self.current_player,
+                         self.previous_turn, self.num_flips, self.max_score, self.max_score_player, self.winner,
+                         self.turn)
+
+    def key(self) -> tuple:
+        """
+        Returns:
+            tuple: every value of the state, for comparing and hashing states
+        """
+        return (self.positions, self.total_moves, self.occupied, self.flipped, self.current_player,
+                self.previous_turn, self.num_flips, self.max_score, self.max_score_player, self.winner, self.turn)
+
+    @classmethod
+    def from_key(cls, key) -> "GameState":
+        """
+        Builds a state from the values returned by key, or the same values read back from JSON
+
+        Args:
+            key (tuple | list): every value of the state, in the order of key
+        Returns:
+            GameState: the state
+        """
+        return cls(tuple(key[0]), tuple(key[1]), *key[2:])
+
+    def is_flipped(self, chit: int) -> bool:
+        return bool(self.flipped >> chit & 1)
+
+    def is_occupied(self, ordinal: int) -> bool:
+        return bool(self.occupied >> ordinal & 1)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, GameState) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        return (f"GameState(turn={self.turn}, player={self.current_player}, positions={self.positions}, "
+                f"winner={self.winner})")
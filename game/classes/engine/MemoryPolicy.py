@@ -0,0 +1,161 @@
+"""
+Class MemoryPolicy
+
+Plays the memory game: remembers the chits revealed in earlier turns, forgetting them a little more
+with every turn that passes, and flips the chit with the best expected move for the token's position.
+Chits it does not remember are valued by what is left of the chit pool once the remembered chits are
+taken out of it. Moves are planned on the track index, so a decision takes well under a millisecond.
+"""
+
+from classes.engine.CPUPolicy import CPUPolicy
+from classes.enum.Animal import Animal
+
+# Value of landing in the player's own cave, ahead of any other move
+WIN_VALUE = 1000.0
+# Rough worth of keeping the turn after a successful move, as it allows another flip
+CONTINUE_VALUE = 0.5
+
+
+class MemoryPolicy(CPUPolicy):
+    name = "memory"
+
+    def __init__(self, decay: float = 0.8) -> None:
+        """
+        Args:
+            decay (float): how much of a revealed chit is still remembered after each turn, from 0 which
+                forgets chits as soon as the turn ends, to 1 which never forgets them
+        """
+        self.decay = decay
+        # the game being followed
+        self.engine = None
+        # turn each chit was last seen face up in, by chit index
+        self.seen: dict[int, int] = {}
+        # (animal, distance) of each chit, distance is None for REVERSE chits
+        self.kinds: list[tuple[Animal, int | None]] = []
+
+    @classmethod
+    def from_config(cls, config) -> "MemoryPolicy":
+        return cls(config.cpu_memory_decay)
+
+    def watch(self, engine) -> None:
+        self.engine = engine
+        self.seen = {}
+        self.kinds = [(chit.animal, getattr(chit, "distance", None)) for chit in engine.chits]
+        engine.chit_listeners.append(self.chit_revealed)
+
+    def chit_revealed(self, engine, index: int) -> None:
+        """
+        Called by the engine after a chit is played, whichever player played it
+
+        Args:
+            engine (GameEngine): the game
+            index (int): index of the chit
+        """
+        self.seen[index] = engine.turn
+
+    def recall(self, index: int, turn: int) -> float:
+        """
+        Args:
+            index (int): index of a face down chit
+            turn (int): the current turn
+        Returns:
+            float: how well the chit is remembered, from 0 for never seen to 1 for seen this turn
+        """
+        seen = self.seen.get(index)
+        if seen is None:
+            return 0.0
+        return self.decay ** (turn - seen)
+
+    def recall_all(self, engine) -> list[float]:
+        """
+        Returns:
+            list[float]: how well each chit is remembered, by chit index, face up chits are known for certain
+        """
+        return [1.0 if chit.flipped else self.recall(index, engine.turn) for index, chit in enumerate(engine.chits)]
+
+    def choose_chit(self, engine, rng) -> int | None:
+        if engine is not self.engine:
+            self.watch(engine)
+        chits = engine.unflipped_chits()
+        if not chits:
+            return None
+
+        expected_values = self.expected_values(engine, self.kinds, self.recall_all(engine), chits)
+        best = []
+        best_value = None
+        for index in chits:
+            expected = expected_values[index]
+            if best_value is None or expected > best_value + 1e-9:
+                best, best_value = [index], expected
+            elif expected > best_value - 1e-9:
+                best.append(index)
+
+        # after moving this turn, stop rather than flip a chit that is expected to lose ground
+        if best_value < 0 and engine.num_flips > 0:
+            return None
+        return best[rng.randrange(len(best))] if len(best) > 1 else best[0]
+
+    @classmethod
+    def expected_values(cls, engine, kinds: list[tuple[Animal, int | None]], recall: list[float],
+                        chits: list[int]) -> dict[int, float]:
+        """
+        Values flipping each of some face down chits, blending what is remembered of the chit with
+        what is left of the chit pool once every remembered chit is taken out of it
+
+        Args:
+            engine (GameEngine): the game
+            kinds (list[tuple[Animal, int | None]]): the animal and distance of each chit, by chit index
+            recall (list[float]): how well each chit is remembered, by chit index
+            chits (list[int]): indexes of the chits to value
+        Returns:
+            dict[int, float]: the expected value of each chit, see value
+        """
+        values = {}
+        # how much of each kind of chit is still unaccounted for
+        unknown = {}
+        for kind, known in zip(kinds, recall):
+            if kind not in values:
+                values[kind] = cls.value(engine, kind)
+                unknown[kind] = 0.0
+            unknown[kind] += 1.0 - known
+
+        unknown_total = sum(unknown.values())
+        unknown_value = sum(values[kind] * mass for kind, mass in unknown.items()) / unknown_total \
+            if unknown_total else 0.0
+        return {index: recall[index] * values[kinds[index]] + (1.0 - recall[index]) * unknown_value
+                for index in chits}
+
+    @staticmethod
+    def value(engine, kind: tuple[Animal, int | None]) -> float:
+        """
+        Values flipping a kind of chit for the current player, as the distance the token moves forward,
+        plus the worth of keeping the turn if the chit does not end it
+
+        Args:
+            engine (GameEngine): the game
+            kind (tuple[Animal, int | None]): the chit's animal and distance
+        Returns:
+            float: the value
+        """
+        animal, distance = kind
+        token = engine.current_player.token
+        if animal == Animal["REVERSE"]:
+            distance, destination = token.position.nearest_cave()
+            if distance == 0 or destination.occupied:
+                # nothing happens, and the turn carries on
+                return CONTINUE_VALUE
+            return distance + CONTINUE_VALUE
+        if animal == Animal["PIRATE"] or animal == token.position.animal:
+            try:
+                destination, won = token.plan_move(distance, report=False)
+            except Exception:
+                # an invalid move ends the turn
+                return 0.0
+            if won:
+                return WIN_VALUE
+            if destination is token.position:
+                # PIRATE chits cannot move a token out of another player's cave
+                return CONTINUE_VALUE
+            return distance + CONTINUE_VALUE
+        # the wrong animal ends the turn
+        return 0.0
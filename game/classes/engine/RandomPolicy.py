@@ -0,0 +1,17 @@
+"""
+Class RandomPolicy
+
+Flips a random face down chit, the way CPU players have always played.
+"""
+
+from classes.engine.CPUPolicy import CPUPolicy
+
+
+class RandomPolicy(CPUPolicy):
+    name = "random"
+
+    def choose_chit(self, engine, rng) -> int | None:
+        chits = engine.unflipped_chits()
+        if not chits:
+            return None
+        return chits[rng.randrange(len(chits))]
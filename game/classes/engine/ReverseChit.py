@@ -0,0 +1,29 @@
+"""
+Class ReverseChit
+
+A chit that sends the token back to the nearest unoccupied cave.
+"""
+
+from classes.engine.Chit import Chit
+
+
+class ReverseChit(Chit):
+    def find_nearest_cave(self, position) -> tuple[int, any]:
+        return position.nearest_cave()
+
+    def get_destination(self, position=None) -> int:
+        if position:
+            return self.find_nearest_cave(position)
+        else:
+            return 0
+
+    def save(self) -> dict:
+        """
+        gets the current state of the chit card for a save file
+        """
+        chit_card = {
+            "animal": self.animal.value,
+            "type": "reverse"
+        }
+
+        return chit_card
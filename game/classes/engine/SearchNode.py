@@ -0,0 +1,27 @@
+"""
+Class SearchNode
+
+A node of a CPU search tree: a public state of the game, reached by any of the hidden chit layouts the
+search samples and by any order of moves. It keeps the visit count and total reward of each action the
+player to move can take. Nodes are found by the Zobrist hash of their state in the search's transposition
+table, which also links them to the nodes reached from them.
+"""
+
+class SearchNode:
+    __slots__ = ("player", "actions", "visits", "stats")
+
+    def __init__(self, player: int, actions: list[int | None]) -> None:
+        # number of the player to move
+        self.player = player
+        # chit indexes that can be flipped, None ends the turn
+        self.actions = actions
+        self.visits = 0
+        # [visits, total reward of the player to move] of each action that has been tried
+        self.stats: dict[int | None, list] = {}
+
+    def untried(self) -> list[int | None]:
+        """
+        Returns:
+            list[int | None]: the actions that have not been tried yet
+        """
+        return [action for action in self.actions if action not in self.stats]
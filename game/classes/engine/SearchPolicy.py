@@ -0,0 +1,121 @@
+"""
+Class SearchPolicy
+
+Chooses chits by Monte Carlo tree search within a time budget for each flip, see ChitSearch. The chits
+it remembers are followed the same way as MemoryPolicy, and the rest are hidden from the search.
+With worker processes, each worker searches its own tree for the same budget and the visit counts of
+the root actions are added up, so more workers play more rollouts in the same time.
+"""
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from classes.engine.ChitSearch import ChitSearch, run_search
+from classes.engine.MemoryPolicy import MemoryPolicy
+
+# Worker processes shared by every search policy in the process, started by the first search that uses them
+search_executor: ProcessPoolExecutor | None = None
+search_executor_workers = 0
+
+
+def search_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns:
+        ProcessPoolExecutor: the shared worker processes, restarted with more workers if there are too few
+    """
+    global search_executor, search_executor_workers
+    if search_executor is None or search_executor_workers < workers:
+        if search_executor is not None:
+            search_executor.shutdown(wait=False)
+        search_executor = ProcessPoolExecutor(workers)
+        search_executor_workers = workers
+    return search_executor
+
+
+class SearchPolicy(MemoryPolicy):
+    name = "search"
+
+    def __init__(self, budget_ms: int = 100, workers: int = 0, exploration: float = 0.2, rollout_turns: int = 1,
+                 prior_visits: int = 20, decay: float = 0.8, rollouts: int = 0) -> None:
+        """
+        Args:
+            budget_ms (int): time to search for each flip, in milliseconds
+            workers (int): worker processes searching alongside the calling thread, 0 only searches on the calling thread
+            exploration (float): weight of the exploration term of the upper confidence bound
+            rollout_turns (int): number of turns played after leaving the tree
+            prior_visits (int): virtual visits valued by the memory policy given to each new action, see ChitSearch
+            decay (float): how much of a revealed chit is still remembered after each turn, see MemoryPolicy
+            rollouts (int): rollouts played for each flip instead of searching for budget_ms, so the same seed
+                plays the same game on any machine, 0 uses budget_ms
+        """
+        super().__init__(decay)
+        self.budget_ms = budget_ms
+        self.workers = workers
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.prior_visits = prior_visits
+        self.rollout_limit = rollouts
+        self.search: ChitSearch | None = None
+        # rollouts played and time spent searching over every decision, to report the search throughput
+        self.rollouts = 0
+        self.search_seconds = 0.0
+        self.decisions = 0
+
+    @classmethod
+    def from_config(cls, config) -> "SearchPolicy":
+        return cls(config.search_budget_ms, config.search_workers, config.search_exploration,
+                   config.search_rollout_turns, config.search_prior_visits, config.cpu_memory_decay,
+                   config.search_rollouts)
+
+    def watch(self, engine) -> None:
+        super().watch(engine)
+        # the search plays on its own copy of the game, built at the first decision
+        self.search = None
+
+    def choose_chit(self, engine, rng) -> int | None:
+        if engine is not self.engine:
+            self.watch(engine)
+        chits = engine.unflipped_chits()
+        if not chits:
+            return None
+
+        start = time.perf_counter()
+        if self.search is None:
+            self.search = ChitSearch(engine.copy(), self.exploration, self.rollout_turns, self.prior_visits)
+        state = engine.snapshot()
+        recall = self.recall_all(engine)
+        budget = self.budget_ms / 1000
+        # the number of rollouts depends on the speed of the machine, so the search draws from a generator
+        # of its own, and the game's stream moves on by the same amount for every decision
+        search_rng = random.Random(rng.getrandbits(64))
+
+        futures = []
+        if self.workers:
+            pool = search_pool(self.workers)
+            layout, players = engine.layout(), engine.player_setup()
+            futures = [pool.submit(run_search, layout, players, engine.number_of_players, state.key(),
+                                   recall, budget, self.exploration, self.rollout_turns, self.prior_visits,
+                                   rng.getrandbits(64), self.rollout_limit)
+                       for _ in range(self.workers)]
+        stats, rollouts = self.search.search(state, recall, budget, search_rng, self.rollout_limit)
+        visits = {action: values[0] for action, values in stats.items()}
+        for future in futures:
+            worker_stats, worker_rollouts = future.result()
+            rollouts += worker_rollouts
+            for action, values in worker_stats.items():
+                visits[action] = visits.get(action, 0) + values[0]
+
+        self.rollouts += rollouts
+        self.search_seconds += time.perf_counter() - start
+        self.decisions += 1
+        most = max(visits.values())
+        best = [action for action, count in visits.items() if count == most]
+        return best[search_rng.randrange(len(best))] if len(best) > 1 else best[0]
+
+    def rollouts_per_second(self) -> float:
+        """
+        Returns:
+            float: rollouts played per second of searching, over every decision so far
+        """
+        return self.rollouts / self.search_seconds if self.search_seconds else 0.0
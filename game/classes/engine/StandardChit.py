@@ -0,0 +1,29 @@
+"""
+Class StandardChit
+
+A chit that moves the token a fixed distance, backwards for PIRATE chits.
+"""
+
+from classes.engine.Chit import Chit
+from classes.enum.Animal import Animal
+
+
+class StandardChit(Chit):
+    def __init__(self, animal: Animal, distance: int):
+        super().__init__(animal)
+        self.distance = distance
+
+    def save(self) -> dict:
+        """
+        gets the current state of the chit card for a save file
+        """
+        chit_card = {
+            "animal": self.animal.value,
+            "type": "standard",
+            "distance": self.distance
+        }
+
+        return chit_card
+
+    def get_destination(self, position=None) -> int:
+        return self.distance
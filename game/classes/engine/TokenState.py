@@ -0,0 +1,168 @@
+"""
+Class TokenState
+
+The position and movement rules of a player's token, without any rendering.
+"""
+
+from classes.engine.BoardNode import BoardNode
+from classes.engine.CaveNode import CaveNode
+from classes.enum.Colour import Colour
+
+
+class TokenState:
+    def __init__(self, colour: Colour, position: BoardNode, starting_cave: CaveNode):
+        self.colour = colour
+        self.position = position
+        self.token_active = False
+        self.has_won = False
+        self.starting_cave = starting_cave
+        self.position_before_move = starting_cave
+        self.total_moves = 0
+        # whether invalid and winning moves are printed, copies of the game played by CPU searches stay quiet
+        self.report = True
+        # hash of the game the token is in, set by the engine
+        self.zobrist = None
+
+    def plan_move(self, distance: int, report: bool = True) -> tuple[BoardNode, bool]:
+        """
+        Works out where a move ends using the track index, with the same rules as stepping along the track
+        one position at a time: tokens win by landing exactly in their own cave, cannot move past it once they
+        have left, cannot move back past it, and cannot end on an occupied position.
+
+        Args:
+            distance (int): distance to move, negative distances move backwards
+            report (bool): whether invalid and winning moves are printed, CPU policies plan moves quietly
+        Returns:
+            tuple[BoardNode, bool]: the destination and whether the move wins the game
+        Throws:
+            Exception: "Invalid move"
+        """
+        track = self.position.track
+        own_entry = track.entry(self.starting_cave)
+        if distance > 0:
+            if track.is_cave(self.position):
+                # leaving a cave takes the first step onto the tile it is attached to
+                start = track.entry(self.position)
+                steps = distance - 1
+            else:
+                start = self.position.ordinal
+                steps = distance
+            if self.total_moves > 1:
+                # number of steps before the token is on the tile in front of its own cave
+                to_cave = (own_entry - start) % track.length
+                if to_cave < steps:
+                    if to_cave == steps - 1:
+                        if report:
+                            print('Player has won!')
+                        return self.starting_cave, True
+                    if report:
+                        print("Cannot move beyond cave")
+                    raise Exception("Invalid move")
+            destination = track.tile(start + steps)
+
+        elif distance < 0:
+            if track.is_cave(self.position):
+                if self.position.colour == self.colour:
+                    if report:
+                        print("Cannot move back further than starting cave")
+                    raise Exception("Invalid move")
+                # caves have no previous position, so the token stays where it is
+                return self.position, False
+            start = self.position.ordinal
+            steps = -distance
+            to_cave = (start - own_entry) % track.length
+            if to_cave < steps:
+                if to_cave == steps - 1:
+                    return self.starting_cave, False
+                if report:
+                    print("Cannot move back further than starting cave")
+                raise Exception("Invalid move")
+            destination = track.tile(start - steps)
+
+        else:
+            return self.position, False
+
+        if destination.occupied:
+            if report:
+                print("Position is already occupied, cannot move")
+            raise Exception("Invalid move")
+        return destination, False
+
+    def move_to_position(self, new_position: BoardNode):
+        """move the token to a new position
+
+        Args:
+            new_position (BoardNode): new position to move to
+        """
+        if self.zobrist is not None:
+            self.zobrist.token_moved(self.colour, self.position.ordinal, new_position.ordinal)
+        self.position = new_position
+        self.position_changed()
+
+    def position_changed(self) -> None:
+        """Called whenever the token's position changes, so views can follow it. Does nothing in the engine.
+        """
+        pass
+
+    def move_token(self, distance: int):
+        """move the token a certain distance
+
+        Args:
+            distance (int): distance to move
+        """
+        self.position.occupied = False
+        self.position_before_move = self.position
+        try:
+            destination, won = self.plan_move(distance, self.report)
+        except Exception as e:
+            self.undo_move()
+            raise e
+
+        if destination is not self.position:
+            self.move_to_position(destination)
+        self.has_won = self.has_won or won
+        self.total_moves += distance
+        self.position.occupied = True
+
+    def verify_move(self, distance: int, position: BoardNode) -> bool:
+        if distance != 0:
+            if position.occupied:
+                return False
+            else:
+                return True
+        else:
+            return False
+
+    def place_token(self, distance: int, position: BoardNode) -> None:
+        self.position.occupied = False
+        self.position_before_move = self.position
+        try:
+            self.move_to_position(position)
+        except Exception as e:
+            self.undo_move()
+            raise e
+        # Update places moved to accommodate for the shift in board position
+        self.total_moves += distance
+        self.position.occupied = True
+
+    def undo_move(self):
+        """
+        Revert's a movements of token if the entire move cannot complete
+
+        Returns:
+            None
+        """
+        self.move_to_position(self.position_before_move)
+        self.position.occupied = True
+
+    def token_turn(self) -> None:
+        """Set the token to active and highlight the starting cave
+        """
+        self.token_active = True
+        self.starting_cave.highlight_cave()
+
+    def token_finish(self) -> None:
+        """Set the token to inactive and unhighlight the starting cave
+        """
+        self.token_active = False
+        self.starting_cave.non_highlight_cave()
@@ -0,0 +1,150 @@
+"""
+Class TrackIndex
+
+Array-backed index of the circular track, built once per game after the board is connected.
+Every node is given an ordinal: track tiles are numbered in board order, followed by the caves.
+Moves and lookups then become arithmetic on ordinals instead of walks along the linked positions.
+
+The index also keeps, for every tile, the nearest unoccupied cave behind it. The table is updated
+when a cave's occupancy changes, so REVERSE chits never search the track. Every change of occupancy is
+also passed on to the game's Zobrist hash.
+"""
+
+from classes.engine.BoardNode import BoardNode
+from classes.engine.CaveNode import CaveNode
+
+
+class TrackIndex:
+    def __init__(self, volcano_cards: list) -> None:
+        # ordinal -> node, track tiles first and then caves
+        self.nodes: list[BoardNode] = []
+        # hash of the game, set by the engine once the board is indexed
+        self.zobrist = None
+        # ordinal of the tile each cave is attached to, indexed by cave ordinal - length
+        self.cave_entries: list[int] = []
+
+        for volcano_card in volcano_cards:
+            self.nodes.extend(volcano_card.get_positions())
+        # number of tiles on the track
+        self.length = len(self.nodes)
+        for ordinal, node in enumerate(self.nodes):
+            node.ordinal = ordinal
+            node.track = self
+
+        self.caves: list[CaveNode] = [volcano_card.cave for volcano_card in volcano_cards if volcano_card.cave]
+        for cave in self.caves:
+            cave.ordinal = len(self.nodes)
+            self.nodes.append(cave)
+            self.cave_entries.append(cave.next_position.ordinal)
+
+        # tile ordinal -> (distance, cave) of the nearest unoccupied cave behind it
+        self.nearest: list[tuple[int, CaveNode | None]] = [(0, None)] * self.length
+        for cave in self.caves:
+            if not cave.occupied:
+                self.update_nearest(self.entry(cave))
+        # caves report occupancy changes once they are indexed
+        for cave in self.caves:
+            cave.track = self
+
+    def node(self, ordinal: int) -> BoardNode:
+        """
+        Args:
+            ordinal (int): ordinal of a tile or cave
+        Returns:
+            BoardNode: the node with that ordinal
+        """
+        return self.nodes[ordinal]
+
+    def tile(self, ordinal: int) -> BoardNode:
+        """
+        Gets a track tile, wrapping around the track
+
+        Args:
+            ordinal (int): ordinal of the tile, any integer
+        Returns:
+            BoardNode: the tile
+        """
+        return self.nodes[ordinal % self.length]
+
+    def entry(self, cave: CaveNode) -> int:
+        """
+        Args:
+            cave (CaveNode): a cave on the board
+        Returns:
+            int: ordinal of the tile the cave is attached to
+        """
+        return self.cave_entries[cave.ordinal - self.length]
+
+    def nearest_cave(self, node: BoardNode) -> tuple[int, CaveNode | None]:
+        """
+        Looks up the nearest unoccupied cave behind a node, counting the step into the cave
+
+        Args:
+            node (BoardNode): the node to start from
+        Returns:
+            tuple[int, CaveNode | None]: the negative distance to the cave and the cave,
+                or (0, None) if the node is a cave or every cave is occupied
+        """
+        if self.is_cave(node):
+            return 0, None
+        return self.nearest[node.ordinal]
+
+    def occupied_changed(self, node: BoardNode) -> None:
+        """
+        Updates the game's hash, and the nearest cave table if the node is a cave, after a node becomes
+        occupied or unoccupied
+
+        Args:
+            node (BoardNode): the node that changed
+        """
+        if self.zobrist is not None:
+            self.zobrist.toggle_occupied(node.ordinal)
+        if node.ordinal >= self.length:
+            self.update_nearest(self.entry(node))
+
+    def update_nearest(self, entry: int) -> None:
+        """
+        Recalculates the nearest cave for the tiles from a cave entry up to the next unoccupied cave,
+        which are the only tiles whose nearest cave can change
+        """
+        length = self.length
+        # the unoccupied cave closest behind the entry, which may be the entry's own cave,
+        # and the number of tiles until the next unoccupied cave ahead of it
+        source = None
+        behind = length
+        ahead = length
+        for cave in self.caves:
+            if cave.occupied:
+                continue
+            cave_entry = self.cave_entries[cave.ordinal - length]
+            if (entry - cave_entry) % length < behind:
+                source = cave
+                behind = (entry - cave_entry) % length
+            if 0 < (cave_entry - entry) % length < ahead:
+                ahead = (cave_entry - entry) % length
+
+        for step in range(ahead):
+            if source:
+                self.nearest[(entry + step) % length] = (-behind - step - 1, source)
+            else:
+                self.nearest[(entry + step) % length] = (0, None)
+
+    def is_cave(self, node: BoardNode) -> bool:
+        return node.ordinal >= self.length
+
+    def offset(self, node: BoardNode, distance: int) -> BoardNode:
+        """
+        Gets the node a distance along the track from another node. A cave counts as one step before the
+        tile it is attached to.
+
+        Args:
+            node (BoardNode): the node to start from
+            distance (int): number of tiles to move, negative distances move backwards
+        Returns:
+            BoardNode: the node at that distance
+        """
+        if distance == 0:
+            return node
+        if self.is_cave(node):
+            return self.tile(self.entry(node) - 1 + distance)
+        return self.tile(node.ordinal + distance)
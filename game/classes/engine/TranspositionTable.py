@@ -0,0 +1,131 @@
+"""
+Class TranspositionTable
+
+Fixed size table of values by the Zobrist hash of a state, so a state reached by different orders of moves
+is looked up once. Slots are kept in buckets of two, indexed by the low bits of the hash, and each slot keeps
+the full hash to tell apart the states that share a bucket.
+
+When both slots of a bucket are taken by other states, the new value replaces an entry stored before the
+current generation, and otherwise the entry with the lower weight, so the values most worth keeping stay in
+the table however long it is used. Values of the current generation are only replaced by values at least as
+heavy as them when the bucket is full.
+"""
+
+from typing import Callable
+
+# Number of slots is 2 ** DEFAULT_BITS
+DEFAULT_BITS = 18
+
+
+class TranspositionTable:
+    def __init__(self, bits: int = DEFAULT_BITS, weight: Callable[[object], float] | None = None) -> None:
+        """
+        Args:
+            bits (int): the table has 2 ** bits slots
+            weight (Callable[[object], float] | None): how much a value is worth keeping, values of the current
+                generation are never replaced by lighter ones. None always replaces the second slot of a bucket.
+        """
+        self.size = 1 << bits
+        # index of the first slot of a bucket from a hash
+        self.mask = self.size - 2
+        self.weight = weight
+        self.keys: list[int | None] = [None] * self.size
+        self.values: list = [None] * self.size
+        self.generations: list[int] = [0] * self.size
+        # increased by new_generation, entries stored before it are replaced first
+        self.generation = 0
+        self.entries = 0
+        self.hits = 0
+        self.misses = 0
+        self.replacements = 0
+        # stores refused because both slots held heavier values of the current generation
+        self.rejections = 0
+
+    def get(self, key: int):
+        """
+        Args:
+            key (int): hash of the state
+        Returns:
+            the value stored for the state, or None
+        """
+        index = key & self.mask
+        keys = self.keys
+        if keys[index] == key:
+            self.hits += 1
+            return self.values[index]
+        if keys[index + 1] == key:
+            self.hits += 1
+            return self.values[index + 1]
+        self.misses += 1
+        return None
+
+    def store(self, key: int, value) -> bool:
+        """
+        Stores the value of a state, replacing an entry of its bucket if both slots are taken
+
+        Args:
+            key (int): hash of the state
+            value: the value to store
+        Returns:
+            bool: whether the value was stored
+        """
+        index = key & self.mask
+        keys = self.keys
+        generations = self.generations
+        if keys[index] == key:
+            slot = index
+        elif keys[index + 1] == key:
+            slot = index + 1
+        elif keys[index] is None:
+            slot = index
+            self.entries += 1
+        elif keys[index + 1] is None:
+            slot = index + 1
+            self.entries += 1
+        elif generations[index] != self.generation:
+            slot = index
+            self.replacements += 1
+        elif generations[index + 1] != self.generation:
+            slot = index + 1
+            self.replacements += 1
+        elif self.weight is None:
+            slot = index + 1
+            self.replacements += 1
+        else:
+            # replace the lighter of the two, if the new value is at least as heavy
+            first, second = self.weight(self.values[index]), self.weight(self.values[index + 1])
+            slot = index if first < second else index + 1
+            if self.weight(value) < min(first, second):
+                self.rejections += 1
+                return False
+            self.replacements += 1
+        keys[slot] = key
+        self.values[slot] = value
+        generations[slot] = self.generation
+        return True
+
+    def new_generation(self) -> None:
+        """
+        Marks every entry stored so far as older than the next ones, so they are replaced first
+        """
+        self.generation += 1
+
+    def clear(self) -> None:
+        self.keys = [None] * self.size
+        self.values = [None] * self.size
+        self.generations = [0] * self.size
+        self.entries = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns:
+            dict[str, int]: the table's size and counters
+        """
+        return {
+            "size": self.size,
+            "entries": self.entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "replacements": self.replacements,
+            "rejections": self.rejections
+        }
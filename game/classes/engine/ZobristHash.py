@@ -0,0 +1,92 @@
+"""
+Class ZobristHash
+
+Zobrist hash of the state of a game: where each token is, which positions are occupied, which chits are
+face up, whose turn it is and whether they have moved this turn. Every part of the state has a random
+64 bit key, and the hash is the exclusive or of the keys of the parts that are set, so it is updated with
+one exclusive or as each part changes instead of being recalculated. The engine keeps it up to date as
+tokens move, positions are occupied, chits are flipped and turns end.
+
+Keys are drawn from a fixed seed, so equal states of games with the same number of positions, chits and
+players hash the same in every process.
+"""
+
+import random
+
+from classes.enum.Colour import Colour
+
+# Seed of the keys, changing it changes every hash
+ZOBRIST_SEED = 0x5EED
+
+
+class ZobristHash:
+    def __init__(self, nodes: int, chits: int, players: int, seed: int = ZOBRIST_SEED) -> None:
+        """
+        Args:
+            nodes (int): number of positions on the board, tiles and caves
+            chits (int): number of chits in the chit pool
+            players (int): number of players
+            seed (int): seed of the keys
+        """
+        rng = random.Random(seed)
+        # colour -> ordinal -> key of that colour's token being there
+        self.positions = {colour: [rng.getrandbits(64) for _ in range(nodes)] for colour in Colour}
+        # ordinal -> key of the position being occupied
+        self.occupied = [rng.getrandbits(64) for _ in range(nodes)]
+        # place in the chit pool -> key of the chit there being face up
+        self.flipped = [rng.getrandbits(64) for _ in range(chits)]
+        # player number -> key of it being their turn, numbers start at 1
+        self.players = [0] + [rng.getrandbits(64) for _ in range(players)]
+        # key of the current player having moved this turn
+        self.moved = rng.getrandbits(64)
+        self.value = 0
+
+    def compute(self, engine) -> int:
+        """
+        Calculates the hash of a game from scratch, the value kept up to date is always equal to it
+
+        Args:
+            engine (GameEngine): the game
+        Returns:
+            int: the hash
+        """
+        value = 0
+        for player in engine.players.values():
+            value ^= self.positions[player.token.colour][player.token.position.ordinal]
+        for ordinal, node in enumerate(engine.track.nodes):
+            if node.occupied:
+                value ^= self.occupied[ordinal]
+        for slot, chit in enumerate(engine.chits):
+            if chit.flipped:
+                value ^= self.flipped[slot]
+        value ^= self.players[engine.current_player.player_number]
+        if engine.num_flips > 0:
+            value ^= self.moved
+        return value
+
+    def token_moved(self, colour: Colour, start: int, end: int) -> None:
+        """
+        Args:
+            colour (Colour): colour of the token
+            start (int): ordinal of the position the token left
+            end (int): ordinal of the position the token is now on
+        """
+        keys = self.positions[colour]
+        self.value ^= keys[start] ^ keys[end]
+
+    def toggle_occupied(self, ordinal: int) -> None:
+        self.value ^= self.occupied[ordinal]
+
+    def toggle_flipped(self, slot: int) -> None:
+        self.value ^= self.flipped[slot]
+
+    def player_changed(self, previous: int, current: int) -> None:
+        """
+        Args:
+            previous (int): number of the player whose turn it was, 0 if there was none
+            current (int): number of the player whose turn it is
+        """
+        self.value ^= self.players[previous] ^ self.players[current]
+
+    def toggle_moved(self) -> None:
+        self.value ^= self.moved
@@ -0,0 +1,98 @@
+"""
+layout.py
+
+Randomly generates the layout of a board: the order of the volcano cards, which of them hold caves
+and the order of the chit pool. Layouts use the same structure as the "VolcanoCards" and "ChitCards"
+entries of a save file, so a board can be built the same way from either.
+"""
+
+import random
+
+
+def cave_card_indexes(number_of_players: int) -> list[int]:
+    """
+    Gets the indexes of the volcano cards that caves are attached to
+
+    Args:
+        number_of_players (int): number of players in the game
+    Returns:
+        list[int]: volcano card indexes, one per cave
+    """
+    match number_of_players:
+        case 2:
+            return [0, 4]
+        case 3:
+            return [0, 2, 4]
+        case 4:
+            return [0, 2, 4, 6]
+    return []
+
+
+def generate_volcano_cards(config, rng=random) -> list[dict]:
+    """
+    Shuffles the volcano cards, alternating cards with and without cave indents, and attaches the caves
+
+    Args:
+        config (Config): the game configuration
+        rng: source of randomness, the random module or a random.Random instance
+    Returns:
+        list[dict]: one entry per volcano card, in board order
+    """
+    cards_with_caves = [list(card) for card in config.volcano_cards_with_caves]
+    cards_without_caves = [list(card) for card in config.volcano_cards_without_caves]
+
+    volcano_cards = []
+    for i in range(0, len(config.volcano_cards_with_caves)):
+        # alternate volcano cards with caves and without caves to build board in correct order
+        volcano_cards.append({"tiles": cards_with_caves.pop(rng.randrange(len(cards_with_caves)))})
+        volcano_cards.append({"tiles": cards_without_caves.pop(rng.randrange(len(cards_without_caves)))})
+
+    for i, card_index in enumerate(cave_card_indexes(config.number_of_players)):
+        cave_colour, cave_animal = config.caves[i]
+        volcano_cards[card_index]["cave"] = {
+            "colour": cave_colour,
+            "animal": cave_animal,
+            "position": 1
+        }
+    return volcano_cards
+
+
+def generate_chit_cards(config, rng=random) -> list[dict]:
+    """
+    Shuffles the chit pool, drawing from the standard and special chits at random
+
+    Args:
+        config (Config): the game configuration
+        rng: source of randomness, the random module or a random.Random instance
+    Returns:
+        list[dict]: one entry per chit, in grid order
+    """
+    standard_chit_cards = [dict(chit) for chit in config.load_config('cards')]
+    special_chit_cards = [dict(chit) for chit in config.load_config('special_cards')]
+
+    chits = []
+    while len(standard_chit_cards) > 0 or len(special_chit_cards) > 0:
+        if len(standard_chit_cards) > 0 and len(special_chit_cards) > 0:
+            card_type = rng.choice([standard_chit_cards, special_chit_cards])
+            chits.append(card_type.pop(rng.randrange(len(card_type))))
+        elif len(standard_chit_cards) > 0:
+            chits.append(standard_chit_cards.pop(rng.randrange(len(standard_chit_cards))))
+        else:
+            chits.append(special_chit_cards.pop(rng.randrange(len(special_chit_cards))))
+    return chits
+
+
+def generate_layout(config, rng=random) -> dict[str, list[dict]]:
+    """
+    Generates a random board layout
+
+    Args:
+        config (Config): the game configuration
+        rng: source of randomness, the random module or a random.Random instance
+    Returns:
+        dict[str, list[dict]]: the "VolcanoCards" and "ChitCards" of the board
+    """
+    return {
+        "VolcanoCards": generate_volcano_cards(config, rng),
+        "ChitCards": generate_chit_cards(config, rng)
+    }
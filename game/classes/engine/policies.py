@@ -0,0 +1,43 @@
+"""
+policies.py
+
+Looks up CPU policies by name, for the command line tools and the game configuration.
+"""
+
+from classes.engine.CPUPolicy import CPUPolicy
+from classes.engine.MemoryPolicy import MemoryPolicy
+from classes.engine.RandomPolicy import RandomPolicy
+from classes.engine.SearchPolicy import SearchPolicy
+
+POLICIES = {
+    RandomPolicy.name: RandomPolicy,
+    MemoryPolicy.name: MemoryPolicy,
+    SearchPolicy.name: SearchPolicy
+}
+
+
+def policy_names() -> list[str]:
+    """
+    Returns:
+        list[str]: names of every available policy
+    """
+    return list(POLICIES.keys())
+
+
+def create_policy(name: str, config=None) -> CPUPolicy:
+    """
+    Creates a CPU policy from its name
+
+    Args:
+        name (str): name of the policy
+        config (Config | None): configuration to take the policy's settings from, None uses its defaults
+    Returns:
+        CPUPolicy: a new instance of the policy
+    Throws:
+        ValueError: if there is no policy with that name
+    """
+    if name not in POLICIES:
+        raise ValueError(f"Unknown CPU policy {name}, expected one of {', '.join(policy_names())}")
+    if config is None:
+        return POLICIES[name]()
+    return POLICIES[name].from_config(config)
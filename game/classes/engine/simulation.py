@@ -0,0 +1,165 @@
+"""
+simulation.py
+
+Plays whole games headless with CPU policies for every seat and collects the statistics used to
+balance the game. Each game is seeded, so any result can be played again from its seed.
+"""
+
+import contextlib
+import os
+
+from classes.engine.CPUPolicy import CPUPolicy
+from classes.engine.GameEngine import GameEngine
+from classes.enum.Animal import Animal
+from classes.utils.replay import ReplayRecorder
+
+# Columns of a game result, in the order they are written to CSV files
+RESULT_FIELDS = [
+    "seed", "finished", "winner_seat", "winner_colour", "turns", "flips",
+    "reverse_moves", "pirate_moves", "winner_reverse_moves", "winner_pirate_moves", "deciding_chit"
+]
+
+
+def simulation_config(config, number_of_players: int):
+    """
+    Sets a configuration up for an all-CPU game
+
+    Args:
+        config (Config): the configuration to change
+        number_of_players (int): number of seats, from 2 to 4
+    Returns:
+        Config: the configuration
+    """
+    config.number_of_players = number_of_players
+    config.set_players(0)
+    config.players = config.players[:number_of_players]
+    return config
+
+
+def play_game(config, policy: CPUPolicy, seed: int, max_flips: int, replay: str | None = None) -> dict[str, any]:
+    """
+    Plays one game from a seed until a player wins or the flip limit is reached
+
+    Args:
+        config (Config): the game configuration, every player is played by the policy
+        policy (CPUPolicy): chooses the chits to flip
+        seed (int): seed of the game's random source, used for the layout and the policy
+        max_flips (int): number of flips after which the game is stopped unfinished
+        replay (str | None): file to record a replay of the game to, None does not record one
+    Returns:
+        dict[str, any]: the game result, with the keys in RESULT_FIELDS
+    """
+    engine = GameEngine.from_seed(config, seed)
+    policy.watch(engine)
+    if replay:
+        engine.recorder = ReplayRecorder(replay, engine)
+    rng = engine.rng
+    seats = {player.player_number: 0 for player in engine.players.values()}
+    reverse_moves = dict(seats)
+    pirate_moves = dict(seats)
+    turns = 1
+    flips = 0
+    deciding_chit = None
+
+    while not engine.player_has_won() and flips < max_flips:
+        index = policy.choose_chit(engine, rng)
+        if index is None:
+            engine.pass_turn()
+            turns += 1
+            continue
+
+        player = engine.current_player
+        position = player.token.position
+        chit = engine.chits[index]
+        engine.play_chit(index)
+        flips += 1
+
+        if player.token.position is not position:
+            if chit.animal == Animal["REVERSE"]:
+                reverse_moves[player.player_number] += 1
+            elif chit.animal == Animal["PIRATE"]:
+                pirate_moves[player.player_number] += 1
+        if engine.player_has_won():
+            deciding_chit = chit.animal.name
+        elif engine.current_player is not player:
+            turns += 1
+
+    if engine.recorder:
+        engine.recorder.close()
+    winner = engine.get_winner()
+    winner_seat = int(winner) if winner else None
+    return {
+        "seed": seed,
+        "finished": winner_seat is not None,
+        "winner_seat": winner_seat,
+        "winner_colour": engine.players[winner_seat].colour if winner_seat else None,
+        "turns": turns,
+        "flips": flips,
+        "reverse_moves": sum(reverse_moves.values()),
+        "pirate_moves": sum(pirate_moves.values()),
+        "winner_reverse_moves": reverse_moves[winner_seat] if winner_seat else 0,
+        "winner_pirate_moves": pirate_moves[winner_seat] if winner_seat else 0,
+        "deciding_chit": deciding_chit
+    }
+
+
+def play_quietly(config, policy: CPUPolicy, seed: int, max_flips: int, replay: str | None = None) -> dict[str, any]:
+    """
+    Plays one game like play_game, hiding the messages the engine prints for invalid moves
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return play_game(config, policy, seed, max_flips, replay)
+
+
+class SimulationSummary:
+    """
+    Aggregates game results as they are streamed in
+    """
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.finished = 0
+        self.turns = 0
+        self.flips = 0
+        self.wins_by_seat = {}
+        self.wins_by_colour = {}
+        self.decided_by_reverse = 0
+        self.decided_by_pirate = 0
+
+    def add(self, result: dict[str, any]) -> None:
+        self.games += 1
+        self.flips += result["flips"]
+        if not result["finished"]:
+            return
+        self.finished += 1
+        self.turns += result["turns"]
+        self.wins_by_seat[result["winner_seat"]] = self.wins_by_seat.get(result["winner_seat"], 0) + 1
+        self.wins_by_colour[result["winner_colour"]] = self.wins_by_colour.get(result["winner_colour"], 0) + 1
+        # a special card helped decide the game if the winner moved with it
+        if result["winner_reverse_moves"]:
+            self.decided_by_reverse += 1
+        if result["winner_pirate_moves"]:
+            self.decided_by_pirate += 1
+
+    def report(self) -> list[str]:
+        """
+        Returns:
+            list[str]: lines describing the results so far
+        """
+        lines = [f"games: {self.games}, finished: {self.finished} ({self.rate(self.finished, self.games)})"]
+        if self.games:
+            lines.append(f"mean flips per game: {self.flips / self.games:.1f}")
+        if not self.finished:
+            return lines
+        lines.append(f"mean turns per finished game: {self.turns / self.finished:.1f}")
+        for seat, wins in sorted(self.wins_by_seat.items()):
+            lines.append(f"seat {seat} win rate: {self.rate(wins, self.finished)}")
+        for colour, wins in sorted(self.wins_by_colour.items()):
+            lines.append(f"{colour} win rate: {self.rate(wins, self.finished)}")
+        lines.append(f"winner moved with REVERSE: {self.rate(self.decided_by_reverse, self.finished)}")
+        lines.append(f"winner moved with PIRATE: {self.rate(self.decided_by_pirate, self.finished)}")
+        return lines
+
+    @staticmethod
+    def rate(count: int, total: int) -> str:
+        return f"{count / total:.1%}" if total else "n/a"
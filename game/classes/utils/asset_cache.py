@@ -0,0 +1,204 @@
+"""
+asset_cache.py
+
+Process-wide cache of decoded, converted and scaled image surfaces.
+
+Surfaces are keyed on (path, size, alpha) so each image file is decoded from disk once
+and each scaled variant is produced once, no matter how many sprites or frames use it.
+
+Images in a loaded texture atlas are served as subsurfaces of the atlas sheet, and are never
+decoded or scaled at all, see classes.utils.atlas.
+"""
+
+import os
+import time
+from collections import OrderedDict
+
+import pygame
+
+from classes.utils.atlas import ATLAS_DIRECTORY, read_index
+from classes.utils.image_packager import resource_path
+from classes.utils.profiler import frame_profiler
+
+# Default memory budget for cached surfaces
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class AssetCache:
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Least recently used entries are kept at the front
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        # Subsurfaces of the atlas sheet, kept outside the budget as they share the sheet's pixels
+        self._atlas: dict[tuple, pygame.Surface] = {}
+        self.atlas_bytes = 0
+        # Full size of each image in the atlas, so it can be known without decoding the image
+        self._source_sizes: dict[str, tuple[int, int]] = {}
+
+    def get_image(self, path: str, size: tuple[int, int] | None = None, alpha: bool = True) -> pygame.Surface:
+        """
+        Gets an image surface, decoding and scaling it only if it is not already cached.
+        The returned surface is shared, so callers must copy() it before drawing onto it.
+
+        Args:
+            path (str): path of the image, relative paths are resolved with resource_path
+            size (tuple[int, int] | None): size to scale the image to, or None for the native size
+            alpha (bool): whether the surface is converted for fast alpha blitting
+        Returns:
+            pygame.Surface: the cached surface
+        """
+        path = resource_path(path)
+        key = (path, size, alpha)
+        surface = self._atlas.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if size is None:
+            start = time.perf_counter()
+            surface = pygame.image.load(path)
+            if alpha:
+                surface = surface.convert_alpha()
+            frame_profiler.add("image load", time.perf_counter() - start)
+        else:
+            native = self.get_image(path, None, alpha)
+            start = time.perf_counter()
+            surface = pygame.transform.scale(native, size)
+            frame_profiler.add("image scale", time.perf_counter() - start)
+        self._store(key, surface)
+        return surface
+
+    def get_size(self, path: str, alpha: bool = True) -> tuple[int, int]:
+        """
+        Gets the full size of an image, without decoding it if it is in the atlas
+
+        Args:
+            path (str): path of the image, relative paths are resolved with resource_path
+            alpha (bool): whether the image is converted for fast alpha blitting if it has to be decoded
+        Returns:
+            tuple[int, int]: the width and height of the image file
+        """
+        size = self._source_sizes.get(resource_path(path))
+        if size is None:
+            size = self.get_image(path, None, alpha).get_size()
+        return size
+
+    def load_atlas(self, path: str) -> int:
+        """
+        Loads a texture atlas built by build_atlas.py, so its images are never decoded or scaled
+
+        Args:
+            path (str): path of the atlas sheet, relative paths are resolved with resource_path
+        Returns:
+            int: the number of images in the atlas, 0 if there is no atlas
+        """
+        sheet_path = resource_path(path)
+        index = read_index(sheet_path)
+        if index is None:
+            return 0
+        sheet = pygame.image.load(os.path.join(os.path.dirname(sheet_path), index["sheet"])).convert_alpha()
+        for image in index["images"]:
+            image_path = resource_path(image["path"])
+            size = tuple(image["size"]) if image["size"] else None
+            self._atlas[(image_path, size, image["alpha"])] = sheet.subsurface(image["rect"])
+            self._source_sizes[image_path] = tuple(image["source_size"])
+        self.atlas_bytes = self._surface_bytes(sheet)
+        return len(index["images"])
+
+    def entries(self) -> list[tuple]:
+        """
+        Returns:
+            list[tuple]: the (path, size, alpha) of every decoded or scaled surface in the cache
+        """
+        return list(self._surfaces)
+
+    def warm_up(self, directory: str = "imgs", alpha: bool = True) -> int:
+        """
+        Decodes every PNG image under a directory so the first frames do not hit the disk
+
+        Args:
+            directory (str): directory to search, relative paths are resolved with resource_path
+            alpha (bool): whether the surfaces are converted for fast alpha blitting
+        Returns:
+            int: the number of images decoded
+        """
+        loaded = 0
+        atlas_directory = resource_path(ATLAS_DIRECTORY)
+        for root, directories, files in os.walk(resource_path(directory)):
+            # the atlas sheet is only used through load_atlas
+            if root == atlas_directory:
+                directories.clear()
+                continue
+            for file in sorted(files):
+                if file.lower().endswith(".png"):
+                    self.get_image(os.path.join(root, file), None, alpha)
+                    loaded += 1
+        return loaded
+
+    def resize(self, max_bytes: int) -> None:
+        """
+        Changes the memory budget, evicting entries if the cache no longer fits
+
+        Args:
+            max_bytes (int): maximum number of bytes of pixel data to keep cached
+        """
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes every cached surface and resets the counters
+        """
+        self._surfaces.clear()
+        self._atlas.clear()
+        self._source_sizes.clear()
+        self.current_bytes = 0
+        self.atlas_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns:
+            dict[str, int]: the cache counters and current memory use
+        """
+        return {
+            "entries": len(self._surfaces),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "atlas_images": len(self._atlas),
+            "atlas_bytes": self.atlas_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def _store(self, key: tuple, surface: pygame.Surface) -> None:
+        self._surfaces[key] = surface
+        self.current_bytes += self._surface_bytes(surface)
+        self._evict()
+
+    def _evict(self) -> None:
+        # Always keep the most recently used entry, even if it alone exceeds the budget
+        while self.current_bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, surface = self._surfaces.popitem(last=False)
+            self.current_bytes -= self._surface_bytes(surface)
+            self.evictions += 1
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+
+# Shared instance used by every sprite in the process
+asset_cache = AssetCache()
@@ -0,0 +1,178 @@
+"""
+atlas.py
+
+Texture atlas of the game's images. Every image the board draws is packed, already scaled to the size it
+is drawn at, into one sheet saved with an index of where each image is. At startup the asset cache loads
+the sheet with a single file read and decode, instead of opening and decoding every image at its full
+size, and sprites draw from subsurfaces of the sheet.
+
+The atlas is built offline with build_atlas.py, from the images a board asks the asset cache for. The
+index keeps a digest of each source image, so an atlas left behind by changed images can be found.
+"""
+
+import hashlib
+import json
+import os
+
+import pygame
+
+from classes.utils.image_packager import resource_path
+
+# Version of the atlas index, increased when its format changes
+ATLAS_VERSION = 1
+# Directory of the atlas, images in it are never packed into the atlas
+ATLAS_DIRECTORY = "imgs/atlas"
+# Width of the sheet, images are packed in rows up to this width
+SHEET_WIDTH = 1024
+
+
+def index_path(sheet_path: str) -> str:
+    """
+    Args:
+        sheet_path (str): path of the atlas sheet
+    Returns:
+        str: path of the atlas index, next to the sheet
+    """
+    return os.path.splitext(sheet_path)[0] + ".json"
+
+
+def relative_path(path: str) -> str:
+    """
+    Returns:
+        str: the path relative to the game directory, with forward slashes, as paths are kept in the index
+    """
+    return os.path.relpath(path, resource_path(".")).replace(os.sep, "/")
+
+
+def source_digest(path: str) -> str:
+    """
+    Returns:
+        str: the SHA-1 digest of an image file
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def pack(sizes: list[tuple[int, int]], width: int = SHEET_WIDTH) -> tuple[list[tuple[int, int]], int]:
+    """
+    Packs rectangles into rows, tallest first, so rows waste little height
+
+    Args:
+        sizes (list[tuple[int, int]]): width and height of each rectangle
+        width (int): width of the sheet
+    Returns:
+        tuple[list[tuple[int, int]], int]: the position of each rectangle, and the height of the sheet
+    """
+    positions = [(0, 0)] * len(sizes)
+    x = y = row_height = 0
+    for i in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0])):
+        w, h = sizes[i]
+        if w > width:
+            raise ValueError(f"an image {w}px wide does not fit in a {width}px sheet")
+        if x + w > width:
+            x, y = 0, y + row_height
+            row_height = 0
+        positions[i] = (x, y)
+        x += w
+        row_height = max(row_height, h)
+    return positions, y + row_height
+
+
+def with_siblings(keys: list[tuple]) -> list[tuple]:
+    """
+    Adds the other images in the directory of each image, at the same size, as images of one kind of sprite
+    share a directory and a size. This covers images a single board never needed, such as chits left out
+    of its layout.
+
+    Args:
+        keys (list[tuple]): the (path, size, alpha) of images scaled by the asset cache
+    Returns:
+        list[tuple]: the keys and their siblings, sorted
+    """
+    atlas_directory = resource_path(ATLAS_DIRECTORY)
+    found = set(keys)
+    for path, size, alpha in keys:
+        directory = os.path.dirname(path)
+        if directory == atlas_directory:
+            continue
+        for file in os.listdir(directory):
+            if file.lower().endswith(".png"):
+                found.add((os.path.join(directory, file), size, alpha))
+    return sorted(found, key=lambda key: (key[0], key[1], key[2]))
+
+
+def build_atlas(surfaces: dict[tuple, pygame.Surface], sheet_path: str) -> dict:
+    """
+    Packs images into a sheet, and saves the sheet and its index
+
+    Args:
+        surfaces (dict[tuple, pygame.Surface]): the image of each (path, size, alpha) to pack
+        sheet_path (str): where the sheet is saved, as a PNG, the index is saved next to it
+    Returns:
+        dict: the index
+    """
+    keys = list(surfaces)
+    positions, height = pack([surfaces[key].get_size() for key in keys])
+    sheet = pygame.Surface((SHEET_WIDTH, max(1, height)), pygame.SRCALPHA)
+    sheet.fill((0, 0, 0, 0))
+    images = []
+    digests = {}
+    for key, position in zip(keys, positions):
+        path, size, alpha = key
+        surface = surfaces[key]
+        # the sheet is fully transparent, so taking the maximum copies each pixel exactly instead of blending it
+        sheet.blit(surface, position, special_flags=pygame.BLEND_RGBA_MAX)
+        if path not in digests:
+            digests[path] = source_digest(path)
+        images.append({
+            "path": relative_path(path),
+            "size": list(size) if size else None,
+            "alpha": alpha,
+            "rect": [*position, *surface.get_size()],
+            "source_size": list(pygame.image.load(path).get_size()),
+            "source_sha1": digests[path]
+        })
+
+    os.makedirs(os.path.dirname(sheet_path), exist_ok=True)
+    pygame.image.save(sheet, sheet_path)
+    index = {
+        "version": ATLAS_VERSION,
+        "sheet": os.path.basename(sheet_path),
+        "sheet_size": [SHEET_WIDTH, max(1, height)],
+        "images": images
+    }
+    with open(index_path(sheet_path), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+def read_index(sheet_path: str) -> dict | None:
+    """
+    Args:
+        sheet_path (str): path of the atlas sheet
+    Returns:
+        dict | None: the atlas index, or None if there is no atlas or it is from another version
+    """
+    try:
+        with open(index_path(sheet_path), encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if index.get("version") != ATLAS_VERSION:
+        return None
+    return index
+
+
+def stale_images(index: dict) -> list[str]:
+    """
+    Args:
+        index (dict): an atlas index
+    Returns:
+        list[str]: the source images of the atlas that have changed or are missing since it was built
+    """
+    stale = []
+    for path, digest in {image["path"]: image["source_sha1"] for image in index["images"]}.items():
+        full_path = resource_path(path)
+        if not os.path.exists(full_path) or source_digest(full_path) != digest:
+            stale.append(path)
+    return stale
@@ -0,0 +1,121 @@
+"""
+autosave.py
+
+Saves the game in the background while it is played. Saves are taken from the engine on the game
+thread, which only builds a few small dicts, and written to disk on a worker thread so the window
+never waits for the disk.
+
+Autosaves are written to the autosave slot, and saves made with the save button to the save slot, see
+file_io. Most autosaves only append the players and memory score, the parts of a save that change
+between turns, to the autosave journal. Every few entries the journal is compacted into a full save.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
+from classes.utils.file_io import append_journal, autosave_slot, compact_save, save_slot
+
+# Saves are written on this thread, one at a time and in the order they were taken
+save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+
+# Parts of a save that change from turn to turn
+JOURNAL_KEYS = ["Players", "MemoryScore"]
+
+
+class Autosaver:
+    def __init__(self, every_turns: int, compact_every: int, save_format: str = "json", compress: bool = True) -> None:
+        """
+        Args:
+            every_turns (int): number of turns between autosaves, 0 disables autosaving
+            compact_every (int): number of journal entries written before the next save is a full save
+            save_format (str): format of full saves, "json" or "binary"
+            compress (bool): whether binary saves are compressed
+        """
+        self.every_turns = every_turns
+        self.compact_every = compact_every
+        self.save_format = save_format
+        self.compress = compress
+        # journal entries written since the last full save, None until this game has a full save
+        self.journal_entries = None
+        # the save being written most recently
+        self.pending: Future | None = None
+
+    def turn_ended(self, engine) -> None:
+        """
+        Called by the engine after each turn, autosaves if enough turns have passed
+
+        Args:
+            engine (GameEngine): the game being played
+        """
+        if self.every_turns and engine.turn % self.every_turns == 0:
+            self.save(engine)
+
+    def save(self, engine, full: bool = False) -> Future:
+        """
+        Takes an autosave of the game and writes it in the background
+
+        Args:
+            engine (GameEngine): the game to save
+            full (bool): whether to write a full save instead of a journal entry
+        Returns:
+            Future: completes once the save is on disk
+        """
+        save = engine.save()
+        if full or self.journal_entries is None or self.journal_entries >= self.compact_every:
+            # a journal only makes sense on top of a full save of the same game
+            self.journal_entries = 0
+            write_full_save = partial(compact_save, save_format=self.save_format, compress=self.compress,
+                                      slot=autosave_slot)
+            self.pending = self.submit(write_full_save, save)
+        else:
+            self.journal_entries += 1
+            # entries are tagged with the game, so they are never applied to the save of another game
+            entry = {
+                "seed": engine.seed,
+                "turn": engine.turn,
+                "changes": {key: save[key] for key in JOURNAL_KEYS}
+            }
+            write_entry = partial(append_journal, slot=autosave_slot)
+            self.pending = self.submit(write_entry, entry)
+        return self.pending
+
+    def save_game(self, engine) -> Future:
+        """
+        Takes a full save of the game into the save slot, which "Load Save Game" loads, and writes it
+        in the background
+
+        Args:
+            engine (GameEngine): the game to save
+        Returns:
+            Future: completes once the save is on disk
+        """
+        write_full_save = partial(compact_save, save_format=self.save_format, compress=self.compress, slot=save_slot)
+        self.pending = self.submit(write_full_save, engine.save())
+        return self.pending
+
+    def flush(self) -> None:
+        """Waits for every save taken so far to be written, or to fail
+        """
+        if self.pending is not None:
+            self.pending.exception()
+
+    @staticmethod
+    def submit(write_function, data: dict) -> Future:
+        """
+        Writes a save on the save thread, reporting it if it fails
+
+        Args:
+            write_function: writes data to disk
+            data (dict): the save or journal entry
+        Returns:
+            Future: completes once the save is on disk, or holds the error it failed with
+        """
+        future = save_executor.submit(write_function, data)
+        future.add_done_callback(Autosaver.report)
+        return future
+
+    @staticmethod
+    def report(future: Future) -> None:
+        err = future.exception()
+        if err is not None:
+            print(f"Save failed: {err!r}")
@@ -0,0 +1,84 @@
+"""
+chit_faces.py
+
+Flyweight registry of the faces of chit cards. Every chit with the same front image at the same size
+shares one ChitFace, and every face of one size shares one card back, so a card only keeps a reference
+to its face and its flipped flag. Faces are kept for the life of the process, so boards built later, or
+built after the asset cache evicted the images, still share the faces of earlier boards.
+
+The surfaces of a face are shared by every card that uses it and must never be drawn onto.
+"""
+
+import pygame
+
+from classes.utils.image_packager import resource_path
+from classes.utils.rendering import render_square_image
+
+# Image of the back of every chit card
+CARD_BACK_IMAGE = "imgs/chits/facedown.png"
+
+
+class ChitFace:
+    __slots__ = ("front_image", "size", "front", "back")
+
+    def __init__(self, front_image: str, size: int, front: pygame.Surface, back: pygame.Surface) -> None:
+        self.front_image = front_image
+        self.size = size
+        self.front = front
+        self.back = back
+
+
+class ChitFaceRegistry:
+    def __init__(self) -> None:
+        self._faces: dict[tuple[str, int], ChitFace] = {}
+        # card backs by size, shared by every face of that size
+        self._backs: dict[int, pygame.Surface] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, front_image: str, size: int) -> ChitFace:
+        """
+        Gets the shared face of a chit, rendering it only the first time it is asked for
+
+        Args:
+            front_image (str): path of the image on the front of the card
+            size (int): size of the card in pixels
+        Returns:
+            ChitFace: the face
+        """
+        key = (resource_path(front_image), size)
+        face = self._faces.get(key)
+        if face is not None:
+            self.hits += 1
+            return face
+        self.misses += 1
+        back = self._backs.get(size)
+        if back is None:
+            back = self._backs[size] = render_square_image(CARD_BACK_IMAGE, size)
+        face = self._faces[key] = ChitFace(front_image, size, render_square_image(front_image, size), back)
+        return face
+
+    def clear(self) -> None:
+        self._faces.clear()
+        self._backs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns:
+            dict[str, int]: the number of faces and backs, the counters, and the bytes of pixel data they share
+        """
+        surfaces = {id(surface): surface for face in self._faces.values() for surface in (face.front, face.back)}
+        return {
+            "faces": len(self._faces),
+            "backs": len(self._backs),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes": sum(surface.get_width() * surface.get_height() * surface.get_bytesize()
+                         for surface in surfaces.values())
+        }
+
+
+# Shared instance used by every chit card in the process
+chit_faces = ChitFaceRegistry()
@@ -1,41 +1,196 @@
 import os
 import json
 import sys
+import tempfile
+
+from classes.utils import save_codec
 
 CWD = os.path.abspath(os.path.dirname(sys.executable))
-save_file = "save.json"
+# Every save slot has a save file, "<slot>.json", or "<slot>.bin" in the binary format (see save_codec),
+# and an append-only journal "<slot>.journal" of changes made since the save file was last written.
+# Explicit saves are made with the save button, and autosaves have a slot of their own so starting a
+# new game never overwrites the saved game. "Load Save Game" loads the explicit save, carried on from
+# the autosave if that game was autosaved after it was saved, or the autosave if nothing was saved.
+save_slot = "save"
+autosave_slot = "autosave"
+# directory replays of played games are recorded in, see replay
+replay_directory = "replays"
 
 
-def write(key: str, entry: dict):
-    save = load_file()
-    if save.keys().__contains__(key):
-        key_data = save[key]
-        key_data.append(entry)
-    else:
-        save[key] = [entry]
+def save_path(save_format: str = "json", slot: str = save_slot) -> str:
+    """
+    returns: path of the save file of a slot for a save format, "json" or "binary"
+    """
+    return os.path.join(CWD, slot + (".bin" if save_format == "binary" else ".json"))
 
-    with open(os.path.join(CWD, save_file), mode='w', encoding='utf-8') as f:
-        json.dump(save, f)
+
+def journal_path(slot: str = save_slot) -> str:
+    """
+    returns: path of the journal of a slot
+    """
+    return os.path.join(CWD, slot + ".journal")
 
 
-def load_file() -> dict:
+def write_save(save: dict, save_format: str = "json", compress: bool = True, slot: str = save_slot) -> None:
+    """
+    writes a whole save document in one go. The document is written to a temporary file which then
+    replaces the save file, so a crash while saving never leaves a half written save behind.
+    compress only applies to the binary format.
     """
-    load the specified save file
+    path = save_path(save_format, slot)
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path), suffix=".tmp", dir=CWD)
+    try:
+        with os.fdopen(fd, mode='wb') as f:
+            if save_format == "binary":
+                f.write(save_codec.encode(save, compress))
+            else:
+                f.write(json.dumps(save).encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def load_file(save_format: str = "json", slot: str = save_slot) -> dict:
+    """
+    load the save file of a slot in a save format, or in the other format if there is none, so saves
+    made before the format was changed can still be loaded
     returns: dict of save, or empty dict if no save file
     """
+    other_format = "json" if save_format == "binary" else "binary"
+    for file_format in (save_format, other_format):
+        try:
+            with open(save_path(file_format, slot), mode='rb') as f:
+                data = f.read()
+        except OSError as err:
+            continue
+        if file_format == "binary":
+            return save_codec.decode(data)
+        return json.loads(data)
+    return {}
+
+
+def append_journal(entry: dict, slot: str = save_slot) -> None:
+    """
+    appends one entry to the journal of a slot, as a single line of JSON
+    """
+    with open(journal_path(slot), mode='a', encoding='utf-8') as f:
+        f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def load_journal(slot: str = save_slot) -> list[dict]:
+    """
+    load the entries of the journal of a slot
+    returns: list of entries, or empty list if there is no journal
+    """
+    entries = []
     try:
-        f = open(os.path.join(CWD, save_file))
+        with open(journal_path(slot), encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # the last entry was cut off by a crash while it was being written
+                    break
     except OSError as err:
-        return {}
-    data = json.load(f)
-    return data
+        return []
+    return entries
 
 
-def delete_save() -> None:
+def delete_journal(slot: str = save_slot) -> None:
     """
-    deletes save file
+    deletes the journal of a slot
     """
     try:
-        os.remove(os.path.join(CWD, save_file))
+        os.remove(journal_path(slot))
     except FileNotFoundError:
-        print("No save file exists")
+        pass
+
+
+def compact_save(save: dict, save_format: str = "json", compress: bool = True, slot: str = save_slot) -> None:
+    """
+    writes a full save and clears the journal, whose changes the save now includes. The journal is
+    deleted first, so a crash in between leaves the older save without its journal rather than the
+    new save with the journal of another game.
+    """
+    delete_journal(slot)
+    write_save(save, save_format, compress, slot)
+
+
+def save_seed(save: dict) -> int | None:
+    """
+    returns: the seed of the game a save is of, which stays the same when the game is resumed
+    """
+    return save.get("Seed", [{"seed": None}])[0]["seed"]
+
+
+def save_turn(save: dict) -> int:
+    """
+    returns: the turn a save was taken at
+    """
+    return save.get("Autosave", [{"turn": 0}])[0]["turn"]
+
+
+def load_slot(slot: str, save_format: str = "json") -> dict:
+    """
+    load the save file of a slot with the changes from its journal applied on top
+    returns: dict of save, or empty dict if no save file
+    """
+    save = load_file(save_format, slot)
+    if not save:
+        return save
+    saved_turn = save_turn(save)
+    seed = save_seed(save)
+    for entry in load_journal(slot):
+        # entries of another game, or older than the save, are left over from before it was written
+        if entry.get("seed") != seed or entry["turn"] <= saved_turn:
+            continue
+        for key, value in entry["changes"].items():
+            save[key] = value
+        save["Autosave"] = [{"turn": entry["turn"]}]
+    return save
+
+
+def load_latest_save(save_format: str = "json") -> dict:
+    """
+    load the game "Load Save Game" continues: the explicit save, or its autosave if the same game was
+    autosaved after it was saved, or the autosave if nothing was saved
+    returns: dict of save, or empty dict if no save file
+    """
+    save = load_slot(save_slot, save_format)
+    autosave = load_slot(autosave_slot, save_format)
+    if not save:
+        return autosave
+    if autosave and save_seed(autosave) == save_seed(save) and save_turn(autosave) > save_turn(save):
+        return autosave
+    return save
+
+
+def replay_path(name: str) -> str:
+    """
+    returns: path of a replay file in the replay directory, which is created if it does not exist
+    """
+    directory = os.path.join(CWD, replay_directory)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, name)
+
+
+def prune_replays(keep: int) -> None:
+    """
+    deletes all but the newest keep replays in the replay directory
+    """
+    directory = os.path.join(CWD, replay_directory)
+    try:
+        paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".jsonl")]
+    except OSError:
+        return
+    paths.sort(key=os.path.getmtime, reverse=True)
+    for path in paths[keep:]:
+        try:
+            os.remove(path)
+        except OSError as err:
+            print(f"Could not delete old replay: {err}")
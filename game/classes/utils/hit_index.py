@@ -0,0 +1,71 @@
+"""
+hit_index.py
+
+Uniform grid used to find what is under the mouse. Every item is filed under each grid cell its rect
+overlaps, so a click only tests the few items in its own cell, however many chits, tiles and buttons
+the board has. The index holds rects as they were when added, so it is rebuilt when items move.
+"""
+
+import math
+
+import pygame
+
+
+class HitIndex:
+    def __init__(self, cell_size: int, origin: tuple[float, float] = (0, 0)) -> None:
+        # Items are filed under every cell their rect overlaps, in the order they were added
+        self.cell_size = cell_size
+        self.origin = origin
+        self._cells: dict[tuple[int, int], list[tuple[pygame.Rect, object]]] = {}
+        self.items = 0
+
+    def cell(self, point: tuple[float, float]) -> tuple[int, int]:
+        """
+        Args:
+            point (tuple[float, float]): a point on the screen
+        Returns:
+            tuple[int, int]: the column and row of the grid cell containing the point
+        """
+        return (math.floor((point[0] - self.origin[0]) / self.cell_size),
+                math.floor((point[1] - self.origin[1]) / self.cell_size))
+
+    def add(self, rect: pygame.Rect, item: object) -> None:
+        """
+        Files an item under every cell its rect overlaps. Items added later are on top of earlier ones.
+
+        Args:
+            rect (pygame.Rect): the area of the screen the item covers
+            item (object): the item returned when a point inside rect is looked up
+        """
+        if not rect.width or not rect.height:
+            return
+        left, top = self.cell(rect.topleft)
+        right, bottom = self.cell((rect.right - 1, rect.bottom - 1))
+        entry = (rect.copy(), item)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                self._cells.setdefault((column, row), []).append(entry)
+        self.items += 1
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self.items = 0
+
+    def hits(self, point: tuple[float, float]) -> list[object]:
+        """
+        Args:
+            point (tuple[float, float]): a point on the screen
+        Returns:
+            list[object]: the items whose rect contains the point, bottom first
+        """
+        return [item for rect, item in self._cells.get(self.cell(point), ()) if rect.collidepoint(point)]
+
+    def at(self, point: tuple[float, float]) -> object | None:
+        """
+        Args:
+            point (tuple[float, float]): a point on the screen
+        Returns:
+            object | None: the top item containing the point, or None if there is nothing there
+        """
+        hits = self.hits(point)
+        return hits[-1] if hits else None
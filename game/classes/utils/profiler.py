@@ -0,0 +1,244 @@
+"""
+profiler.py
+
+Records how long each phase of a frame takes, such as waiting for the next frame, handling events,
+updating timers, rendering text and drawing sprites. Phases are timed with the profiler's phase context
+manager, and the time spent in each phase is added up over a frame and recorded once the frame ends.
+Each phase keeps a rolling window of its recent frames, so percentiles show stutters as well as the
+typical frame.
+
+Profiling is off until enabled, and phases then cost a single call. The game enables it with the
+profiler settings in Config, or when its overlay is toggled.
+"""
+
+import cProfile
+import json
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+# Default number of frames kept for each phase
+DEFAULT_WINDOW = 600
+# Upper edges of the histogram buckets written by save, in milliseconds, the last bucket has no upper edge
+BUCKET_EDGES_MS = [0.01, 0.03, 0.1, 0.3, 1, 3, 10, 30, 100, 300, 1000]
+
+
+class RollingHistogram:
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        """
+        Args:
+            window (int): number of the most recent samples kept
+        """
+        self.samples: deque[float] = deque(maxlen=window)
+        # samples added since the histogram was created, including those no longer in the window
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentiles(self, *percents: float) -> list[float]:
+        """
+        Args:
+            percents (float): percentiles to find, from 0 to 100
+        Returns:
+            list[float]: the sample at each percentile of the window in seconds, 0 if it is empty
+        """
+        ordered = sorted(self.samples)
+        if not ordered:
+            return [0.0] * len(percents)
+        return [ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))] for percent in percents]
+
+    def buckets(self) -> list[int]:
+        """
+        Returns:
+            list[int]: number of samples in the window in each bucket of BUCKET_EDGES_MS, and above the last edge
+        """
+        counts = [0] * (len(BUCKET_EDGES_MS) + 1)
+        for sample in self.samples:
+            milliseconds = sample * 1000
+            bucket = 0
+            while bucket < len(BUCKET_EDGES_MS) and milliseconds > BUCKET_EDGES_MS[bucket]:
+                bucket += 1
+            counts[bucket] += 1
+        return counts
+
+    def summary(self) -> dict[str, float]:
+        """
+        Returns:
+            dict[str, float]: the number of samples, and the mean, p50, p95, p99 and max of the window in milliseconds
+        """
+        p50, p95, p99 = self.percentiles(50, 95, 99)
+        return {
+            "count": self.count,
+            "mean_ms": sum(self.samples) / len(self.samples) * 1000 if self.samples else 0.0,
+            "p50_ms": p50 * 1000,
+            "p95_ms": p95 * 1000,
+            "p99_ms": p99 * 1000,
+            "max_ms": max(self.samples, default=0.0) * 1000
+        }
+
+
+class Phase:
+    """Times one phase each time it is entered, see FrameProfiler.phase. A phase entered again before it is
+    exited, by nesting or recursion, is timed from its outermost entry so no time is counted twice
+    """
+    __slots__ = ("profiler", "name", "start", "depth")
+
+    def __init__(self, profiler: "FrameProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+        # number of entries not yet exited
+        self.depth = 0
+
+    def __enter__(self) -> "Phase":
+        if self.depth == 0:
+            self.start = time.perf_counter()
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.depth -= 1
+        if self.depth == 0:
+            self.profiler.add(self.name, time.perf_counter() - self.start)
+
+
+class FrameProfiler:
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        """
+        Args:
+            window (int): number of frames kept for each phase
+        """
+        self.window = window
+        self.enabled = False
+        self.histograms: dict[str, RollingHistogram] = {}
+        # time spent in each phase during the current frame
+        self.current: dict[str, float] = {}
+        self.frames = 0
+        self.last_frame_end = None
+        # phases are reused, so timing a phase does not create any objects
+        self._phases: dict[str, Phase] = {}
+        self._disabled = nullcontext()
+
+    def enable(self, window: int | None = None) -> None:
+        """
+        Starts recording, keeping what was recorded before
+
+        Args:
+            window (int | None): number of frames kept for each phase, None keeps the current window
+        """
+        if window is not None and window != self.window:
+            self.window = window
+            self.histograms = {name: RollingHistogram(window) for name in self.histograms}
+        self.enabled = True
+        self.last_frame_end = None
+
+    def disable(self) -> None:
+        self.enabled = False
+        self.current.clear()
+
+    def phase(self, name: str):
+        """
+        Args:
+            name (str): name of the phase
+        Returns:
+            a context manager that adds the time spent in it to the phase, which does nothing while disabled.
+                A phase may be nested in itself, only its outermost entry is timed.
+        """
+        if not self.enabled:
+            return self._disabled
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = Phase(self, name)
+        return phase
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Adds time spent in a phase during the current frame
+
+        Args:
+            name (str): name of the phase
+            seconds (float): time spent in it
+        """
+        if self.enabled:
+            self.current[name] = self.current.get(name, 0.0) + seconds
+
+    def end_frame(self) -> None:
+        """
+        Records the time spent in each phase during the frame, and the time since the previous frame ended
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.last_frame_end is not None:
+            self.current["frame"] = now - self.last_frame_end
+        self.last_frame_end = now
+        for name, seconds in self.current.items():
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = RollingHistogram(self.window)
+            histogram.add(seconds)
+        self.current.clear()
+        self.frames += 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Returns:
+            dict[str, dict[str, float]]: the summary of each phase, see RollingHistogram.summary
+        """
+        return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+    def save(self, path: str) -> None:
+        """
+        Writes the summary and histogram of each phase to a JSON file
+
+        Args:
+            path (str): path of the file
+        """
+        document = {
+            "frames": self.frames,
+            "window": self.window,
+            "bucket_edges_ms": BUCKET_EDGES_MS,
+            "phases": {name: {**histogram.summary(), "buckets": histogram.buckets()}
+                       for name, histogram in self.histograms.items()}
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+
+    def reset(self) -> None:
+        self.histograms.clear()
+        self.current.clear()
+        self.frames = 0
+        self.last_frame_end = None
+
+
+@contextmanager
+def profiling(config):
+    """
+    Profiles the code run inside it as the profiler settings of a configuration ask, and writes the results
+    once it exits, including when the game quits
+
+    Args:
+        config (Config): the game configuration
+    """
+    if config.profiler_enabled:
+        frame_profiler.enable(config.profiler_window)
+    profile = None
+    if config.profiler_cprofile:
+        profile = cProfile.Profile()
+        profile.enable()
+    try:
+        yield frame_profiler
+    finally:
+        if profile is not None:
+            profile.disable()
+            profile.dump_stats(config.profiler_cprofile)
+            print(f"cProfile stats written to {config.profiler_cprofile}")
+        if config.profiler_json and frame_profiler.frames:
+            frame_profiler.save(config.profiler_json)
+            print(f"Frame timings written to {config.profiler_json}")
+
+
+# Shared instance timing the game loop
+frame_profiler = FrameProfiler()
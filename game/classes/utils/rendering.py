@@ -1,6 +1,5 @@
 # Packages
-import pygame
-from classes.utils.image_packager import resource_path
+from classes.utils.asset_cache import asset_cache
 
 def render_square_image(image: str, size: int):
     """
@@ -10,20 +9,20 @@ def render_square_image(image: str, size: int):
     :param size: The dimensions (px) for the image
     :return: The resized image
     """
-    # Loads the provided image file and stores it
-    loaded_image = pygame.image.load(resource_path(image))
+    # Gets the size of the provided image file, which the texture atlas knows without decoding it
+    width, height = asset_cache.get_size(image, alpha=False)
 
     # Defines the maximum size of the rendering (to prevent blurring the image)
-    max_resolution = max(loaded_image.get_size())
+    max_resolution = max(width, height)
 
     # Create a float scale to adjust the image size to the desired px (from size parameter)
     scale = size / max_resolution
 
     # Resize the image to the desired size (in px)
-    adjusted_resolution = (int(loaded_image.get_width() * scale), int(loaded_image.get_width() * scale))
+    adjusted_resolution = (int(width * scale), int(width * scale))
 
-    # Create a scaled version of the image using the previous calculation
-    transformed_image = pygame.transform.scale(loaded_image, adjusted_resolution)
+    # Get the scaled version of the image using the previous calculation
+    transformed_image = asset_cache.get_image(image, adjusted_resolution, alpha=False)
 
     # Returns the scaled image to be rendered
     return transformed_image
@@ -39,14 +38,11 @@ def render_image(image: str, width: int, height: int):
     :return: The resized image
     """
 
-    # Loads the provided image file and stores it
-    loaded_image = pygame.image.load(resource_path(image))
-
     # Resize the image to the desired size (in px)
     adjusted_resolution = (width, height)
 
-    # Create a scaled version of the image
-    transformed_image = pygame.transform.scale(loaded_image, adjusted_resolution)
+    # Get the scaled version of the image from the shared cache
+    transformed_image = asset_cache.get_image(image, adjusted_resolution, alpha=False)
 
     # Returns the scaled image to be rendered
     return transformed_image
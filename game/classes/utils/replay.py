@@ -0,0 +1,204 @@
+"""
+replay.py
+
+Records games as a compact event log and plays them back to any point.
+
+A replay is a JSON lines file. The first line holds the seed, the players and the board layout, and
+every following line is one event:
+    ["flip", turn, player, chit, from, to]   a chit was played, moving the token between track ordinals
+    ["pass", turn, player]                   a player ended their turn without playing a chit
+    ["snapshot", events, state]              the GameState after the first events events
+
+Snapshots are written at the start and every few events, so the replayer can jump to the nearest
+snapshot before a point and only play the few events after it, instead of the whole game.
+"""
+
+import json
+from bisect import bisect_right
+
+from classes.engine.GameEngine import GameEngine
+from classes.engine.GameState import GameState
+from config.config import Config
+
+REPLAY_VERSION = 1
+# Default number of events between snapshots
+DEFAULT_SNAPSHOT_EVERY = 25
+
+
+class ReplayError(Exception):
+    """
+    Raised when a replay cannot be read, or playing it back does not give the recorded moves
+    """
+
+
+class ReplayRecorder:
+    def __init__(self, path: str, engine: GameEngine, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY) -> None:
+        """
+        Starts a replay of a game from its current state. Set it as the engine's recorder to record the game.
+
+        Args:
+            path (str): file the replay is written to
+            engine (GameEngine): the game to record
+            snapshot_every (int): number of events between snapshots, 0 only snapshots the start
+        """
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self.events = 0
+        # line buffered, so every event is on disk as soon as it is written
+        self.file = open(path, "w", buffering=1, encoding="utf-8")
+        self.write({
+            "version": REPLAY_VERSION,
+            "seed": engine.seed,
+            "number_of_players": engine.number_of_players,
+            "players": engine.player_setup(),
+            **engine.layout()
+        })
+        self.write_snapshot(engine)
+
+    def chit_played(self, engine: GameEngine, turn: int, player: int, chit: int, start: int) -> None:
+        """
+        Called by the engine after a chit is played
+
+        Args:
+            engine (GameEngine): the game being recorded
+            turn (int): the turn the chit was played in
+            player (int): number of the player who played it
+            chit (int): index of the chit
+            start (int): track ordinal of the player's token before the chit was played
+        """
+        self.write(["flip", turn, player, chit, start, engine.players[player].token.position.ordinal])
+        self.event_written(engine)
+
+    def turn_passed(self, engine: GameEngine, turn: int, player: int) -> None:
+        """
+        Called by the engine after a player ends their turn without playing a chit
+
+        Args:
+            engine (GameEngine): the game being recorded
+            turn (int): the turn being ended
+            player (int): number of the player ending it
+        """
+        self.write(["pass", turn, player])
+        self.event_written(engine)
+
+    def event_written(self, engine: GameEngine) -> None:
+        self.events += 1
+        if engine.player_has_won():
+            # the last event of the game, keep its final state and let go of the file
+            self.write_snapshot(engine)
+            self.close()
+        elif self.snapshot_every and self.events % self.snapshot_every == 0:
+            self.write_snapshot(engine)
+
+    def write_snapshot(self, engine: GameEngine) -> None:
+        self.write(["snapshot", self.events, engine.snapshot().key()])
+
+    def write(self, entry) -> None:
+        if not self.file.closed:
+            self.file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class Replayer:
+    def __init__(self, path: str) -> None:
+        """
+        Reads a replay and builds its game at the start of the recording
+
+        Args:
+            path (str): the replay file
+        Raises:
+            ReplayError: if the file is not a replay
+        """
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+        try:
+            self.header = json.loads(lines[0])
+        except (IndexError, json.JSONDecodeError) as err:
+            raise ReplayError(f"{path} is not a replay") from err
+        if self.header.get("version") != REPLAY_VERSION:
+            raise ReplayError(f"unsupported replay version {self.header.get('version')}")
+
+        self.events = []
+        # (number of events, state) of each snapshot, in order
+        self.snapshots = []
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # the last event was cut off while it was being written
+                break
+            if entry[0] == "snapshot":
+                self.snapshots.append((entry[1], GameState.from_key(entry[2])))
+            else:
+                self.events.append(entry)
+        if not self.snapshots:
+            raise ReplayError(f"{path} has no starting snapshot")
+        self.snapshot_events = [snapshot[0] for snapshot in self.snapshots]
+
+        config = Config()
+        config.number_of_players = self.header["number_of_players"]
+        config.players = self.header["players"]
+        self.engine = GameEngine.from_layout(self.header, config, self.header["seed"])
+        # number of events played on the engine, None until the first seek
+        self.position = None
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def seek(self, event: int) -> GameEngine:
+        """
+        Puts the game into its state after a number of events
+
+        Args:
+            event (int): number of events to play, clamped to the recorded events
+        Returns:
+            GameEngine: the game, shared by every seek of this replayer
+        Raises:
+            ReplayError: if an event does not play back as it was recorded
+        """
+        event = max(0, min(event, len(self.events)))
+        snapshot = self.snapshots[max(0, bisect_right(self.snapshot_events, event) - 1)]
+        # carry on from the current state when it is closer than the snapshot
+        if self.position is None or not snapshot[0] <= self.position <= event:
+            self.engine.restore(snapshot[1])
+            self.position = snapshot[0]
+        while self.position < event:
+            self.play_event(self.events[self.position])
+            self.position += 1
+        return self.engine
+
+    def seek_turn(self, turn: int) -> GameEngine:
+        """
+        Puts the game into its state at the start of a turn, or at the end of the replay if it never got there
+
+        Args:
+            turn (int): the turn, counted from the start of the game
+        Returns:
+            GameEngine: the game
+        """
+        event = next((i for i, entry in enumerate(self.events) if entry[1] >= turn), len(self.events))
+        return self.seek(event)
+
+    def state_at(self, event: int) -> GameState:
+        """
+        Returns:
+            GameState: the state of the game after a number of events
+        """
+        return self.seek(event).snapshot()
+
+    def play_event(self, entry: list) -> None:
+        engine = self.engine
+        if entry[1] != engine.turn or entry[2] != engine.current_player.player_number:
+            raise ReplayError(f"event {self.position} is for player {entry[2]} in turn {entry[1]}, "
+                              f"but it is player {engine.current_player.player_number}'s turn {engine.turn}")
+        if entry[0] == "flip":
+            engine.play_chit(entry[3])
+            position = engine.players[entry[2]].token.position.ordinal
+            if position != entry[5]:
+                raise ReplayError(f"event {self.position} moved to {position} instead of {entry[5]}")
+        elif entry[0] == "pass":
+            engine.next_player()
+        else:
+            raise ReplayError(f"unknown event {entry[0]}")
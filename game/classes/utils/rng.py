@@ -0,0 +1,73 @@
+"""
+rng.py
+
+Seeded random number generators for games. Every game has a seed, and everything random in it
+(the board layout and CPU moves) is drawn from a random.Random built from that seed, never from the
+module-level random functions. A game can then be played again exactly from its seed, and games
+in different threads or processes never share a stream.
+"""
+
+import hashlib
+import os
+import random
+
+# seeds are kept to 63 bits, so they fit a signed 64 bit integer in binary saves
+SEED_BITS = 63
+
+
+def check_seed(seed: int) -> int:
+    """
+    Checks a seed chosen by the player, such as Config.seed, fits a save
+
+    Args:
+        seed (int): the seed
+    Returns:
+        int: the seed
+    Raises:
+        ValueError: if the seed is not a whole number from 0 to 2**63 - 1
+    """
+    if not isinstance(seed, int) or not 0 <= seed < 1 << SEED_BITS:
+        raise ValueError(f"seed must be a whole number from 0 to {(1 << SEED_BITS) - 1}, not {seed!r}")
+    return seed
+
+
+def new_seed() -> int:
+    """
+    Returns:
+        int: a new random seed, from the operating system's entropy source
+    """
+    return int.from_bytes(os.urandom(8), "little") >> (64 - SEED_BITS)
+
+
+def derive_seed(seed: int, *keys) -> int:
+    """
+    Derives an independent seed from a seed and some keys, such as a worker number or a turn
+
+    Args:
+        seed (int): the seed to derive from
+        keys: values identifying the derived stream
+    Returns:
+        int: the derived seed
+    """
+    digest = hashlib.sha256(repr((seed,) + keys).encode()).digest()
+    return int.from_bytes(digest[:8], "little") >> (64 - SEED_BITS)
+
+
+def game_rng(seed: int, *keys) -> random.Random:
+    """
+    Creates the random number generator of a game
+
+    Args:
+        seed (int): the game's seed
+        keys: values identifying a separate stream of the same game, none for the main stream
+    Returns:
+        random.Random: the generator
+    """
+    return random.Random(derive_seed(seed, *keys) if keys else seed)
+
+
+def reseed_process() -> None:
+    """Reseeds the module-level random functions in a new worker process, so forked processes do not
+    repeat each other's numbers
+    """
+    random.seed(new_seed() ^ os.getpid())
@@ -0,0 +1,173 @@
+"""
+save_codec.py
+
+Compact binary encoding of save documents, as an alternative to JSON.
+
+Animals, colours and chit types are stored as enum ordinals and numbers as fixed size integers, so a
+four player save takes around 100 bytes before compression. Files start with a magic number, a format
+version and flags, so a file of another version is refused rather than misread.
+"""
+
+import struct
+import zlib
+
+from classes.enum.Animal import Animal
+from classes.enum.Colour import Colour
+
+MAGIC = b"FDSV"
+VERSION = 1
+# header flags
+COMPRESSED = 1
+
+HEADER = struct.Struct("<4sBB")
+COUNT = struct.Struct("<B")
+CAVE = struct.Struct("<BBB")
+CHIT = struct.Struct("<BBb")
+PLAYER = struct.Struct("<BiB")
+POSITION = struct.Struct("<h")
+MEMORY_SCORE = struct.Struct("<HB")
+TURN = struct.Struct("<I")
+SEED = struct.Struct("<Bq")
+
+ANIMALS = list(Animal)
+COLOURS = list(Colour)
+CHIT_TYPES = ["standard", "reverse"]
+
+
+class SaveFormatError(ValueError):
+    pass
+
+
+def encode(save: dict, compress: bool = True) -> bytes:
+    """
+    Encodes a save document
+
+    Args:
+        save (dict): the save document, as built by GameEngine.save
+        compress (bool): whether to compress the encoded document with zlib
+    Returns:
+        bytes: the encoded save
+    """
+    body = bytearray()
+
+    volcano_cards = save["VolcanoCards"]
+    body += COUNT.pack(len(volcano_cards))
+    for volcano_card in volcano_cards:
+        body += COUNT.pack(len(volcano_card["tiles"]))
+        body += bytes(ANIMALS.index(Animal[tile]) for tile in volcano_card["tiles"])
+        cave = volcano_card.get("cave")
+        body += COUNT.pack(1 if cave else 0)
+        if cave:
+            body += CAVE.pack(COLOURS.index(Colour[cave["colour"]]), ANIMALS.index(Animal[cave["animal"]]),
+                              cave["position"])
+
+    chit_cards = save["ChitCards"]
+    body += COUNT.pack(len(chit_cards))
+    for chit_card in chit_cards:
+        body += CHIT.pack(CHIT_TYPES.index(chit_card["type"]), ANIMALS.index(Animal[chit_card["animal"]]),
+                          chit_card.get("distance", 0))
+
+    players = save["Players"]
+    body += COUNT.pack(len(players))
+    for player in players:
+        body += PLAYER.pack(player["player_num"], player["total_moves"], player["current_player"])
+        # -1 marks a position that was not saved
+        body += POSITION.pack(player["position"] if player.get("position") is not None else -1)
+
+    memory_score = save["MemoryScore"][0]
+    body += MEMORY_SCORE.pack(memory_score["score"], memory_score["player"])
+    body += TURN.pack(save.get("Autosave", [{"turn": 0}])[0]["turn"])
+    seed = save.get("Seed", [{"seed": None}])[0]["seed"]
+    body += SEED.pack(seed is not None, seed or 0)
+
+    flags = 0
+    if compress:
+        body = zlib.compress(body)
+        flags |= COMPRESSED
+    return HEADER.pack(MAGIC, VERSION, flags) + bytes(body)
+
+
+def decode(data: bytes) -> dict:
+    """
+    Decodes a save document
+
+    Args:
+        data (bytes): the encoded save
+    Returns:
+        dict: the save document, in the same structure as a JSON save
+    Throws:
+        SaveFormatError: if the data is not a save, or is from another version
+    """
+    if len(data) < HEADER.size:
+        raise SaveFormatError("Save file is too short")
+    magic, version, flags = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a binary save file")
+    if version != VERSION:
+        raise SaveFormatError(f"Save file version {version} is not supported version {VERSION}")
+
+    body = data[HEADER.size:]
+    if flags & COMPRESSED:
+        body = zlib.decompress(body)
+    reader = Reader(body)
+
+    volcano_cards = []
+    for i in range(reader.read(COUNT)[0]):
+        tile_count = reader.read(COUNT)[0]
+        volcano_card = {"tiles": [ANIMALS[ordinal].value for ordinal in reader.read_bytes(tile_count)]}
+        if reader.read(COUNT)[0]:
+            colour, animal, position = reader.read(CAVE)
+            volcano_card["cave"] = {"colour": COLOURS[colour].name, "animal": ANIMALS[animal].name,
+                                    "position": position}
+        volcano_cards.append(volcano_card)
+
+    chit_cards = []
+    for i in range(reader.read(COUNT)[0]):
+        chit_type, animal, distance = reader.read(CHIT)
+        chit_card = {"animal": ANIMALS[animal].value, "type": CHIT_TYPES[chit_type]}
+        if chit_card["type"] == "standard":
+            chit_card["distance"] = distance
+        chit_cards.append(chit_card)
+
+    players = []
+    for i in range(reader.read(COUNT)[0]):
+        player_num, total_moves, current_player = reader.read(PLAYER)
+        position = reader.read(POSITION)[0]
+        players.append({"player_num": player_num, "total_moves": total_moves, "current_player": bool(current_player),
+                        "position": position if position >= 0 else None})
+
+    score, player = reader.read(MEMORY_SCORE)
+    turn = reader.read(TURN)[0]
+    has_seed, seed = reader.read(SEED)
+    return {
+        "VolcanoCards": volcano_cards,
+        "ChitCards": chit_cards,
+        "Players": players,
+        "MemoryScore": [{"score": score, "player": player}],
+        "Autosave": [{"turn": turn}],
+        "Seed": [{"seed": seed if has_seed else None}]
+    }
+
+
+class Reader:
+    """
+    Reads fixed size fields from the start of a buffer onwards
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.offset = 0
+
+    def read(self, field: struct.Struct) -> tuple:
+        if self.offset + field.size > len(self.data):
+            raise SaveFormatError("Save file is truncated")
+        values = field.unpack_from(self.data, self.offset)
+        self.offset += field.size
+        return values
+
+    def read_bytes(self, count: int) -> bytes:
+        if self.offset + count > len(self.data):
+            raise SaveFormatError("Save file is truncated")
+        values = self.data[self.offset:self.offset + count]
+        self.offset += count
+        return values
@@ -0,0 +1,44 @@
+"""
+scheduler.py
+
+Paces the game loop. While something is animating or a timer is about to fire, frames are
+capped at the target FPS. Otherwise the loop sleeps in pygame.event.wait until input arrives
+or the next timer deadline, so an idle game uses next to no CPU.
+"""
+
+import pygame
+
+
+class FrameScheduler:
+    def __init__(self, target_fps: int, idle_wait_ms: int):
+        # 0 disables the frame cap
+        self.target_fps = target_fps
+        self.idle_wait_ms = idle_wait_ms
+        self.frame_ms = 1000 // target_fps if target_fps else 0
+        self.clock = pygame.time.Clock()
+        self.idle = False
+
+    def wait(self, time_until_update: int | None) -> list[pygame.event.Event]:
+        """
+        Waits until the next frame is due and returns the events received in the meantime
+
+        Args:
+            time_until_update (int | None): milliseconds until the game next needs to update without input,
+                0 if it is animating, or None if it only needs to update on input
+        Returns:
+            list[pygame.event.Event]: the pending events
+        """
+        if time_until_update is None or time_until_update > self.frame_ms:
+            self.idle = True
+            timeout = self.idle_wait_ms if time_until_update is None else min(time_until_update, self.idle_wait_ms)
+            # pygame treats a timeout of 0 as waiting forever
+            event = pygame.event.wait(max(1, timeout))
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            # restart the frame clock so the idle time is not counted against the next frame
+            self.clock.tick()
+            return events
+
+        self.idle = False
+        self.clock.tick(self.target_fps)
+        return pygame.event.get()
@@ -16,6 +16,15 @@ class Timer:
         self.active = False
         self.start_time = 0
 
+    def time_remaining(self) -> int | None:
+        """
+        Returns:
+            int | None: milliseconds until the timer fires, or None if it is not active
+        """
+        if not self.active:
+            return None
+        return max(0, self.duration - (pygame.time.get_ticks() - self.start_time))
+
     def update(self):
         current_time = pygame.time.get_ticks()
         if current_time - self.start_time >= self.duration:
@@ -17,6 +17,80 @@ class Config:
     window_full_screen = False
     load_save = False
 
+    # Asset cache settings
+    asset_cache_max_bytes = 64 * 1024 * 1024
+    preload_assets = True
+    # Texture atlas built by build_atlas.py, loaded instead of preloading every image, None disables it
+    texture_atlas = "imgs/atlas/atlas.png"
+
+    # Only redraw and push the parts of the display that changed each frame
+    dirty_rendering = True
+
+    # Frame pacing, a target FPS of 0 removes the cap
+    target_fps = 60
+    # Longest time the game loop sleeps waiting for input while nothing is animating
+    idle_wait_ms = 1000
+
+    # Frame profiler, see classes.utils.profiler: whether it records from the start, the number of frames
+    # it keeps, the key that toggles its overlay and starts recording, and files its frame timings and a
+    # cProfile dump of the whole game are written to when the game quits, None writes nothing
+    profiler_enabled = False
+    profiler_window = 600
+    profiler_overlay_key = "f3"
+    profiler_json = None
+    profiler_cprofile = None
+
+    # Turn timing, both can be 0 to play CPU turns at full speed
+    card_flip_delay_ms = 1500
+    cpu_think_delay_ms = 2000
+    # Choose CPU moves on a worker thread so the window keeps responding
+    cpu_worker_thread = True
+    # Whether CPU players take their turns, boards that only show states, like render.py's, turn this off
+    cpu_turns_enabled = True
+    # How CPU players choose chits, see classes.engine.policies, "memory" remembers chits revealed in earlier
+    # turns, "search" looks ahead with a tree search and "random" flips any face down chit
+    cpu_policy = "memory"
+    # Share of a revealed chit the memory and search policies still remember after each turn, from 0 to 1
+    cpu_memory_decay = 0.8
+    # Search policy: thinking time for each flip, worker processes searching alongside the CPU thread,
+    # exploration weight of the tree search, number of turns played to score a position and virtual visits
+    # valued by the memory policy that each new action starts with
+    search_budget_ms = 100
+    search_workers = 0
+    search_exploration = 0.2
+    search_rollout_turns = 1
+    search_prior_visits = 20
+    # Rollouts played for each flip instead of searching for search_budget_ms, 0 uses the time budget. A
+    # time budget plays more rollouts on a faster machine, so only a rollout count replays a game from its seed
+    search_rollouts = 0
+    # CPU difficulty levels offered on the setup screen, each sets the configuration values it lists
+    difficulty_levels = {
+        "Easy": {"cpu_policy": "random"},
+        "Normal": {"cpu_policy": "memory"},
+        "Hard": {"cpu_policy": "search", "search_budget_ms": 100, "search_workers": 0},
+        "Expert": {"cpu_policy": "search", "search_budget_ms": 400, "search_workers": 2}
+    }
+    cpu_difficulty = "Normal"
+    # Seed of the game's layout and CPU moves, None picks a new seed for every game.
+    # Set it to a seed printed at the start of a game, or recorded in a save, to play that game again.
+    seed = None
+
+    # Autosave in the background every few turns, 0 turns only saves when the save button is pressed.
+    # Autosaves have a file of their own, so a new game never overwrites the saved one, see file_io
+    autosave_every_turns = 1
+    # Number of autosaves appended to the autosave journal before it is compacted into a full save
+    journal_compact_every = 20
+    # How long the "Game saved!" message stays on screen
+    save_message_ms = 2000
+    # Format of full saves, "json" or "binary", and whether binary saves are compressed
+    save_format = "json"
+    compress_saves = True
+    # Record every game to a replay file in the replays directory, with a snapshot every few events.
+    # Only the newest few replays are kept, older ones are deleted when a new game starts recording
+    record_replays = False
+    replay_snapshot_every = 25
+    replays_kept = 20
+
     # System Constants
     BASE_NUMBER_TILES = number_of_players
     BASE_NUMBER_POSITIONS = 6
@@ -101,13 +175,21 @@ class Config:
         pass
     
     def set_players(self, num_human_players: int):
+        # build new lists, so the class defaults are not changed and the players can be set again
+        players = []
         for i in self.players:
             if num_human_players:
-                i.append(1)
+                players.append(i[:2] + [1])
                 num_human_players -= 1
             else:
-                i.append(0)
+                players.append(i[:2] + [0])
+        self.players = players
                 
+    def set_difficulty(self, difficulty: str):
+        self.cpu_difficulty = difficulty
+        for key, value in self.difficulty_levels[difficulty].items():
+            setattr(self, key, value)
+
     def get_players(self):
         return self.players
 
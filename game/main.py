@@ -1,10 +1,13 @@
 from sys import exit
-from time import sleep
 
 import pygame
 
 from classes.concrete.board.Board import Board
+from classes.concrete.rendering.ProfilerOverlay import ProfilerOverlay
+from classes.utils.asset_cache import asset_cache
 from classes.utils.image_packager import resource_path
+from classes.utils.profiler import frame_profiler, profiling
+from classes.utils.scheduler import FrameScheduler
 from config.config import Config
 from classes.concrete.rendering.DisplayManager import DisplayManager
 
@@ -13,7 +16,12 @@ pygame.init()
 def setup():
     config = Config()
     display = DisplayManager(config.window_width_px, config.window_height_px, config)
-    clock = pygame.time.Clock()
+    # images can only be converted once the display exists
+    asset_cache.resize(config.asset_cache_max_bytes)
+    # the atlas has every board image at the size it is drawn, in a single file
+    loaded = asset_cache.load_atlas(config.texture_atlas) if config.texture_atlas else 0
+    if not loaded and config.preload_assets:
+        asset_cache.warm_up()
     config.set_players(display.draw_setup())
     board = Board(display.screen_size[0], display.screen_size[1], config)
     return display, config, board
@@ -21,32 +29,49 @@ def setup():
 def main():
     # game loop
     display, config, board = setup()
+    scheduler = FrameScheduler(config.target_fps, config.idle_wait_ms)
+    # timings of each phase of recent frames, toggled with a key
+    overlay = ProfilerOverlay(frame_profiler, pygame.font.Font(None, 22), (display.screen_size[0] - 10, 90))
+    overlay_key = pygame.key.key_code(config.profiler_overlay_key)
+    # mouse movement is never handled, so it should not wake the loop
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
     while True:
-        for event in pygame.event.get():
-            # quit the game if user exits the window
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                board.handle_click(mouse_pos)
-            # elif event.type == pygame.MOUSEBUTTONDOWN:
-            #     winning_player = 'red'
-            #     display.draw_win(winning_player)
-            #     setup()
-        board.draw(display.get_screen())
-        pygame.display.update()
-        
-        if not board.current_player.human and not board.card_flip_timer.active:
-            board.draw(display.get_screen())
-            pygame.display.update()
-            sleep(2)
-            board.handle_non_human_turn()
-            
+        with frame_profiler.phase("wait"):
+            events = scheduler.wait(board.time_until_update())
+        with frame_profiler.phase("events"):
+            for event in events:
+                # quit the game if user exits the window
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    exit()
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    board.handle_click(mouse_pos)
+                elif event.type == pygame.KEYDOWN and event.key == overlay_key:
+                    overlay.toggle()
+                    # the overlay is drawn over the board, which has to be drawn again to remove it
+                    board.repaint()
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                    # the window contents may have been lost, so only redrawing dirty areas is not enough
+                    board.repaint()
+                # elif event.type == pygame.MOUSEBUTTONDOWN:
+                #     winning_player = 'red'
+                #     display.draw_win(winning_player)
+                #     setup()
+        with frame_profiler.phase("board"):
+            rects = board.draw(display.get_screen())
+        with frame_profiler.phase("overlay"):
+            rects.extend(overlay.draw(display.get_screen()))
+        with frame_profiler.phase("display update"):
+            display.update_rects(rects)
+        frame_profiler.end_frame()
+
         if board.player_has_won():
             winner = board.get_winner()
             display.draw_win(winner)
             main()
             
 if __name__ == "__main__":
-    main()  
+    # frame timings and the cProfile dump, if enabled in the config, are written when the game quits
+    with profiling(Config()):
+        main()
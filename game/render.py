@@ -0,0 +1,259 @@
+"""
+render.py
+
+Renders board states to image files without opening a window, for dashboards and QA. Save files are
+rendered as they were saved, and replays at every few events or at the start of every turn. States are
+spread over a process pool. Each worker loads the texture atlas once and keeps a board for the source
+it is rendering, which it puts into each state and draws with Board.draw onto an off-screen surface.
+
+Run from the game directory:
+    python render.py save.json --output renders
+    python render.py replays/*.jsonl --every 10 --output renders
+    python render.py replays/1234-0.jsonl --turns --format raw --output renders
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# SDL would turn the signal that stops pool workers into a quit event, and the pool would wait for them forever
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+
+import pygame
+
+from classes.concrete.board.Board import Board
+from classes.utils import save_codec
+from classes.utils.asset_cache import asset_cache
+from classes.utils.replay import Replayer, ReplayError
+from config.config import Config
+
+# Image formats written, raw files hold the RGB bytes of the board, row by row
+FORMATS = {"png": ".png", "raw": ".rgb"}
+
+# Set up once in each worker process by init_worker
+worker_format = "png"
+worker_output = "."
+worker_surface = None
+# The source the worker rendered last, which its next job is usually from
+worker_source = None
+worker_board = None
+worker_replayer = None
+
+
+def read_save(path: str) -> dict:
+    """
+    Reads a save file of either save format
+
+    Args:
+        path (str): the save file
+    Returns:
+        dict: the save document
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(save_codec.MAGIC):
+        return save_codec.decode(data)
+    return json.loads(data)
+
+
+def render_config(seed: int | None, players: list[list]) -> Config:
+    """
+    Sets a configuration up for a board that only shows states
+
+    Args:
+        seed (int | None): the seed of the game, so the board is built with its layout
+        players (list[list]): the number, colour and whether each player is human, as in Config.players
+    Returns:
+        Config: the configuration
+    """
+    config = Config()
+    config.number_of_players = len(players)
+    config.players = players
+    config.seed = seed
+    config.set_load_save(False)
+    config.autosave_every_turns = 0
+    config.record_replays = False
+    # CPU players never take their turn while a state is on the board
+    config.cpu_turns_enabled = False
+    return config
+
+
+def init_worker(output: str, image_format: str, atlas: str | None) -> None:
+    global worker_output, worker_format, worker_surface
+    pygame.init()
+    # images can only be converted once a display exists, the dummy driver never shows it
+    pygame.display.set_mode((1, 1))
+    if not (atlas and asset_cache.load_atlas(atlas)):
+        asset_cache.warm_up()
+    worker_output = output
+    worker_format = image_format
+    worker_surface = pygame.Surface((Config.window_width_px, Config.window_height_px))
+
+
+def open_source(path: str) -> None:
+    """
+    Builds the board for a save or replay, unless the worker's board is already for it
+
+    Args:
+        path (str): the save or replay file
+    """
+    global worker_source, worker_board, worker_replayer
+    if path == worker_source:
+        return
+    if path.endswith(".jsonl"):
+        worker_replayer = Replayer(path)
+        save = worker_replayer.seek(0).save()
+        players = worker_replayer.header["players"]
+    else:
+        worker_replayer = None
+        save = read_save(path)
+        # saves do not record which seats were CPU players, so every seat is shown as human
+        players = [player[:2] + [1] for player in Config.players[:len(save["Players"])]]
+    seed = save["Seed"][0]["seed"] if save.get("Seed") else None
+    worker_board = Board(Config.window_width_px, Config.window_height_px, render_config(seed, players))
+    worker_board.load_save(save)
+    worker_source = path
+
+
+def write_image(name: str) -> str:
+    """
+    Draws the worker's board and writes it to the output directory
+
+    Args:
+        name (str): the file name, without an extension
+    Returns:
+        str: path of the written file
+    """
+    worker_board.repaint()
+    worker_board.draw(worker_surface)
+    path = os.path.join(worker_output, name + FORMATS[worker_format])
+    if worker_format == "raw":
+        with open(path, "wb") as f:
+            f.write(pygame.image.tobytes(worker_surface, "RGB"))
+    else:
+        pygame.image.save(worker_surface, path)
+    return path
+
+
+def render_job(job: tuple[str, list[int] | None]) -> list[dict[str, any]]:
+    """
+    Renders one save, or a run of events of one replay
+
+    Args:
+        job (tuple[str, list[int] | None]): the source file, and the events to render for a replay
+    Returns:
+        list[dict[str, any]]: an entry for the index of rendered images for each state
+    """
+    path, events = job
+    name = os.path.basename(path)
+    entries = []
+    # the board prints its seed and the engine prints every invalid move, which are part of the states
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        open_source(path)
+        for event in events if events is not None else [None]:
+            # saves keep their whole file name, so save.json and save.bin do not overwrite each other
+            image_name = name
+            if event is not None:
+                worker_board.engine.restore(worker_replayer.state_at(event))
+                image_name = f"{os.path.splitext(name)[0]}-{event:05d}"
+            entries.append({
+                "source": path,
+                "event": event,
+                "turn": worker_board.engine.turn,
+                "path": write_image(image_name),
+                "width": worker_surface.get_width(),
+                "height": worker_surface.get_height()
+            })
+    return entries
+
+
+def replay_events(replayer: Replayer, every: int, turns: bool) -> list[int]:
+    """
+    Args:
+        replayer (Replayer): the replay
+        every (int): render every this many events
+        turns (bool): render the start of every turn instead
+    Returns:
+        list[int]: the events to render, always ending with the end of the replay
+    """
+    if turns:
+        events = [i for i, entry in enumerate(replayer.events) if i == 0 or entry[1] != replayer.events[i - 1][1]]
+    else:
+        events = list(range(0, len(replayer), every))
+    if not events or events[-1] != len(replayer):
+        events.append(len(replayer))
+    return events
+
+
+def plan_jobs(paths: list[str], every: int, turns: bool, chunk: int) -> list[tuple[str, list[int] | None]]:
+    """
+    Splits the sources into jobs, with the events of each replay in runs of chunk events
+
+    Returns:
+        list[tuple[str, list[int] | None]]: the source and events of each job
+    """
+    jobs = []
+    for path in paths:
+        if not path.endswith(".jsonl"):
+            jobs.append((path, None))
+            continue
+        events = replay_events(Replayer(path), every, turns)
+        for start in range(0, len(events), chunk):
+            jobs.append((path, events[start:start + chunk]))
+    return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render board states of saves and replays to image files")
+    parser.add_argument("sources", nargs="+", help="save files, and replays ending in .jsonl")
+    parser.add_argument("--output", default="renders", help="directory the images and their index are written to")
+    parser.add_argument("--format", default="png", choices=list(FORMATS), help="image format")
+    states = parser.add_mutually_exclusive_group()
+    states.add_argument("--every", type=int, default=1, help="render every this many events of a replay")
+    states.add_argument("--turns", action="store_true", help="render the start of every turn of a replay")
+    parser.add_argument("--chunk", type=int, default=50, help="states of a replay rendered by a worker at a time")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes, 1 renders every state in this process")
+    args = parser.parse_args()
+
+    try:
+        jobs = plan_jobs(args.sources, max(1, args.every), args.turns, max(1, args.chunk))
+    except (OSError, ReplayError) as err:
+        print(f"could not read a source: {err}")
+        sys.exit(1)
+    os.makedirs(args.output, exist_ok=True)
+    init_args = (args.output, args.format, Config.texture_atlas)
+
+    images = 0
+    start = time.perf_counter()
+    # the index lists every image with the state it shows, in the order of the sources
+    with open(os.path.join(args.output, "index.jsonl"), "w", encoding="utf-8") as index:
+        try:
+            if args.workers <= 1:
+                init_worker(*init_args)
+                results = map(render_job, jobs)
+                for entries in results:
+                    for entry in entries:
+                        index.write(json.dumps(entry) + "\n")
+                    images += len(entries)
+            else:
+                with multiprocessing.Pool(args.workers, init_worker, init_args) as pool:
+                    for entries in pool.imap(render_job, jobs):
+                        for entry in entries:
+                            index.write(json.dumps(entry) + "\n")
+                        images += len(entries)
+        except (OSError, KeyError, ValueError, ReplayError) as err:
+            print(f"could not render: {err}")
+            sys.exit(1)
+    elapsed = time.perf_counter() - start
+    print(f"{images} images in {elapsed:.2f}s ({images / elapsed:.0f} images/s), written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
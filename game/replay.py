@@ -0,0 +1,70 @@
+"""
+replay.py
+
+Plays a recorded game back to a turn or event and prints the state of the game there, to debug a
+game or check a replay used as training data.
+
+Run from the game directory:
+    python replay.py replays/1234-0.jsonl --turn 40
+    python replay.py replays/1234-0.jsonl --event 120
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+from classes.utils.replay import Replayer, ReplayError
+
+
+def describe(replayer: Replayer) -> list[str]:
+    """
+    Returns:
+        list[str]: lines describing the replayer's game in its current state
+    """
+    engine = replayer.engine
+    lines = [f"event {replayer.position}/{len(replayer)}, turn {engine.turn}, "
+             f"player {engine.current_player.player_number} to play"]
+    for number, player in sorted(engine.players.items()):
+        position = player.token.position
+        lines.append(f"player {number} ({player.colour}): {position.animal.name} at {position.ordinal}, "
+                     f"{player.token.total_moves} moves")
+    lines.append(f"face up chits: {[i for i, chit in enumerate(engine.chits) if chit.flipped]}")
+    lines.append(f"memory score: {engine.max_score[0]} by player {engine.max_score[1].player_number}")
+    winner = engine.get_winner()
+    if winner:
+        lines.append(f"player {winner} has won")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play a recorded game back to a turn or event")
+    parser.add_argument("replay", help="replay file")
+    point = parser.add_mutually_exclusive_group()
+    point.add_argument("--turn", type=int, help="turn to show the start of")
+    point.add_argument("--event", type=int, help="number of events to play, defaults to the whole replay")
+    args = parser.parse_args()
+
+    try:
+        replayer = Replayer(args.replay)
+        print(f"seed {replayer.header['seed']}, {len(replayer)} events, {len(replayer.snapshots)} snapshots")
+        start = time.perf_counter()
+        # the engine prints a message for every invalid move, which are part of the game being replayed
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            if args.turn is not None:
+                replayer.seek_turn(args.turn)
+            else:
+                replayer.seek(len(replayer) if args.event is None else args.event)
+        elapsed = time.perf_counter() - start
+    except (OSError, ReplayError) as err:
+        print(f"could not replay {args.replay}: {err}")
+        sys.exit(1)
+
+    for line in describe(replayer):
+        print(line)
+    print(f"seeked in {elapsed * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
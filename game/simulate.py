@@ -0,0 +1,143 @@
+"""
+simulate.py
+
+Plays many all-CPU games headless across a process pool and streams one result per game to a CSV or
+JSONL file, then prints win rates by seat and colour, game length and how often special cards helped
+decide the game.
+
+Run from the game directory:
+    python simulate.py --games 10000 --output results.csv
+    python simulate.py --games 100 --replays replays
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import time
+
+from classes.engine.policies import create_policy, policy_names
+from classes.engine.simulation import RESULT_FIELDS, SimulationSummary, play_quietly, simulation_config
+from classes.utils.rng import reseed_process
+from config.config import Config
+
+# Set up once in each worker process by init_worker
+worker_config = None
+worker_policy = None
+worker_max_flips = 0
+worker_replays = None
+
+
+def init_worker(number_of_players: int, policy_name: str, max_flips: int, replays: str | None = None,
+                memory_decay: float | None = None, search_budget_ms: int | None = None,
+                search_rollouts: int | None = None) -> None:
+    global worker_config, worker_policy, worker_max_flips, worker_replays
+    # games draw from their own seeded generators, this only keeps forked workers from sharing a stream
+    reseed_process()
+    worker_config = simulation_config(Config(), number_of_players)
+    if memory_decay is not None:
+        worker_config.cpu_memory_decay = memory_decay
+    if search_budget_ms is not None:
+        worker_config.search_budget_ms = search_budget_ms
+    if search_rollouts is not None:
+        worker_config.search_rollouts = search_rollouts
+    # games are already spread over processes, so searches stay on the process playing the game
+    worker_config.search_workers = 0
+    worker_policy = create_policy(policy_name, worker_config)
+    worker_max_flips = max_flips
+    worker_replays = replays
+
+
+def run_game(seed: int) -> dict[str, any]:
+    replay = os.path.join(worker_replays, f"{seed}.jsonl") if worker_replays else None
+    return play_quietly(worker_config, worker_policy, seed, worker_max_flips, replay)
+
+
+class ResultWriter:
+    """
+    Writes game results to a CSV or JSONL file as they arrive
+    """
+
+    def __init__(self, path: str | None, output_format: str) -> None:
+        self.file = open(path, "w", newline="", encoding="utf-8") if path else None
+        self.format = output_format
+        self.csv_writer = None
+        if self.file and self.format == "csv":
+            self.csv_writer = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            self.csv_writer.writeheader()
+
+    def write(self, result: dict[str, any]) -> None:
+        if not self.file:
+            return
+        if self.csv_writer:
+            self.csv_writer.writerow(result)
+        else:
+            self.file.write(json.dumps(result) + "\n")
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+
+
+def output_format(path: str | None, requested: str | None) -> str:
+    if requested:
+        return requested
+    if path and path.endswith((".jsonl", ".json")):
+        return "jsonl"
+    return "csv"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play all-CPU games headless and report balance statistics")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, game i uses seed + i")
+    parser.add_argument("--players", type=int, default=4, choices=[2, 3, 4], help="number of seats")
+    parser.add_argument("--policy", default="random", choices=policy_names(), help="policy used by every seat")
+    parser.add_argument("--max-flips", type=int, default=2000, help="flips before a game is stopped unfinished")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes, 1 plays every game in this process")
+    parser.add_argument("--output", help="file to stream per-game results to")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="output format, defaults to the file extension")
+    parser.add_argument("--replays", help="directory to record a replay of every game to, named by seed")
+    parser.add_argument("--memory-decay", type=float, help="memory decay of the memory policy, from 0 to 1")
+    parser.add_argument("--search-budget-ms", type=int, help="thinking time of the search policy for each flip")
+    parser.add_argument("--search-rollouts", type=int,
+                        help="rollouts of the search policy for each flip instead of a time budget, so games replay "
+                             "from their seed")
+    args = parser.parse_args()
+
+    writer = ResultWriter(args.output, output_format(args.output, args.format))
+    summary = SimulationSummary()
+    seeds = range(args.seed, args.seed + args.games)
+    init_args = (args.players, args.policy, args.max_flips, args.replays, args.memory_decay, args.search_budget_ms,
+                 args.search_rollouts)
+    if args.replays:
+        os.makedirs(args.replays, exist_ok=True)
+
+    start = time.perf_counter()
+    try:
+        if args.workers <= 1:
+            init_worker(*init_args)
+            results = map(run_game, seeds)
+            for result in results:
+                writer.write(result)
+                summary.add(result)
+        else:
+            chunk_size = max(1, args.games // (args.workers * 16))
+            with multiprocessing.Pool(args.workers, init_worker, init_args) as pool:
+                # results come back in seed order, so output files are the same for any number of workers
+                for result in pool.imap(run_game, seeds, chunk_size):
+                    writer.write(result)
+                    summary.add(result)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+
+    for line in summary.report():
+        print(line)
+    print(f"{summary.games} games in {elapsed:.2f}s ({summary.games / elapsed:.0f} games/s)")
+
+
+if __name__ == "__main__":
+    main()